@@ -0,0 +1,77 @@
+"""
+End-to-end benchmarks for the `get_xfl_*()` functions, using responses recorded from the XFL API.
+
+With `--record`, every function is called once against the XFL API, and every response is saved to the fixture directory with `XFLRecordingAdapter`.
+This needs a valid XFL API token in the `XFL_API_TOKEN` environment variable. API tokens are never saved to a fixture.
+
+Without `--record`, every function is timed against the recorded responses with `XFLReplayAdapter`, without using the network,
+so the results only change when the code does. `--latency` adds a simulated round trip to every request.
+
+Usage (from the root of this repository, with `xfl_fast_r` installed or on `PYTHONPATH`):
+    XFL_API_TOKEN=... python benchmarks/bench_fetch.py --fixtures fixtures --record [--game-id FOOTBALL_XFL_2023_2_18_VGS@ARL]
+    python benchmarks/bench_fetch.py --fixtures fixtures [--game-id FOOTBALL_XFL_2023_2_18_VGS@ARL] [--latency 0.05] [--repeat 5]
+"""
+import argparse
+import os
+
+from bench_parse import GAME_ID, best_of
+from xfl_fast_r.client import XFLClient
+from xfl_fast_r.get_xfl import get_xfl_game_participation, get_xfl_pbp, get_xfl_player_box, get_xfl_rosters, get_xfl_schedule, \
+    get_xfl_standings, get_xfl_team_box, get_xfl_transactions
+from xfl_fast_r.transport import XFLRecordingAdapter, XFLReplayAdapter
+
+def get_cases(xfl_api_token:str,game_ids:list):
+    """
+    Returns a list of `(name, function)` tuples, one per `get_xfl_*()` call that is benchmarked.
+    Every function takes the `XFLClient` it should use.
+    """
+    cases = [
+        ('get_xfl_rosters',lambda client: get_xfl_rosters(xfl_api_token,client=client)),
+        ('get_xfl_schedule',lambda client: get_xfl_schedule(xfl_api_token,client=client)),
+        ('get_xfl_standings',lambda client: get_xfl_standings(xfl_api_token,client=client)),
+        ('get_xfl_transactions',lambda client: get_xfl_transactions(client=client)),
+    ]
+    for game_id in game_ids:
+        cases += [
+            (f'get_xfl_game_participation ({game_id})',lambda client,game_id=game_id: get_xfl_game_participation(xfl_api_token,game_id,client=client)),
+            (f'get_xfl_player_box ({game_id})',lambda client,game_id=game_id: get_xfl_player_box(xfl_api_token,game_id,client=client)),
+            (f'get_xfl_team_box ({game_id})',lambda client,game_id=game_id: get_xfl_team_box(xfl_api_token,game_id,client=client)),
+            (f'get_xfl_pbp ({game_id})',lambda client,game_id=game_id: get_xfl_pbp(xfl_api_token,game_id,client=client)),
+        ]
+    return cases
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures',required=True,help='The directory responses are recorded to, and replayed from.')
+    parser.add_argument('--game-id',action='append',default=None,help=f'A game to benchmark. Can be used more than once. Defaults to {GAME_ID}.')
+    parser.add_argument('--record',action='store_true',help='Record new responses from the XFL API, instead of replaying them.')
+    parser.add_argument('--latency',type=float,default=None,help='The simulated latency (in seconds) of every replayed request.')
+    parser.add_argument('--repeat',type=int,default=5)
+    args = parser.parse_args()
+
+    game_ids = args.game_id if args.game_id != None else [GAME_ID]
+
+    if args.record:
+        xfl_api_token = os.environ.get('XFL_API_TOKEN')
+        if xfl_api_token == None:
+            parser.error('`--record` needs a valid XFL API token in the `XFL_API_TOKEN` environment variable.')
+
+        with XFLClient(memory_cache=False,transport=XFLRecordingAdapter(args.fixtures)) as client:
+            for name,func in get_cases(xfl_api_token,game_ids):
+                func(client)
+                print(f'Recorded {name}')
+        return
+
+    ## API tokens are never recorded, so any token matches the recorded responses.
+    transport = XFLReplayAdapter(args.fixtures,latency=args.latency)
+
+    print(f"{'function':<72}{'time (s)':>10}")
+    with XFLClient(memory_cache=False,circuit_breaker=False,transport=transport) as client:
+        for name,func in get_cases('replay',game_ids):
+            try:
+                print(f"{name:<72}{best_of(lambda: func(client),args.repeat):>10.4f}")
+            except FileNotFoundError:
+                print(f"{name:<72}{'not recorded':>14}")
+
+if __name__ == "__main__":
+    main()
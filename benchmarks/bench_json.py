@@ -0,0 +1,76 @@
+"""
+Benchmarks for the JSON backends in `xfl_fast_r.utils`.
+
+Times decoding the `playerstats` and `markeractivity` payloads with every JSON backend that is installed,
+and how much of the time it takes to decode and parse a payload is spent decoding it.
+A `playerstats` payload is parsed with the field extractor `get_xfl_player_box()` uses, without joining it to participation data.
+
+By default, synthetic payloads from `bench_parse.py` are used.
+Payloads recorded from the XFL scoring API can be used instead with `--playerstats` and `--markeractivity`.
+
+Usage (from the root of this repository, with `xfl_fast_r` installed or on `PYTHONPATH`):
+    python benchmarks/bench_json.py [--plays 400] [--game-players 60] [--repeat 20] [--playerstats playerstats.json] [--markeractivity markeractivity.json]
+"""
+import argparse
+import json
+
+from bench_parse import GAME_ID, best_of, make_markeractivity_payload, make_playerstats_payload
+from xfl_fast_r.get_xfl import _parse_xfl_pbp, _PLAYER_BOX_EXTRACTOR
+from xfl_fast_r.utils import json_loads, orjson, set_json_backend
+
+###################################################################################################################################################################################################################
+##
+##      Payloads
+##
+###################################################################################################################################################################################################################
+
+def load_payload(path:str,make_payload):
+    """
+    Returns the raw bytes of a recorded payload, or of a synthetic payload from ```make_payload()``` if ```path = None```.
+    """
+    if path != None:
+        with open(path,'rb') as f:
+            return f.read()
+    return json.dumps(make_payload()).encode('utf-8')
+
+###################################################################################################################################################################################################################
+##
+##      Benchmarks
+##
+###################################################################################################################################################################################################################
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--plays',type=int,default=400)
+    parser.add_argument('--game-players',type=int,default=60)
+    parser.add_argument('--repeat',type=int,default=20)
+    parser.add_argument('--playerstats',default=None,help='A recorded `playerstats` payload.')
+    parser.add_argument('--markeractivity',default=None,help='A recorded `markeractivity` payload.')
+    args = parser.parse_args()
+
+    backends = ['json'] if orjson == None else ['json','orjson']
+    if orjson == None:
+        print('`orjson` is not installed, so only the `json` backend is timed. Install it with `pip install orjson`.\n')
+
+    cases = [
+        ('playerstats',load_payload(args.playerstats,lambda: make_playerstats_payload(args.game_players)),_PLAYER_BOX_EXTRACTOR.to_frame),
+        ('markeractivity',load_payload(args.markeractivity,lambda: make_markeractivity_payload(args.plays)),lambda json_data: _parse_xfl_pbp(json_data,GAME_ID)),
+    ]
+
+    print(f"{'payload':<18}{'size (KB)':>11}{'backend':>10}{'decode (ms)':>14}{'decode + parse (ms)':>22}{'decode share':>15}")
+    for name,body,parse in cases:
+        decode_times = {}
+        for backend in backends:
+            set_json_backend(backend)
+            decode_time = best_of(lambda: json_loads(body),args.repeat)
+            total_time = best_of(lambda: parse(json_loads(body)),max(1,args.repeat // 4))
+            decode_times[backend] = decode_time
+            print(f"{name:<18}{len(body) / 1024:>11.1f}{backend:>10}{decode_time * 1000:>14.3f}{total_time * 1000:>22.3f}{decode_time / total_time:>14.1%}")
+
+        if len(decode_times) > 1:
+            print(f"{'':<18}{'':>11}{'speedup':>10}{decode_times['json'] / decode_times['orjson']:>13.1f}x")
+
+    set_json_backend('auto')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmarks for the parse layer of `xfl_fast_r.get_xfl`.
+
+Times the `_parse_xfl_*()` functions against synthetic payloads that are shaped like the XFL scoring API's responses,
+and compares building the result with one `pd.DataFrame()` call against the old pattern of concatenating a one-row DataFrame per record.
+
+Usage (from the root of this repository, with `xfl_fast_r` installed or on `PYTHONPATH`):
+    python benchmarks/bench_parse.py [--plays 400] [--players 600] [--repeat 5]
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from xfl_fast_r.get_xfl import _parse_xfl_pbp, _parse_xfl_rosters, _PLAYER_BOX_EXTRACTOR
+from xfl_fast_r.schemas import PLAYER_BOX_FIELDS
+
+GAME_ID = "FOOTBALL_XFL_2023_2_18_VGS@ARL"
+
+###################################################################################################################################################################################################################
+##
+##      Synthetic Payloads
+##
+###################################################################################################################################################################################################################
+
+def make_markeractivity_payload(n_plays=400,seed=0):
+    """
+    Returns a list of `n_plays` plays shaped like the `markeractivity` endpoint.
+    """
+    r = random.Random(seed)
+    property_makers = [
+        lambda: {'FootballStatus':r.choice(['1st & 10','2nd & 6','3rd & 2'])},
+        lambda: {'FootballPlayResult':r.choice(['Complete','Incomplete','Rush'])},
+        lambda: {'FootballYards':r.randint(-5,40)},
+        lambda: {'FootballZone':r.randint(1,5)},
+        lambda: {'FootballPenalty':{'TeamId':'VGS','PlayerId':1010,'Yards':10,'PenaltyResult':'Accepted','Description':'Holding'}},
+        lambda: {'FootballFumble':{'TeamFumbled':'ARL','PlayerFumbled':1001,'TeamRecovered':'VGS','PlayerRecovered':1030,'PlayerForcedFumble':1031}},
+        lambda: {'FootballSetBallOn':{'VisOrHome':'H','YardNum':r.randint(1,50)}},
+        lambda: {'FootballDriveSummary':{'DriveStart':{'VisOrHome':'V','YardNum':25},'Plays':8,'Yards':60,'TOP':'3:21','Result':'TD'}},
+    ]
+
+    plays = []
+    for i in range(n_plays):
+        context = {
+            'TimeRemSecTotal':3600 - i * 9,'TimeRemStr':'10:00','VisTimeouts':3,'HomeTimeouts':3,
+            'BallOn':{'VisOrHome':r.choice(['V','H']),'YardNum':r.randint(1,50)},'DriveNum':i // 8,'PossTeam':r.choice(['ARL','VGS']),
+            'LastPlaySummary':'','LastPlayStatus':'','Down':r.randint(1,4),'Distance':r.randint(1,10),'VisScore':r.randint(0,30)
+        }
+        properties = [{'FootballEventContext':context}] + [f() for f in r.sample(property_makers,r.randint(1,4))]
+        plays.append({
+            'MarkerId':100000 + i,'MarkerUTC':1676750000 + i * 30,'MarkerLTC':1676728400 + i * 30,
+            'MajorType':'Play','MinorType':r.choice(['Pass','Rush','Punt','Kickoff']),'Descriptor_':'','Comments':'','IsOfficial':True,
+            'ETime':{'Period':1 + i * 4 // n_plays,'ClockMinutes':r.randint(0,14),'ClockSeconds':r.randint(0,59)},
+            'SourceType':'','EventId':GAME_ID,'SituationCode':'','SourceId':i,'SourceNativeMarkerId':str(i),'OfficialCode':'',
+            'Properties':properties,
+            'Participants':[{'Role':r.choice(['Passer','Rusher','Receiver','Tackler']),'OfficialId':1000 + r.randint(0,99)} for _ in range(r.randint(0,3))]
+        })
+    return plays
+
+def make_players_payload(n_players=600,seed=1):
+    """
+    Returns a list of `n_players` players shaped like the league-wide `players` endpoint.
+    """
+    r = random.Random(seed)
+    string_keys = ['FirstName','LastName','LastNameSuffix','PositionLongName','NAbbrev','Height','DOB','POB','Hometown','Country','CountryCode',
+                   'Nickname','InjuryStatus','InjuryDesc','Headshot','Initials','Affiliate','CloudHeadshotURL','SquadId','College','LeagueStatus']
+    players = []
+    for i in range(n_players):
+        player = {k:f'{k}_{i}' for k in string_keys}
+        player.update({
+            'OfficialId':1000 + i,'JerseyNum':r.randint(0,99),'Position':r.choice(['QB','RB','WR','TE','OL','DL','LB','CB','S','K','P']),
+            'TeamId':r.choice(['ARL','DC','HOU','ORL','SA','SEA','STL','VGS'])
+        })
+        players.append(player)
+    return players
+
+def make_playerstats_payload(n_players=60,seed=2):
+    """
+    Returns a list of `n_players` players shaped like the `playerstats` endpoint.
+    Like the real endpoint, a player only has the stats they recorded in that game.
+    """
+    r = random.Random(seed)
+    players = []
+    for i in range(n_players):
+        player = {'OfficialId':1000 + i}
+        for f in PLAYER_BOX_FIELDS[1:]:
+            if r.random() < 0.7:
+                continue
+            player[f.source] = round(r.random() * 20,2) if f.dtype == 'float64' else r.randint(0,30)
+        players.append(player)
+    return players
+
+###################################################################################################################################################################################################################
+##
+##      Benchmarks
+##
+###################################################################################################################################################################################################################
+
+def concat_one_row_at_a_time(rows:list):
+    """
+    The pattern the parse layer used to use: a one-row DataFrame per record, concatenated onto the result.
+    """
+    main_df = pd.DataFrame()
+    for row in rows:
+        row_df = pd.DataFrame(row,index=[0])
+        main_df = pd.concat([main_df,row_df],ignore_index=True)
+    return main_df
+
+def try_except_per_field(records:list):
+    """
+    The pattern `get_xfl_player_box()` used to use: a `try`/`except KeyError` block per field per player.
+    """
+    rows = []
+    for record in records:
+        row = {}
+        for f in PLAYER_BOX_FIELDS:
+            try:
+                row[f.column] = record[f.source]
+            except:
+                row[f.column] = 0
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+def best_of(func,repeat:int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--plays',type=int,default=400)
+    parser.add_argument('--players',type=int,default=600)
+    parser.add_argument('--game-players',type=int,default=60)
+    parser.add_argument('--repeat',type=int,default=5)
+    args = parser.parse_args()
+
+    pbp_json = make_markeractivity_payload(args.plays)
+    players_json = make_players_payload(args.players)
+    playerstats_json = make_playerstats_payload(args.game_players)
+
+    ## The rows each parser builds, so the old concat pattern can be timed on identical data.
+    pbp_rows = _parse_xfl_pbp(pbp_json,GAME_ID).to_dict('records')
+    roster_rows = _parse_xfl_rosters(players_json).to_dict('records')
+
+    cases = [
+        (f'markeractivity ({args.plays} plays)',lambda: _parse_xfl_pbp(pbp_json,GAME_ID),lambda: concat_one_row_at_a_time(pbp_rows)),
+        (f'players ({args.players} players)',lambda: _parse_xfl_rosters(players_json),lambda: concat_one_row_at_a_time(roster_rows)),
+    ]
+
+    print(f"{'payload':<32}{'parser (s)':>12}{'per-row concat (s)':>22}{'speedup':>10}")
+    for name,new_func,old_func in cases:
+        new_time = best_of(new_func,args.repeat)
+        old_time = best_of(old_func,max(1,args.repeat // 2))
+        print(f"{name:<32}{new_time:>12.4f}{old_time:>22.4f}{old_time / new_time:>9.1f}x")
+
+    print()
+    print(f"{'payload':<32}{'extractor (s)':>14}{'try/except per field (s)':>28}{'speedup':>10}")
+    name = f'playerstats ({args.game_players} players)'
+    new_time = best_of(lambda: _PLAYER_BOX_EXTRACTOR.to_frame(playerstats_json),args.repeat * 10)
+    old_time = best_of(lambda: try_except_per_field(playerstats_json),args.repeat * 10)
+    print(f"{name:<32}{new_time:>14.5f}{old_time:>28.5f}{old_time / new_time:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
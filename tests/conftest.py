@@ -0,0 +1,52 @@
+import io
+
+import pytest
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from xfl_fast_r.client import XFLClient
+
+class ScriptedAdapter(HTTPAdapter):
+    """
+    A transport adapter that answers requests with a list of `(status_code, headers, body)` responses, in order, without using the network.
+    The last response is repeated once every other response has been used.
+    Every request it receives is kept in ```requests```.
+    """
+
+    def __init__(self,responses:list):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self,request,**kwargs):
+        self.requests.append(request)
+        status_code, headers, body = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(body,str):
+            body = body.encode('utf-8')
+
+        raw = HTTPResponse(body=io.BytesIO(body),headers=headers,status=status_code,preload_content=False,decode_content=False)
+        return self.build_response(request,raw)
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """
+    Records every `time.sleep()` made by `xfl_fast_r.client`, instead of sleeping.
+    """
+    sleeps = []
+    monkeypatch.setattr('xfl_fast_r.client.time.sleep',sleeps.append)
+    return sleeps
+
+@pytest.fixture
+def scripted_client():
+    """
+    Returns a function that creates an `XFLClient` (without a memory cache) that is answered by a `ScriptedAdapter`.
+    """
+    def make_client(responses:list,**kwargs):
+        kwargs.setdefault('memory_cache',False)
+        client = XFLClient(**kwargs)
+
+        adapter = ScriptedAdapter(responses)
+        client.session.mount('https://',adapter)
+        client.session.mount('http://',adapter)
+        return client
+    return make_client
@@ -0,0 +1,149 @@
+"""
+Small XFL scoring API payloads for tests.
+"""
+
+GAME_ID = "FOOTBALL_XFL_2023_2_18_VGS@ARL"
+
+def make_play(marker_id:int,marker_utc:int,is_official=True,minor_type='Pass',game_id=GAME_ID):
+    """
+    Returns one play, shaped like an element of the `markeractivity` endpoint.
+    """
+    return {
+        'MarkerId':marker_id,'MarkerUTC':marker_utc,'MarkerLTC':marker_utc - 21600,
+        'MajorType':'Play','MinorType':minor_type,'Descriptor_':'','Comments':f'Play {marker_id}','IsOfficial':is_official,
+        'ETime':{'Period':1,'ClockMinutes':10,'ClockSeconds':0},
+        'SourceType':'','EventId':game_id,'SituationCode':'','SourceId':marker_id,'SourceNativeMarkerId':str(marker_id),'OfficialCode':'',
+        'Properties':[
+            {'FootballEventContext':{
+                'TimeRemSecTotal':600,'TimeRemStr':'10:00','VisTimeouts':3,'HomeTimeouts':3,'BallOn':{'VisOrHome':'V','YardNum':25},
+                'DriveNum':1,'PossTeam':'ARL','LastPlaySummary':'','LastPlayStatus':''
+            }},
+            {'FootballYards':marker_id % 11}
+        ],
+        'Participants':[{'Role':'Passer','OfficialId':1001}]
+    }
+
+def make_scoreboard_game(event_id:str=GAME_ID,status='Scheduled',period=0,clock_state='Stopped',play_clock=0,detail='',home_score=0,now_utc=1676750000):
+    """
+    Returns one game, shaped like an element of the `scoreboards` endpoint.
+    """
+    return {
+        'EventId':event_id,'NowUTC':now_utc,'NowLTC':now_utc - 21600,'VisitorScore':0,'HomeScore':home_score,
+        'Period':period,'ClockMinutes':10,'ClockSeconds':0,'ClockTenths':0,'ClockState':clock_state,
+        'VisitorTimeoutsRemaining':3,'HomeTimeoutsRemaining':3,'VisitorChallengesRemaining':1,'HomeChallengesRemaining':1,
+        'VisitorPeriodScores':[0],'HomePeriodScores':[home_score],'EventStatusDetail':detail,'VisitorShots':0,'HomeShots':0,
+        'EventStatus':status,'OfficialCode':'','PeriodSecondsRemaining':600,'PeriodSecondsElapsed':300,
+        'PlayClock':play_clock,'PlayClockTenths':0,'BallOn':'V 25','Down':1,'Distance':10,'PossTeam':'ARL','DriveNum':1
+    }
+
+## The teams of `GAME_ID`.
+VISITOR, HOME = GAME_ID.rsplit('_',1)[-1].split('@')
+
+def _stat_value(key:str,seed:int):
+    """
+    Returns a deterministic value for a stat: a rate for rate stats (ex. `PassCompPercent`), and a count for everything else.
+    """
+    if any(x in key for x in ('Percent','Pct','Avg','PerAtt','PerComp','PerGame','Rating')):
+        return round((seed % 17) / 4 + 0.125,3)
+    return seed % 23
+
+def make_player(official_id:int,team_id=HOME,vis_or_home='H',position='WR',participated=True):
+    """
+    Returns one player, shaped like an element of the `players` endpoint (with or without ```?game=```).
+    """
+    return {
+        'OfficialId':official_id,'VisOrHome':vis_or_home,'JerseyNum':official_id % 99,'FirstName':f'First{official_id}','LastName':f'Last{official_id}',
+        'LastNameSuffix':'','Position':position,'PositionLongName':f'Long {position}','NAbbrev':'','Height':'6-2','Weight':200 + official_id % 50,
+        'DOB':'1999-01-01','POB':'','Age':24,'Hometown':'','Country':'USA','CountryCode':'US','Nickname':'','InjuryStatus':'','InjuryDesc':'',
+        'GfxId':official_id,'Headshot':'','IsStarting':official_id % 2,'Initials':'FL','Scratch':0,'TrackingId':str(official_id),'TeamId':team_id,
+        'Affiliate':'','CloudHeadshotURL':'','SquadId':1,'College':'State','LeagueStatus':'Active','Participated':int(participated)
+    }
+
+## The stats in a `playerstats` record, in the order the API sends them.
+PLAYER_STAT_KEYS = (
+    'PassComp','PassAtt','PassCompPercent','PassYards','PassTD','PassINT','FirstDownsByPass','FirstDownPercentOfPasses','PassYardsLong','PassYardsLongTD',
+    'PassYardsPerAtt','PassYardsPerComp','QBRating','Sacked','SackedYards','SackedYardsAvg','Pass20YdPlays','Pass40YdPlays','RushAtt','RushYards',
+    'RushYardsAvg','RushTD','FirstDownsByRush','FirstDownPercentOfRushes','RushYardsLong','RushYardsLongTD','Rush10YdPlays','Rush20YdPlays','RecThrownAt',
+    'Recs','RecYards','RecYardsAvg','RecTD','FirstDownsByRec','FirstDownPercentOfRecs','RecYardsLong','RecYardsLongTD','RecYardsAfterCatch',
+    'RecYardsAfterCatchAvg','RecDropped','Rec20YdPlays','Rec40YdPlays','Fumbles','FumblesLost','OffTD','FirstDowns','FirstDownPercent','PAT1PtAttPass',
+    'PAT1PtAttRec','PAT1PtAttRush','PAT1PtConvRush','PAT1PtPctRush','PAT2PtAttPass','PAT2PtAttRec','PAT2PtAttRush','PAT2PtConvRush','PAT2PtPctRush',
+    'PAT3PtAttPass','PAT3PtAttRec','PAT3PtAttRush','PAT3PtConvRush','PAT3PtPctRush','TotalTD','TotalYards','Penalties','PenaltyYards','DefTackles',
+    'DefSoloTackles','DefAssistTackles','DefQBHits','DefTacklesForLoss','DefSacks','DefSackYards','DefSackYardsAvg','DefINT','DefINTReturnYards',
+    'DefINTReturnYardsAvg','DefINTReturnTD','DefINTReturnYardsLong','FGAtt','FGMade','FGLong','FG0To19Att','FG0To19Made','FG20To29Att','FG20To29Made',
+    'FG30To39Att','FG30To39Made','FG40To49Att','FG40To49Made','FG50PlusAtt','FG50PlusMade','Punts','PuntGrossYards','PuntGrossYardsAvg',
+    'PuntGrossYardsLong','PuntTouchbacks','PuntInside20','PuntRetReturns','PuntRetYards','PuntRetYardsAvg','PuntRetTD','PuntRetYardsLong',
+    'PuntRetFairCatches','KickRetReturns','KickRetYards','KickRetYardsAvg','KickRetTD','KickRetYardsLong','KickRetFairCatches'
+)
+
+def make_player_stats(official_id:int,**stats):
+    """
+    Returns one player's stats, shaped like an element of the `playerstats` endpoint.
+    Like the API, a player only has some stats: every third stat (offset by ```official_id```) is left out.
+    Any stat passed as a keyword argument is always included.
+    """
+    record = {'OfficialId':official_id}
+    for i,key in enumerate(PLAYER_STAT_KEYS):
+        if (i + official_id) % 3 != 0:
+            record[key] = _stat_value(key,i + official_id)
+    record.update(stats)
+    return record
+
+## The stats in a `teamstats` record, in the order the API sends them.
+TEAM_STAT_KEYS = (
+    'PlaysPerGame','Points','DefPointsAgainst','YardsPerGame','DefYardsAgainst','PassYardsPerGame','DefPassYardsAgainst','RushYardsPerGame',
+    'DefRushYardsAgainst','DriveStartYardlineAvg','FirstDowns','FirstDownsByPass','FirstDownsByPenalty','FirstDownsByRush','FirstDownPercent',
+    'FirstDownPercentOfPasses','FirstDownPercentOfRushes','ThirdDownConv','ThirdDownAtt','ThirdDownPercent','FourthDownConv','FourthDownAtt',
+    'FourthDownPercent','Penalties','PenaltyYards','PenaltiesOffensive','PenaltyYardsOffensive','PenaltiesDefensive','PenaltyYardsDefensive',
+    'Turnovers','TotalTD','OffTD','TOPSeconds','PassComp','PassAtt','PassCompPercent','PassYards','PassTD','PassINT','PassYardsLong','PassYardsLongTD',
+    'PassYardsPerAtt','PassYardsPerComp','RecYardsAfterCatch','RecYardsAfterCatchAvg','RecDropped','Sacked','SackedYards','SackedYardsAvg',
+    'Pass20YdPlays','Pass40YdPlays','RushAtt','RushTD','RushYards','RushYardsAvg','RushYardsLong','RushYardsLongTD','Rush20YdPlays','Rush40YdPlays',
+    'PAT1PtAtt','PAT1PtConv','PAT1PtPct','PAT1PtAttPass','PAT1PtConvPass','PAT1PtPctPass','PAT1PtAttRush','PAT1PtConvRush','PAT1PtPctRush','PAT2PtAtt',
+    'PAT2PtConv','PAT2PtPct','PAT2PtAttPass','PAT2PtConvPass','PAT2PtPctPass','PAT2PtAttRush','PAT2PtConvRush','PAT2PtPctRush','PAT3PtAtt','PAT3PtConv',
+    'PAT3PtPct','PAT3PtConvPass','PAT3PtAttPass','PAT3PtPctPass','PAT3PtConvRush','PAT3PtAttRush','PAT3PtPctRush','Fumbles','FumblesLost','DefTackles',
+    'DefTacklesForLoss','DefQBHits','DefSacks','DefSackYards','DefSackYardsAvg','DefINT','DefINTReturnYards','DefINTReturnYardsAvg','DefINTReturnTD',
+    'DefINTReturnYardsLong','DefPassesDefended','DefFumblesForced','DefFumblesRecovered','Punts','PuntGrossYards','PuntGrossYardsAvg',
+    'PuntGrossYardsLong','PuntTouchbacks','PuntInside20','FGAtt','FGMade','FGLong','KickRetReturns','KickRetYards','KickRetYardsAvg','KickRetTD',
+    'KickRetYardsLong','KickRetFairCatches','PuntRetReturns','PuntRetYards','PuntRetYardsAvg','PuntRetTD','PuntRetYardsLong','PuntRetFairCatches'
+)
+
+def make_team_stats(official_id:str,seed=0):
+    """
+    Returns one team's stats, shaped like an element of the `teamstats` endpoint.
+    Every seventh stat (offset by ```seed```) is left out.
+    """
+    record = {'OfficialId':official_id}
+    for i,key in enumerate(TEAM_STAT_KEYS):
+        if (i + seed) % 7 != 0:
+            record[key] = 1800 + i if key == 'TOPSeconds' else _stat_value(key,i + seed)
+    return record
+
+def make_standing(official_id:str,rank:int):
+    """
+    Returns one team, shaped like an element of the `standings` endpoint.
+    """
+    record = {
+        'OfficialId':official_id,'Rank':rank,'RankInConference':rank % 4 + 1,'RankInDivision':rank % 4 + 1,'GamesPlayed':10,'GamesBack':rank * 0.5,
+        'ScoreDiff':50 - rank * 20,'ScoreFor':250 - rank * 10,'ScoreAgainst':200 + rank * 10,'RankInWildcard':rank,'Streak':f'W{rank}','Last10':f'{8 - rank}-{2 + rank}',
+        'ClinchIndicator':'x' if rank == 1 else '','ConferenceScoreFor':100,'ConferenceScoreAgainst':90,'DivisionScoreFor':80,'DivisionScoreAgainst':70,
+        'City':f'City {official_id}','Mascot':f'Mascot {official_id}'
+    }
+    for where in ('','Road','Home'):
+        for i,record_type in enumerate(('EarnedPoints','Wins','Losses','Ties','WinPct','OTWins','OTLosses','OTTies','ShootoutWins','ShootoutLosses',
+                                        'ConferenceWins','ConferenceLosses','ConferenceTies','ConferenceWinPct','DivisionWins','DivisionLosses','DivisionTies','DivisionWinPct')):
+            record[f'{where}{record_type}'] = round((8 - rank) / 10,3) if record_type.endswith('Pct') else (i + rank) % 9
+    record.update({'HockeyOTAndSOLosses':0,'HockeyRegulationAndOTWins':0,'HockeyRoadOTAndSOLosses':0,'HockeyHomeOTAndSOLosses':0})
+    return record
+
+def make_transactions_html(transactions:list):
+    """
+    Returns the XFL's transactions page, with one row for every `(team_logo_url, date, player_name, player_position, transaction_type)` tuple.
+    """
+    rows = ''.join(
+        f'<tr><td><img src="{logo}"/></td><td>{date}</td><td>{name}</td><td>{position}</td><td>{transaction_type}</td></tr>'
+        for logo,date,name,position,transaction_type in transactions
+    )
+    return f'<html><body><table><tr><th>Team</th><th>Date</th><th>Player</th><th>Position</th><th>Transaction</th></tr>{rows}</table></body></html>'
+
+## Team logos, as they appear on the transactions page.
+ARL_LOGO = "https://res.cloudinary.com/xfl-production/image/upload/c_thumb,w_100/v1671555934/xfl-prod/logos/logo-arlington-renegades-500x500.png"
+VGS_LOGO = "https://res.cloudinary.com/xfl-production/image/upload/c_thumb,w_100/v1671555934/xfl-prod/logos/logo-vegas-vipers-500x500.png"
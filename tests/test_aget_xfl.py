@@ -0,0 +1,80 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+
+import xfl_fast_r.get_xfl
+from payloads import GAME_ID, HOME, VISITOR, make_play, make_player, make_player_stats, make_standing
+from xfl_fast_r.aget_xfl import aget_xfl_pbp, aget_xfl_player_box, aget_xfl_standings
+from xfl_fast_r.get_xfl import get_xfl_pbp
+from xfl_fast_r.load_xfl import load_xfl_pbp
+from xfl_fast_r.save_xfl import XFLParquetWriter
+
+PLAYS = json.dumps([make_play(i,1676750000 + i * 20) for i in range(30)])
+PLAYERS = [make_player(i,HOME if i % 2 else VISITOR,'H' if i % 2 else 'V') for i in range(1,11)]
+
+def test_aget_returns_the_same_data_as_get(scripted_client):
+    client = scripted_client([(200,{},PLAYS)])
+
+    expected = get_xfl_pbp('token',GAME_ID,client=client)
+    actual = asyncio.run(aget_xfl_pbp('token',GAME_ID,client=client))
+    pd.testing.assert_frame_equal(actual,expected)
+
+    batched = asyncio.run(aget_xfl_pbp('token',GAME_ID,client=client,batch_size=7,output='arrow'))
+    assert isinstance(batched,pa.Table)
+    assert batched.num_rows == 30
+
+def test_aget_shares_the_memory_cache(scripted_client):
+    client = scripted_client([(200,{},PLAYS)],memory_cache=True)
+    keys = []
+    memoize = client.memoize
+    client.memoize = lambda key,compute: keys.append(key) or memoize(key,compute)
+
+    async def fetch():
+        return await asyncio.gather(*[aget_xfl_pbp('token',GAME_ID,client=client) for _ in range(3)])
+
+    results = asyncio.run(fetch())
+
+    assert keys == [('pbp',GAME_ID,'pandas')] * 3
+    assert 1 <= len(client.session.get_adapter('https://').requests) <= 3
+    for df in results[1:]:
+        pd.testing.assert_frame_equal(df,results[0])
+
+def test_aget_uses_conditional_requests(scripted_client):
+    standings = json.dumps([make_standing(HOME,1),make_standing(VISITOR,2)])
+    client = scripted_client([(200,{'ETag':'"v1"'},standings),(304,{'ETag':'"v1"'},b'')])
+
+    first = asyncio.run(aget_xfl_standings('token',client=client))
+    second = asyncio.run(aget_xfl_standings('token',client=client))
+
+    assert client.session.get_adapter('https://').requests[1].headers['If-None-Match'] == '"v1"'
+    pd.testing.assert_frame_equal(first,second)
+
+def test_aget_saves_to_the_writer(scripted_client,tmp_path):
+    client = scripted_client([(200,{},PLAYS)])
+    writer = XFLParquetWriter(str(tmp_path))
+
+    df = asyncio.run(aget_xfl_pbp('token',GAME_ID,client=client,writer=writer))
+
+    assert len(load_xfl_pbp(game_ids=[GAME_ID],source=str(tmp_path))) == len(df)
+
+def test_aget_parses_in_the_executor(scripted_client,monkeypatch):
+    parse = xfl_fast_r.get_xfl._parse_xfl_player_box
+    threads = []
+
+    def record_thread(*args,**kwargs):
+        threads.append(threading.current_thread().name)
+        return parse(*args,**kwargs)
+
+    monkeypatch.setattr('xfl_fast_r.get_xfl._parse_xfl_player_box',record_thread)
+    stats = json.dumps([make_player_stats(i) for i in range(1,11)])
+    client = scripted_client([(200,{},stats),(200,{},json.dumps(PLAYERS))])
+
+    with ThreadPoolExecutor(max_workers=1,thread_name_prefix='parser') as executor:
+        df = asyncio.run(aget_xfl_player_box('token',GAME_ID,client=client,executor=executor))
+
+    assert len(df) == 10
+    assert threads[0].startswith('parser')
@@ -0,0 +1,48 @@
+import json
+import os
+
+from xfl_fast_r.cache import XFLResponseCache
+
+GAME_ID = "FOOTBALL_XFL_2023_2_18_VGS@ARL"
+PARAMS = {'game':GAME_ID,'access_token':'token'}
+
+def test_body_cached_before_final_is_not_kept_forever(tmp_path,monkeypatch):
+    cache = XFLResponseCache(str(tmp_path))
+    now = [1000.0]
+    monkeypatch.setattr('xfl_fast_r.cache.time.time',lambda: now[0])
+
+    cache.set('playerstats',PARAMS,b'[1]')
+    now[0] = 1010.0
+    cache.update_final_games([{'EventId':GAME_ID,'EventStatus':'Final'}])
+
+    ## Still inside the endpoint's TTL.
+    assert cache.get('playerstats',PARAMS) == b'[1]'
+
+    ## The live snapshot expires like any other response.
+    now[0] = 1000.0 + 61
+    assert cache.get('playerstats',PARAMS) == None
+
+    ## A body fetched after the game is final never expires.
+    cache.set('playerstats',PARAMS,b'[2]')
+    now[0] = 10 ** 9
+    assert cache.get('playerstats',PARAMS) == b'[2]'
+
+def test_incomplete_meta_file_is_a_cache_miss(tmp_path):
+    cache = XFLResponseCache(str(tmp_path))
+    cache.set('playerstats',PARAMS,b'[1]')
+
+    _, meta_path = cache._paths('playerstats',cache.make_key('playerstats',PARAMS))
+    with open(meta_path,'w') as f:
+        json.dump({'endpoint':'playerstats'},f)
+
+    assert cache.get('playerstats',PARAMS) == None
+
+def test_old_final_games_file_is_upgraded(tmp_path):
+    with open(os.path.join(tmp_path,'final_games.json'),'w') as f:
+        json.dump([GAME_ID],f)
+
+    cache = XFLResponseCache(str(tmp_path))
+    assert cache.is_game_final(GAME_ID)
+
+    with open(os.path.join(tmp_path,'final_games.json')) as f:
+        assert isinstance(json.load(f),dict)
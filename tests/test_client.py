@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+import requests
+
+import xfl_fast_r.client
+
+STANDINGS = '[{"TeamId":"ARL","Wins":1},{"TeamId":"VGS","Wins":0}]'
+
+class _CountingParser:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self,json_data):
+        self.calls += 1
+        return pd.DataFrame(json_data)
+
+###############################################################################################################
+## Conditional requests
+###############################################################################################################
+
+def test_304_reuses_the_last_result(scripted_client):
+    client = scripted_client([(200,{'ETag':'"v1"'},STANDINGS),(304,{'ETag':'"v1"'},b'')])
+    parse = _CountingParser()
+
+    first = client.get_scoring_data('standings','standings','token',parse)
+    second = client.get_scoring_data('standings','standings','token',parse)
+
+    assert parse.calls == 1
+    assert client.session.get_adapter('https://').requests[1].headers['If-None-Match'] == '"v1"'
+    pd.testing.assert_frame_equal(first,second)
+
+def test_reused_results_are_copies(scripted_client):
+    client = scripted_client([(200,{'ETag':'"v1"'},STANDINGS),(304,{},b'')])
+    parse = _CountingParser()
+
+    first = client.get_scoring_data('standings','standings','token',parse)
+    first['Wins'] = 99
+    second = client.get_scoring_data('standings','standings','token',parse)
+
+    assert first is not second
+    assert second['Wins'].tolist() == [1,0]
+
+def test_identical_body_is_not_parsed_again(scripted_client):
+    client = scripted_client([(200,{},STANDINGS)])
+    parse = _CountingParser()
+
+    client.get_scoring_data('standings','standings','token',parse)
+    client.get_scoring_data('standings','standings','token',parse)
+
+    assert parse.calls == 1
+
+def test_304_without_an_earlier_response_raises(scripted_client):
+    client = scripted_client([(304,{},b'')])
+
+    with pytest.raises(requests.HTTPError,match='no earlier response'):
+        client.get_scoring_data('standings','standings','token',_CountingParser())
+
+def test_conditional_results_are_bounded(scripted_client,monkeypatch):
+    monkeypatch.setattr(xfl_fast_r.client,'MAX_CONDITIONAL_RESULTS',2)
+    client = scripted_client([(200,{},STANDINGS)])
+
+    for season in (2020,2023,2024):
+        client.get_scoring_data(('standings',season),'standings','token',_CountingParser(),season=season)
+
+    assert len(client._conditional_results) == 2
@@ -0,0 +1,71 @@
+import json
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from conftest import ScriptedAdapter
+from payloads import make_play
+from xfl_fast_r.get_xfl import get_xfl_pbp_many
+
+GAME_IDS = ["FOOTBALL_XFL_2023_2_18_VGS@ARL","FOOTBALL_XFL_2023_2_19_ORL@HOU","FOOTBALL_XFL_2023_2_19_SEA@DC"]
+FAILING_GAME_ID = GAME_IDS[1]
+
+class GameAdapter(ScriptedAdapter):
+    """
+    Answers every `markeractivity` request with the plays of the requested game, and with HTTP 404 for ```FAILING_GAME_ID```.
+    """
+
+    def __init__(self):
+        super().__init__([])
+        self.lock = threading.Lock()
+
+    def send(self,request,**kwargs):
+        game_id = parse_qs(urlparse(request.url).query)['game'][0]
+        plays = [make_play(i,1676750000 + i * 20,game_id=game_id) for i in range(5)]
+
+        with self.lock:
+            self.responses = [(404,{},'')] if game_id == FAILING_GAME_ID else [(200,{},json.dumps(plays))]
+            return super().send(request,**kwargs)
+
+@pytest.fixture
+def game_client(scripted_client):
+    client = scripted_client([(404,{},'')],retry=False,circuit_breaker=False)
+    client.session.mount('https://',GameAdapter())
+    return client
+
+def test_one_failing_game_does_not_fail_the_batch(game_client):
+    pbp_df, errors_df = get_xfl_pbp_many('token',GAME_IDS + [GAME_IDS[0]],max_workers=3,client=game_client)
+
+    ## The games that could be retrived are in the order they were given in, without duplicates.
+    assert pbp_df['game_id'].drop_duplicates().tolist() == [GAME_IDS[0],GAME_IDS[2]]
+    assert len(pbp_df) == 10
+    assert pbp_df.index.equals(pd.RangeIndex(10))
+
+    assert list(errors_df.columns) == ['game_id','error_type','error']
+    assert errors_df['game_id'].tolist() == [FAILING_GAME_ID]
+    assert errors_df['error_type'].tolist() == ['HTTPError']
+    assert '404' in errors_df['error'].iloc[0]
+
+def test_categories_are_restored_after_concat(game_client):
+    pbp_df, _ = get_xfl_pbp_many('token',GAME_IDS,client=game_client)
+
+    for column in ['game_id','EventId','MinorType']:
+        assert isinstance(pbp_df[column].dtype,pd.CategoricalDtype), column
+    assert set(pbp_df['game_id'].cat.categories) == {GAME_IDS[0],GAME_IDS[2]}
+
+def test_arrow_output(game_client):
+    pbp_table, errors_table = get_xfl_pbp_many('token',GAME_IDS,client=game_client,output='arrow')
+
+    assert isinstance(pbp_table,pa.Table)
+    assert pbp_table.num_rows == 10
+    assert errors_table.column_names == ['game_id','error_type','error']
+    assert errors_table['game_id'].to_pylist() == [FAILING_GAME_ID]
+
+def test_every_game_failing(game_client):
+    pbp_df, errors_df = get_xfl_pbp_many('token',[FAILING_GAME_ID],client=game_client)
+
+    assert len(pbp_df) == 0
+    assert errors_df['game_id'].tolist() == [FAILING_GAME_ID]
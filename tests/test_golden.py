@@ -0,0 +1,82 @@
+"""
+Compares the field-spec parsers with the output of the original parsers, saved in `tests/fixtures/golden`.
+
+`FOOTBALL_XFL_2023_2_18_VGS@ARL.json` has a synthetic `players`, `playerstats`, `teamstats` and `markeractivity` payload for one game,
+with stats left out, players without stats, plays with every kind of `Properties` entry, and missing clock, timeout and participant data.
+The other files are what `get_xfl_player_box()`, `get_xfl_team_box()` and `get_xfl_pbp()` returned for that payload,
+before they were rewritten with `FieldExtractor` and `_flatten_pbp_properties()`.
+"""
+from datetime import datetime
+import json
+import math
+import os
+
+import pandas as pd
+import pytest
+
+from payloads import GAME_ID
+from xfl_fast_r.get_xfl import _parse_xfl_game_participation, _parse_xfl_pbp, _parse_xfl_player_box, _parse_xfl_team_box
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__),'fixtures','golden')
+
+with open(os.path.join(GOLDEN_DIR,f'{GAME_ID}.json')) as f:
+    PAYLOADS = json.load(f)
+
+## Changes from the original parsers that were made on purpose, as (column, row) -> new value.
+INTENTIONAL_CHANGES = {
+    ## A missing `PuntRetYards` defaults to 0 like every other team stat, instead of null.
+    'team_box':{('PuntRetYards',0):0},
+}
+
+## Columns that are not compared.
+SKIPPED_COLUMNS = {
+    ## `BallOn_Side` used to be set only on plays where `HomeTimeouts` was missing.
+    ## `MarkerDateTime` is in the local time zone, so it is checked against `MarkerUTC` instead.
+    'pbp':['BallOn_Side','MarkerDateTime'],
+}
+
+def _parse(name:str):
+    if name == 'player_box':
+        participation_df = _parse_xfl_game_participation(PAYLOADS['players'],GAME_ID)
+        return _parse_xfl_player_box(PAYLOADS['playerstats'],participation_df,GAME_ID)
+    elif name == 'team_box':
+        return _parse_xfl_team_box(PAYLOADS['teamstats'],GAME_ID)
+    return _parse_xfl_pbp(PAYLOADS['markeractivity'],GAME_ID)
+
+def _normalize(value):
+    """
+    Returns ```value``` in a form that does not depend on its dtype: nulls as `None`, timestamps as seconds since the Unix epoch, and numbers as rounded floats.
+    """
+    if value is None or value is pd.NA or value is pd.NaT or (isinstance(value,float) and math.isnan(value)):
+        return None
+    elif isinstance(value,pd.Timestamp):
+        return float(value.timestamp() if value.tzinfo != None else value.tz_localize('UTC').timestamp())
+    elif isinstance(value,(bool,int,float)):
+        return round(float(value),6)
+    return value
+
+@pytest.mark.parametrize('name',['player_box','team_box','pbp'])
+def test_parser_matches_the_original_parser(name):
+    with open(os.path.join(GOLDEN_DIR,f'{name}.json')) as f:
+        expected = json.load(f)
+
+    df = _parse(name)
+    skipped = SKIPPED_COLUMNS.get(name,[])
+    changes = INTENTIONAL_CHANGES.get(name,{})
+
+    assert [x for x in df.columns if x not in skipped] == [x for x in expected['columns'] if x not in skipped]
+    assert len(df) == len(expected['data'])
+
+    for i,column in enumerate(expected['columns']):
+        if column in skipped:
+            continue
+
+        actual = [_normalize(x) for x in df[column].astype(object).tolist()]
+        values = [_normalize(changes.get((column,row),row_values[i])) for row,row_values in enumerate(expected['data'])]
+        assert actual == values, column
+
+def test_pbp_marker_date_time_is_the_local_marker_utc():
+    pbp_df = _parse('pbp')
+    expected = [datetime.fromtimestamp(x.timestamp()) for x in pbp_df['MarkerUTC']]
+
+    assert pbp_df['MarkerDateTime'].tolist() == expected
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from payloads import GAME_ID, make_play
+from xfl_fast_r.live import XFLLivePBPPoller
+
+def _column(table,column):
+    values = table[column]
+    return values.to_pylist() if hasattr(values,'to_pylist') else values.tolist()
+
+@pytest.mark.parametrize('output',['pandas','arrow'])
+def test_only_new_markers_are_emitted(output):
+    poller = XFLLivePBPPoller('token',GAME_ID,output=output)
+
+    first = poller.update([make_play(1,100),make_play(2,130)])
+    second = poller.update([make_play(1,100),make_play(2,130),make_play(3,160)])
+    third = poller.update([make_play(1,100),make_play(2,130),make_play(3,160)])
+
+    assert _column(first,'MarkerId') == [1,2]
+    assert _column(second,'MarkerId') == [3]
+    assert len(third) == 0
+    assert poller.polls == 3
+
+@pytest.mark.parametrize('output',['pandas','arrow'])
+def test_is_official_change_re_emits_the_marker(output):
+    poller = XFLLivePBPPoller('token',GAME_ID,output=output)
+
+    poller.update([make_play(1,100,is_official=False),make_play(2,130,is_official=False)])
+    delta = poller.update([make_play(1,100,is_official=True),make_play(2,130,is_official=False)])
+
+    assert _column(delta,'MarkerId') == [1]
+    assert _column(delta,'IsOfficial') == [True]
+
+    ## `frame` has every version that was emitted, and `plays` only the latest one.
+    assert _column(poller.frame,'MarkerId') == [1,2,1]
+    assert _column(poller.plays,'MarkerId') == [1,2]
+    assert _column(poller.plays,'IsOfficial') == [True,False]
+
+    ## The same flag again is not a change.
+    assert len(poller.update([make_play(1,100,is_official=True),make_play(2,130,is_official=False)])) == 0
+
+def test_poll_downloads_markeractivity(scripted_client):
+    client = scripted_client([(200,{},json.dumps([make_play(1,100)])),(200,{},json.dumps([make_play(1,100),make_play(2,130)]))])
+    poller = XFLLivePBPPoller('token',GAME_ID,client=client)
+
+    assert poller.poll()['MarkerId'].tolist() == [1]
+    assert poller.poll()['MarkerId'].tolist() == [2]
+
+    request = client.session.get_adapter('https://').requests[0]
+    assert '/markeractivity?' in request.url
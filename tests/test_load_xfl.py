@@ -0,0 +1,113 @@
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from xfl_fast_r.load_xfl import _build_filter, load_xfl_pbp, load_xfl_player_box, load_xfl_schedule
+from xfl_fast_r.save_xfl import XFLParquetWriter
+
+## One game in each of the first three weeks of 2023. `SA` is a substring of `SEA`, so a team filter has to match whole team IDs.
+GAMES = {
+    'FOOTBALL_XFL_2023_2_18_VGS@ARL':1,
+    'FOOTBALL_XFL_2023_2_25_SEA@DC':2,
+    'FOOTBALL_XFL_2023_3_4_SA@HOU':3
+}
+
+def _pbp(game_id):
+    return pd.DataFrame({'Season':2023,'game_id':game_id,'MarkerId':[1,2],'Comments':[f'{game_id} 1',f'{game_id} 2']})
+
+def _player_box(game_id):
+    visitor, home = game_id.rsplit('_',1)[-1].split('@')
+    return pd.DataFrame({'Season':2023,'game_id':game_id,'OfficialID':[1,2],'TeamId':[visitor,home],'PassYards':[100,200]})
+
+@pytest.fixture
+def data_lake(tmp_path):
+    writer = XFLParquetWriter(str(tmp_path))
+    for game_id in GAMES:
+        writer.write_game('pbp',_pbp(game_id),game_id)
+        writer.write_game('player_box',_player_box(game_id),game_id)
+    return str(tmp_path)
+
+@pytest.fixture
+def repository(tmp_path):
+    """
+    A local copy of the `xfl-2023-data-repository` layout, with one file per game.
+    """
+    for game_id in GAMES:
+        path = os.path.join(str(tmp_path),'pbp','single_game','parquet',f'{game_id}.parquet')
+        os.makedirs(os.path.dirname(path),exist_ok=True)
+        pq.write_table(pa.Table.from_pandas(_pbp(game_id),preserve_index=False),path)
+
+    path = os.path.join(str(tmp_path),'schedule','2023_xfl_schedule.parquet')
+    os.makedirs(os.path.dirname(path),exist_ok=True)
+    pq.write_table(pa.table({'Season':[2023] * 3,'EventId':list(GAMES)}),path)
+    return str(tmp_path)
+
+def test_data_lake_round_trip(data_lake):
+    pbp_df = load_xfl_pbp(source=data_lake)
+
+    assert list(pbp_df.columns[:3]) == ['Season','Week','game_id']
+    assert sorted(pbp_df['game_id'].unique()) == sorted(GAMES)
+    for game_id,week in GAMES.items():
+        game_df = pbp_df[pbp_df['game_id'] == game_id]
+        assert game_df['Week'].tolist() == [week,week]
+        assert game_df['Comments'].tolist() == _pbp(game_id)['Comments'].tolist()
+
+@pytest.mark.parametrize('kwargs,expected',[
+    ({'seasons':2023},list(GAMES)),
+    ({'seasons':2024},[]),
+    ({'weeks':[2,3]},['FOOTBALL_XFL_2023_2_25_SEA@DC','FOOTBALL_XFL_2023_3_4_SA@HOU']),
+    ({'game_ids':'FOOTBALL_XFL_2023_2_18_VGS@ARL'},['FOOTBALL_XFL_2023_2_18_VGS@ARL']),
+    ({'teams':'SA'},['FOOTBALL_XFL_2023_3_4_SA@HOU']),
+    ({'teams':['SEA','ARL']},['FOOTBALL_XFL_2023_2_18_VGS@ARL','FOOTBALL_XFL_2023_2_25_SEA@DC']),
+    ({'teams':'HOU','weeks':1},[])
+])
+@pytest.mark.parametrize('layout',['data_lake','repository'])
+def test_filters(request,layout,kwargs,expected):
+    pbp_df = load_xfl_pbp(source=request.getfixturevalue(layout),**kwargs)
+
+    ## A repository layout has no schema to read when no file matches the filters, so an empty result may not have any columns.
+    if len(expected) == 0:
+        assert len(pbp_df) == 0
+    else:
+        assert sorted(pbp_df['game_id'].unique()) == sorted(expected)
+
+@pytest.mark.parametrize('layout',['data_lake','repository'])
+def test_columns_are_projected(request,layout):
+    pbp_df = load_xfl_pbp(columns=['game_id','MarkerId'],teams='VGS',source=request.getfixturevalue(layout))
+
+    assert list(pbp_df.columns) == ['game_id','MarkerId']
+    assert pbp_df['MarkerId'].tolist() == [1,2]
+
+def test_repository_layout_adds_the_week_column(repository):
+    pbp_df = load_xfl_pbp(source=repository,output='arrow')
+
+    assert isinstance(pbp_df,pa.Table)
+    assert dict(zip(pbp_df['game_id'].to_pylist(),pbp_df['Week'].to_pylist())) == GAMES
+
+def test_repository_season_files(repository):
+    schedule_df = load_xfl_schedule(teams='SA',source=repository)
+    assert schedule_df['EventId'].tolist() == ['FOOTBALL_XFL_2023_3_4_SA@HOU']
+
+def test_player_teams_match_the_team_column(data_lake):
+    player_box_df = load_xfl_player_box(teams='SA',source=data_lake)
+
+    ## Only the players of that team, and not their opponents in the same game.
+    assert player_box_df['TeamId'].astype(str).tolist() == ['SA']
+    assert player_box_df['PassYards'].tolist() == [100]
+
+def test_build_filter():
+    assert _build_filter('pbp') is None
+
+    table = pa.table({
+        'Season':pa.array([2023,2023,2023],type=pa.int16()),
+        'Week':pa.array([1,2,3],type=pa.int16()),
+        'game_id':list(GAMES),
+        'TeamId':['VGS','DC','SA']
+    })
+    assert table.filter(_build_filter('player_box',seasons=[2023],teams=['SA']))['TeamId'].to_pylist() == ['SA']
+    assert table.filter(_build_filter('pbp',weeks=[1,3],teams=['ARL','HOU']))['Week'].to_pylist() == [1,3]
+    ## The game ID filter also keeps a team's players from being read out of games that team did not play in.
+    assert table.filter(_build_filter('player_box',teams=['VGS','SEA']))['TeamId'].to_pylist() == ['VGS']
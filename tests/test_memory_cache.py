@@ -0,0 +1,165 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from xfl_fast_r.cache import XFLMemoryCache
+from xfl_fast_r.client import XFLClient
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replaces `time.monotonic()` in `xfl_fast_r.cache` with a clock that only moves when ```clock[0]``` is changed.
+    """
+    now = [1000.0]
+    monkeypatch.setattr('xfl_fast_r.cache.time.monotonic',lambda: now[0])
+    return now
+
+class Counter:
+    """
+    A `compute()` function that returns how many times it has been called.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.calls
+
+def test_finished_results_are_not_kept_by_default():
+    cache = XFLMemoryCache()
+    compute = Counter()
+
+    assert cache.get_or_compute('key',compute) == 1
+    assert cache.get_or_compute('key',compute) == 2
+    assert len(cache) == 0
+
+def test_client_memoize_does_not_return_stale_results():
+    with XFLClient() as client:
+        compute = Counter()
+        assert client.memoize(('pbp','G','pandas'),compute) == 1
+        assert client.memoize(('pbp','G','pandas'),compute) == 2
+
+def test_results_expire_after_ttl(clock):
+    cache = XFLMemoryCache(ttl=15)
+    compute = Counter()
+
+    assert cache.get_or_compute('key',compute) == 1
+    clock[0] += 15
+    assert cache.get_or_compute('key',compute) == 1
+    clock[0] += 0.1
+    assert cache.get_or_compute('key',compute) == 2
+
+def test_least_recently_used_result_is_evicted():
+    cache = XFLMemoryCache(maxsize=2,ttl=None)
+    computes = {key:Counter() for key in 'abc'}
+
+    cache.get_or_compute('a',computes['a'])
+    cache.get_or_compute('b',computes['b'])
+    ## Using `a` again makes `b` the least recently used result.
+    cache.get_or_compute('a',computes['a'])
+    cache.get_or_compute('c',computes['c'])
+
+    assert len(cache) == 2
+    cache.get_or_compute('a',computes['a'])
+    cache.get_or_compute('b',computes['b'])
+    assert computes['a'].calls == 1
+    assert computes['b'].calls == 2
+
+def test_results_are_copied_on_read():
+    cache = XFLMemoryCache(ttl=None)
+    first = cache.get_or_compute('key',lambda: pd.DataFrame({'x':[1,2]}))
+    first.loc[0,'x'] = 100
+
+    second = cache.get_or_compute('key',lambda: pd.DataFrame({'x':[3,4]}))
+    assert second['x'].tolist() == [1,2]
+
+class CountingEvent(threading.Event):
+    """
+    A `threading.Event` that counts the threads waiting on it, so a test can wait until every waiter has joined an in-flight call.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.waiters = threading.Semaphore(0)
+
+    def wait(self,timeout=None):
+        self.waiters.release()
+        return super().wait(timeout)
+
+def _count_waiters(cache,key):
+    event = CountingEvent()
+    cache._in_flight[key].event = event
+    return event
+
+def _wait_for_waiters(event,count):
+    for _ in range(count):
+        assert event.waiters.acquire(timeout=5)
+
+def _run_waiters(cache,compute,count):
+    results = [None] * count
+    def waiter(i):
+        try:
+            results[i] = cache.get_or_compute('key',compute)
+        except Exception as e:
+            results[i] = e
+    threads = [threading.Thread(target=waiter,args=(i,)) for i in range(count)]
+    return results, threads
+
+def test_identical_calls_in_flight_share_one_result():
+    cache = XFLMemoryCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return pd.DataFrame({'x':[1]})
+
+    leader = threading.Thread(target=lambda: cache.get_or_compute('key',compute))
+    leader.start()
+    started.wait(5)
+    event = _count_waiters(cache,'key')
+
+    results, threads = _run_waiters(cache,compute,3)
+    for x in threads:
+        x.start()
+    _wait_for_waiters(event,3)
+    release.set()
+    for x in threads + [leader]:
+        x.join(5)
+
+    assert len(calls) == 1
+    assert all(x['x'].tolist() == [1] for x in results)
+    ## Every waiter gets its own copy.
+    assert len({id(x) for x in results}) == 3
+
+def test_leader_errors_reach_every_waiter():
+    cache = XFLMemoryCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def compute():
+        started.set()
+        release.wait(5)
+        raise RuntimeError('The XFL API is down.')
+
+    leader_results, leader = _run_waiters(cache,compute,1)
+    leader[0].start()
+    started.wait(5)
+    event = _count_waiters(cache,'key')
+
+    results, threads = _run_waiters(cache,compute,3)
+    for x in threads:
+        x.start()
+    _wait_for_waiters(event,3)
+    release.set()
+    for x in threads + leader:
+        x.join(5)
+
+    assert all(isinstance(x,RuntimeError) for x in leader_results + results)
+    ## Errors are never kept, so the next call computes the value again.
+    assert cache.get_or_compute('key',lambda: 'ok') == 'ok'
@@ -0,0 +1,44 @@
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from payloads import GAME_ID, make_play
+from xfl_fast_r.get_xfl import get_xfl_pbp
+from xfl_fast_r.schemas import PBP_DTYPES
+
+## 400 plays, 4 to every `MarkerUTC`, listed newest first, so that sorting by `MarkerUTC` has to break ties.
+TIED_PLAYS = [make_play(100000 + i,1676750000 + (400 - i) // 4 * 30) for i in range(400)]
+
+@pytest.mark.parametrize('output',['pandas','arrow'])
+@pytest.mark.parametrize('batch_size',[37,400,1000])
+def test_batched_pbp_matches_full_parse_with_tied_timestamps(scripted_client,output,batch_size):
+    body = json.dumps(TIED_PLAYS)
+    full = get_xfl_pbp('token',GAME_ID,client=scripted_client([(200,{},body)]),output=output)
+    batched = get_xfl_pbp('token',GAME_ID,client=scripted_client([(200,{},body)]),output=output,batch_size=batch_size)
+
+    if output == 'arrow':
+        assert full.equals(batched)
+    else:
+        pd.testing.assert_frame_equal(full,batched)
+        assert full.index.equals(pd.RangeIndex(len(TIED_PLAYS)))
+
+def test_pbp_ties_keep_the_order_of_the_payload(scripted_client):
+    pbp_df = get_xfl_pbp('token',GAME_ID,client=scripted_client([(200,{},json.dumps(TIED_PLAYS))]))
+
+    expected = sorted(TIED_PLAYS,key=lambda x: x['MarkerUTC'])
+    assert pbp_df['MarkerId'].tolist() == [x['MarkerId'] for x in expected]
+
+@pytest.mark.parametrize('output',['pandas','arrow'])
+def test_batched_pbp_of_a_game_without_plays_is_empty_and_typed(scripted_client,capsys,output):
+    pbp = get_xfl_pbp('token',GAME_ID,client=scripted_client([(200,{},'[]')]),output=output,batch_size=10)
+
+    assert capsys.readouterr().out == ''
+    assert len(pbp) == 0
+    if output == 'arrow':
+        assert pbp.schema.field('MarkerUTC').type == pa.timestamp('s',tz='UTC')
+        assert pbp.schema.field('Quarter').type == pa.int16()
+    else:
+        assert str(pbp['MarkerUTC'].dtype) == PBP_DTYPES['MarkerUTC']
+        assert str(pbp['Quarter'].dtype) == 'Int16'
@@ -0,0 +1,71 @@
+import pytest
+
+from payloads import GAME_ID, make_scoreboard_game
+from xfl_fast_r.live import XFLPollScheduler, get_xfl_game_state
+
+OTHER_GAME_ID = "FOOTBALL_XFL_2023_2_18_ORL@HOU"
+
+@pytest.mark.parametrize('scoreboard,state',[
+    (make_scoreboard_game(status='Scheduled'),'scheduled'),
+    (make_scoreboard_game(status='In Progress',period=0),'scheduled'),
+    (make_scoreboard_game(status='In Progress',period=1,clock_state='Running'),'live'),
+    (make_scoreboard_game(status='In Progress',period=1,clock_state='Stopped',play_clock=25),'stopped'),
+    (make_scoreboard_game(status='In Progress',period=2,clock_state='Stopped',play_clock=25,detail='Halftime'),'break'),
+    (make_scoreboard_game(status='In Progress',period=1,clock_state='Stopped',play_clock=0),'break'),
+    (make_scoreboard_game(status='Final',period=4),'final'),
+    (make_scoreboard_game(status='Final/OT',period=5,clock_state='Running'),'final'),
+])
+def test_get_xfl_game_state(scoreboard,state):
+    assert get_xfl_game_state(scoreboard) == state
+
+class _RecordingScheduler(XFLPollScheduler):
+    """
+    A scheduler that records every fetch, instead of making requests.
+    """
+    def __init__(self,**kwargs):
+        super().__init__('token',datasets=('team_box',),**kwargs)
+        self.fetches = []
+
+    def _fetch(self,game_id,dataset):
+        self.fetches.append((game_id,dataset))
+        return f'{game_id} {dataset}'
+
+def _step(scheduler,scoreboards_json):
+    scheduler.update_scoreboard(scoreboards_json)
+    scheduler.fetches = []
+    scheduler.step()
+    return scheduler.fetches
+
+def test_state_transitions_drive_polling():
+    scheduler = _RecordingScheduler()
+
+    ## A scheduled game is not polled.
+    assert _step(scheduler,[make_scoreboard_game(status='Scheduled')]) == []
+    assert scheduler.states == {GAME_ID:'scheduled'}
+
+    ## The game starts, so it is polled right away, and then not again until its interval has passed.
+    assert _step(scheduler,[make_scoreboard_game(status='In Progress',period=1,clock_state='Running')]) == [(GAME_ID,'team_box')]
+    assert _step(scheduler,[make_scoreboard_game(status='In Progress',period=1,clock_state='Running')]) == []
+
+    ## The game ends, so it is polled one last time, and then never again.
+    assert _step(scheduler,[make_scoreboard_game(status='Final',period=4)]) == [(GAME_ID,'team_box')]
+    assert _step(scheduler,[make_scoreboard_game(status='Final',period=4)]) == []
+    assert scheduler.states == {GAME_ID:'final'}
+
+def test_game_that_was_already_final_is_not_polled():
+    scheduler = _RecordingScheduler()
+    assert _step(scheduler,[make_scoreboard_game(status='Final',period=4)]) == []
+
+def test_only_followed_games_are_polled():
+    scheduler = _RecordingScheduler(game_ids=[OTHER_GAME_ID])
+    live = dict(status='In Progress',period=1,clock_state='Running')
+
+    assert _step(scheduler,[make_scoreboard_game(GAME_ID,**live),make_scoreboard_game(OTHER_GAME_ID,**live)]) == [(OTHER_GAME_ID,'team_box')]
+
+def test_run_stops_once_every_game_is_final():
+    scheduler = _RecordingScheduler(intervals={'live':0})
+    scheduler.update_scoreboard([make_scoreboard_game(status='In Progress',period=1,clock_state='Running')])
+    scheduler.update_scoreboard([make_scoreboard_game(status='Final',period=4)])
+    scheduler.scoreboard_interval = 3600
+
+    assert list(scheduler.run()) == [(GAME_ID,'team_box',f'{GAME_ID} team_box')]
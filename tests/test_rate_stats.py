@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from xfl_fast_r.get_xfl import _parse_xfl_game_participation, _parse_xfl_player_box
+from xfl_fast_r.rate_stats import calculate_rate_stats, nfl_passer_rating, PLAYER_BOX_RATE_STATS
+
+GAME_ID = "FOOTBALL_XFL_2023_2_18_VGS@ARL"
+
+class _Record(dict):
+    """
+    A payload record where every key that is not set is `None`.
+    """
+    def __missing__(self,key):
+        return None
+
+## `PassCompPercent` and `PassYardsPerAtt` are reported by the XFL API, and do not match the counting stats here,
+## so that a rating recalculated from the counting stats would be different.
+PLAYERSTATS = [
+    {'OfficialId':1001,'PassComp':10,'PassAtt':20,'PassCompPercent':0.7,'PassYards':100,'PassYardsPerAtt':9,'PassTD':2,'PassINT':0},
+    {'OfficialId':1002,'PassComp':15,'PassAtt':30,'PassCompPercent':0.5,'PassYards':150,'PassYardsPerAtt':4,'PassTD':0,'PassINT':3},
+    {'OfficialId':1003,'RushAtt':12,'RushYards':40},
+]
+
+def _participation(output:str):
+    players = [_Record(OfficialId=x['OfficialId'],VisOrHome='V',Participated=True,IsStarting=True,Scratch=False) for x in PLAYERSTATS]
+    return _parse_xfl_game_participation(players,GAME_ID,output=output)
+
+@pytest.mark.parametrize('output',['pandas','arrow'])
+def test_player_box_nfl_qbr_uses_api_rates(output):
+    box = _parse_xfl_player_box(PLAYERSTATS,_participation(output),GAME_ID,output=output)
+    if output == 'arrow':
+        nfl_qbr = dict(zip(box['OfficialID'].to_pylist(),box['NFL_QBR'].to_numpy(zero_copy_only=False)))
+    else:
+        nfl_qbr = box.set_index('OfficialID')['NFL_QBR']
+
+    ## ((0.7 - 0.3) * 5 + (9 - 3) * 0.25 + 2 / 20 * 20 + 2.375) / 6 * 100
+    assert nfl_qbr[1001] == pytest.approx(131.25)
+    ## ((0.5 - 0.3) * 5 + (4 - 3) * 0.25 + 0 + 0) / 6 * 100, since 2.375 - 3 / 30 * 25 is below 0.
+    assert nfl_qbr[1002] == pytest.approx(20.833333)
+    assert np.isnan(nfl_qbr[1003])
+
+def test_season_nfl_qbr_uses_counting_stats():
+    df = pd.DataFrame(PLAYERSTATS[:2])
+    expected = nfl_passer_rating(df['PassComp'],df['PassAtt'],df['PassYards'],df['PassTD'],df['PassINT'])
+    player_box = calculate_rate_stats(df,PLAYER_BOX_RATE_STATS)['NFL_QBR']
+
+    assert expected == pytest.approx([97.916667,25.0])
+    assert not np.allclose(expected,player_box)
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from xfl_fast_r.client import XFLCircuitBreaker, XFLCircuitOpenError, XFLRateLimiter, XFLRetryPolicy
+
+URL = 'https://api.xfl.com/scoring/v3.30/standings'
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replaces `time.monotonic()` in `xfl_fast_r.client` with a clock that only moves when ```clock[0]``` is changed.
+    """
+    now = [1000.0]
+    monkeypatch.setattr('xfl_fast_r.client.time.monotonic',lambda: now[0])
+    return now
+
+###################################################################################################################################################################################################################
+##
+##      Retry-After
+##
+###################################################################################################################################################################################################################
+
+def test_retry_after_seconds_are_waited(scripted_client,no_sleep):
+    client = scripted_client([(503,{'Retry-After':'7'},''),(200,{},'{}')])
+    response = client.get(URL)
+
+    assert response.status_code == 200
+    assert no_sleep == [7]
+    assert len(client.session.get_adapter('https://').requests) == 2
+
+def test_retry_after_dates_are_waited():
+    policy = XFLRetryPolicy()
+    response = requests.Response()
+    response.headers['Retry-After'] = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20),usegmt=True)
+
+    assert 18 <= policy.get_retry_after(response) <= 20
+
+def test_retry_after_is_capped_by_max_backoff(scripted_client,no_sleep):
+    client = scripted_client([(429,{'Retry-After':'3600'},''),(200,{},'{}')],retry=XFLRetryPolicy(max_backoff=5))
+    client.get(URL)
+
+    assert no_sleep == [5]
+
+def test_retry_after_pauses_the_rate_limiter(scripted_client,clock,monkeypatch):
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    sleeps = []
+    monkeypatch.setattr('xfl_fast_r.client.time.sleep',sleep)
+
+    rate_limiter = XFLRateLimiter(rate=100)
+    client = scripted_client([(503,{'Retry-After':'7'},''),(200,{},'{}')],rate_limiter=rate_limiter)
+    start = clock[0]
+    client.get(URL)
+
+    ## Every request waits for the pause, not just the one that was retried.
+    assert sleeps[0] == 7
+    assert rate_limiter._paused_until == start + 7
+    assert clock[0] >= start + 7
+
+def test_invalid_retry_after_falls_back_to_backoff(scripted_client,no_sleep):
+    client = scripted_client([(503,{'Retry-After':'soon'},''),(200,{},'{}')],retry=XFLRetryPolicy(backoff_factor=0.5))
+    client.get(URL)
+
+    assert len(no_sleep) == 1
+    assert 0 <= no_sleep[0] <= 0.5
+
+def test_errors_are_raised_after_every_retry(scripted_client,no_sleep):
+    client = scripted_client([(503,{},'')],retry=XFLRetryPolicy(max_retries=2),circuit_breaker=False)
+    with pytest.raises(requests.HTTPError):
+        client.get(URL)
+
+    assert len(client.session.get_adapter('https://').requests) == 3
+    assert len(no_sleep) == 2
+
+def test_other_errors_are_not_retried(scripted_client,no_sleep):
+    client = scripted_client([(404,{},'')])
+    with pytest.raises(requests.HTTPError):
+        client.get(URL)
+
+    assert len(client.session.get_adapter('https://').requests) == 1
+    assert no_sleep == []
+
+###################################################################################################################################################################################################################
+##
+##      Circuit Breaker
+##
+###################################################################################################################################################################################################################
+
+def test_breaker_opens_half_opens_and_closes(clock):
+    breaker = XFLCircuitBreaker(failure_threshold=3,reset_timeout=30)
+
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record_failure()
+    assert breaker.state == 'closed'
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    with pytest.raises(XFLCircuitOpenError):
+        breaker.before_request()
+
+    clock[0] += 30
+    assert breaker.state == 'half-open'
+
+    ## Only one trial request is allowed through at a time.
+    breaker.before_request()
+    with pytest.raises(XFLCircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    breaker.before_request()
+
+def test_failed_trial_opens_the_breaker_again(clock):
+    breaker = XFLCircuitBreaker(failure_threshold=1,reset_timeout=30)
+    breaker.record_failure()
+
+    clock[0] += 30
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.state == 'open'
+    clock[0] += 29
+    with pytest.raises(XFLCircuitOpenError):
+        breaker.before_request()
+
+def test_open_breaker_stops_requests(scripted_client,no_sleep,clock):
+    breaker = XFLCircuitBreaker(failure_threshold=2,reset_timeout=30)
+    client = scripted_client([(503,{},''),(503,{},''),(200,{},'{}')],retry=False,circuit_breaker=breaker)
+    adapter = client.session.get_adapter('https://')
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.get(URL)
+    assert breaker.state == 'open'
+
+    with pytest.raises(XFLCircuitOpenError):
+        client.get(URL)
+    assert len(adapter.requests) == 2
+
+    clock[0] += 30
+    assert client.get(URL).status_code == 200
+    assert breaker.state == 'closed'
+
+def test_other_errors_do_not_open_the_breaker(scripted_client,no_sleep):
+    breaker = XFLCircuitBreaker(failure_threshold=1)
+    client = scripted_client([(404,{},'')],circuit_breaker=breaker)
+    with pytest.raises(requests.HTTPError):
+        client.get(URL)
+
+    assert breaker.state == 'closed'
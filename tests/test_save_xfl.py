@@ -0,0 +1,107 @@
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from payloads import GAME_ID
+from xfl_fast_r.load_xfl import load_xfl_transactions
+from xfl_fast_r.save_xfl import XFLParquetWriter, get_xfl_week
+from xfl_fast_r.utils import atomic_write
+
+def _pbp(game_id=GAME_ID,plays=3,**columns):
+    return pd.DataFrame({'Season':2023,'game_id':game_id,'MarkerId':range(plays),**columns})
+
+def _transactions():
+    return pd.DataFrame({
+        'season':[2023,2023],'team_id':['ARL','VGS'],'team_logo_url':['',''],'date':['2/18/2023','2/19/2023'],
+        'player_name':['A','B'],'player_position':['QB','WR'],'transaction_type':['Signed','Released']
+    })
+
+def _files(root):
+    return sorted(os.path.relpath(os.path.join(d,x),root) for d,_,files in os.walk(root) for x in files)
+
+def test_game_data_is_partitioned_by_season_week_and_game(tmp_path):
+    writer = XFLParquetWriter(str(tmp_path))
+    path = writer.write_game('pbp',_pbp(),GAME_ID)
+
+    assert get_xfl_week(GAME_ID) == 1
+    assert path == os.path.join(str(tmp_path),'pbp','Season=2023','Week=1',f'game_id={GAME_ID}','part-0.parquet')
+    assert _files(tmp_path) == [os.path.join('pbp','Season=2023','Week=1',f'game_id={GAME_ID}','part-0.parquet'),os.path.join('pbp','_common_metadata')]
+
+    ## The partition columns are only stored in the directory names.
+    assert pq.read_schema(path).names == ['MarkerId']
+
+def test_season_data_keeps_columns_it_is_not_partitioned_by(tmp_path):
+    writer = XFLParquetWriter(str(tmp_path))
+    path = writer.write_season('schedule',pd.DataFrame({'Season':[2023],'Week':[1],'EventId':[GAME_ID]}),2023)
+
+    assert path == os.path.join(str(tmp_path),'schedule','Season=2023','part-0.parquet')
+    assert pq.read_schema(path).names == ['Week','EventId']
+
+def test_weekly_snapshots_are_saved_to_their_own_dataset(tmp_path):
+    writer = XFLParquetWriter(str(tmp_path))
+    path = writer.write_season('rosters',pd.DataFrame({'Season':[2023],'OfficialID':[1]}),2023,week=5)
+
+    assert path == os.path.join(str(tmp_path),'rosters','weekly','Season=2023','Week=5','part-0.parquet')
+    with pytest.raises(ValueError):
+        writer.write_season('schedule',pd.DataFrame({'Season':[2023]}),2023,week=5)
+
+def test_common_metadata_has_every_column(tmp_path):
+    writer = XFLParquetWriter(str(tmp_path))
+    writer.write_game('pbp',_pbp(PenaltyYards=[None,5,None]),GAME_ID)
+    writer.write_game('pbp',_pbp('FOOTBALL_XFL_2023_2_19_ORL@HOU',Comments=['a','b','c']),'FOOTBALL_XFL_2023_2_19_ORL@HOU')
+
+    schema = pq.read_schema(os.path.join(str(tmp_path),'pbp','_common_metadata'))
+    assert sorted(schema.names) == ['Comments','MarkerId','PenaltyYards']
+
+def test_saving_a_partition_again_replaces_it(tmp_path):
+    writer = XFLParquetWriter(str(tmp_path))
+    writer.write_game('pbp',_pbp(plays=3),GAME_ID)
+    path = writer.write_game('pbp',_pbp(plays=5),GAME_ID)
+
+    assert pq.read_table(path).num_rows == 5
+    assert len([x for x in _files(tmp_path) if x.endswith('.parquet')]) == 1
+
+def test_empty_data_is_not_saved(tmp_path):
+    writer = XFLParquetWriter(str(tmp_path))
+    assert writer.write_game('pbp',_pbp(plays=0),GAME_ID) == None
+    assert _files(tmp_path) == []
+
+def test_interrupted_write_keeps_the_old_partition(tmp_path,monkeypatch):
+    writer = XFLParquetWriter(str(tmp_path))
+    path = writer.write_game('pbp',_pbp(plays=3),GAME_ID)
+
+    def interrupted_write_table(table,where,**kwargs):
+        with open(where,'wb') as f:
+            f.write(b'PAR1')
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr('xfl_fast_r.save_xfl.pq.write_table',interrupted_write_table)
+    with pytest.raises(KeyboardInterrupt):
+        writer.write_game('pbp',_pbp(plays=5),GAME_ID)
+
+    assert pq.read_table(path).num_rows == 3
+    ## The temporary file is removed.
+    assert len(_files(tmp_path)) == 2
+
+def test_atomic_write_bytes_and_functions(tmp_path):
+    path = os.path.join(str(tmp_path),'a','b.json')
+    atomic_write(path,b'{}')
+    with open(path,'rb') as f:
+        assert f.read() == b'{}'
+
+    atomic_write(path,lambda tmp_path: pq.write_table(pa.table({'x':[1]}),tmp_path))
+    assert pq.read_table(path)['x'].to_pylist() == [1]
+
+def test_transactions_have_one_season_column(tmp_path):
+    writer = XFLParquetWriter(str(tmp_path))
+    path = writer.write_season('transactions',_transactions(),2023)
+    assert 'season' not in pq.read_schema(path).names
+
+    transactions_df = load_xfl_transactions(2023,source=str(tmp_path))
+    assert list(transactions_df.columns) == list(_transactions().columns)
+    assert transactions_df['season'].tolist() == [2023,2023]
+
+    assert load_xfl_transactions(2023,columns=['season','team_id'],source=str(tmp_path)).columns.tolist() == ['season','team_id']
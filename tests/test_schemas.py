@@ -0,0 +1,78 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from payloads import GAME_ID, HOME, VISITOR, ARL_LOGO, VGS_LOGO, make_play, make_player, make_player_stats, make_scoreboard_game, make_standing, \
+    make_team_stats, make_transactions_html
+from xfl_fast_r.get_xfl import _parse_xfl_game_participation, _parse_xfl_pbp, _parse_xfl_player_box, _parse_xfl_rosters, _parse_xfl_schedule, \
+    _parse_xfl_standings, _parse_xfl_team_box, _parse_xfl_transactions
+from xfl_fast_r.schemas import GAME_PARTICIPATION_DTYPES, PBP_DTYPES, PLAYER_BOX_DTYPES, ROSTER_DTYPES, SCHEDULE_DTYPES, STANDINGS_DTYPES, \
+    TEAM_BOX_DTYPES, TRANSACTIONS_DTYPES
+
+PLAYERS = [make_player(i,HOME if i % 2 else VISITOR,'H' if i % 2 else 'V',('QB','WR','RB','LB')[i % 4]) for i in range(1,91)]
+
+def _participation(output='pandas'):
+    return _parse_xfl_game_participation(PLAYERS,GAME_ID,output=output)
+
+TRANSACTIONS = [(ARL_LOGO,'2/18/2023','A','QB','Signed'),(VGS_LOGO,'2/19/2023','B','WR','Released')]
+
+## Every parser, and the dtype schema it applies, called with ```output```.
+PARSED = {
+    'participation':(lambda output='pandas': _participation(output),GAME_PARTICIPATION_DTYPES),
+    'player_box':(lambda output='pandas': _parse_xfl_player_box([make_player_stats(i) for i in range(1,91)],_participation(output),GAME_ID,output=output),PLAYER_BOX_DTYPES),
+    'team_box':(lambda output='pandas': _parse_xfl_team_box([make_team_stats(VISITOR,1),make_team_stats(HOME,2)],GAME_ID,output=output),TEAM_BOX_DTYPES),
+    'pbp':(lambda output='pandas': _parse_xfl_pbp([make_play(i,1676750000 + i * 20) for i in range(100)],GAME_ID,output=output),PBP_DTYPES),
+    'rosters':(lambda output='pandas': _parse_xfl_rosters(PLAYERS,week=3,output=output),ROSTER_DTYPES),
+    'schedule':(lambda output='pandas': _parse_xfl_schedule([make_scoreboard_game(),make_scoreboard_game('FOOTBALL_XFL_2023_2_19_ORL@HOU')],output=output),SCHEDULE_DTYPES),
+    'standings':(lambda output='pandas': _parse_xfl_standings([make_standing(HOME,1),make_standing(VISITOR,2)],output=output),STANDINGS_DTYPES),
+    'transactions':(lambda output='pandas': _parse_xfl_transactions(make_transactions_html(TRANSACTIONS),output=output),TRANSACTIONS_DTYPES)
+}
+
+def _inferred(df:pd.DataFrame):
+    """
+    Returns ```df``` with the dtypes pandas infers from its values, as the parsers returned before dtype schemas were applied.
+    """
+    return pd.DataFrame({x:df[x].astype(object).where(df[x].notna(),None).tolist() for x in df.columns})
+
+def _memory_usage(df:pd.DataFrame):
+    return df.memory_usage(deep=True,index=False).sum()
+
+@pytest.mark.parametrize('name',list(PARSED))
+def test_parsers_apply_their_dtype_schema(name):
+    parse, dtypes = PARSED[name]
+    df = parse()
+
+    checked = [x for x in df.columns if x in dtypes]
+    assert len(checked) > 0
+    for column in checked:
+        assert str(df[column].dtype) == dtypes[column], column
+
+def test_timestamps_and_flags():
+    pbp_df = PARSED['pbp'][0]()
+    assert pbp_df['MarkerUTC'].iloc[0] == pd.Timestamp(1676750000,unit='s',tz='UTC')
+    assert pbp_df['IsOfficial'].tolist() == [True] * 100
+
+    participation_df = _participation()
+    assert participation_df['IsStarting'].tolist() == [bool(i % 2) for i in range(1,91)]
+
+@pytest.mark.parametrize('name,max_ratio',[('pbp',0.55),('player_box',0.7)])
+def test_dtype_schemas_use_less_memory(name,max_ratio):
+    df = PARSED[name][0]()
+    assert _memory_usage(df) < max_ratio * _memory_usage(_inferred(df))
+
+@pytest.mark.parametrize('name',list(PARSED))
+def test_arrow_output_matches_pandas_output(name):
+    parse, dtypes = PARSED[name]
+    df = parse('pandas')
+    table = parse('arrow')
+
+    assert isinstance(table,pa.Table)
+    assert table.column_names == list(df.columns)
+    assert table.to_pylist() == pa.Table.from_pandas(df,preserve_index=False).to_pylist()
+
+    ## Categories are dictionary-encoded, and every other column in the schema has the same type.
+    for column in table.column_names:
+        if dtypes.get(column) == 'category':
+            assert pa.types.is_dictionary(table.schema.field(column).type), column
+        elif column in dtypes:
+            assert table.schema.field(column).type == pa.Schema.from_pandas(df[[column]],preserve_index=False).field(column).type, column
@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+from payloads import GAME_ID, make_scoreboard_game
+from xfl_fast_r.live import XFLScoreboardHub
+
+OTHER_GAME_ID = "FOOTBALL_XFL_2023_2_18_ORL@HOU"
+
+def _games(home_score=0,other_home_score=0,now_utc=1676750000):
+    return [
+        make_scoreboard_game(GAME_ID,status='In Progress',period=1,home_score=home_score,now_utc=now_utc),
+        make_scoreboard_game(OTHER_GAME_ID,status='In Progress',period=1,home_score=other_home_score,now_utc=now_utc)
+    ]
+
+def test_only_changed_games_are_sent():
+    hub = XFLScoreboardHub('token')
+    received = []
+    hub.subscribe(callback=received.append)
+
+    assert sorted(hub.update(_games())) == sorted([GAME_ID,OTHER_GAME_ID])
+    assert sorted(received[-1]['EventId'].tolist()) == sorted([GAME_ID,OTHER_GAME_ID])
+
+    ## `NowUTC` changes on every request, so it does not count as a change.
+    assert hub.update(_games(now_utc=1676750030)) == []
+    assert len(received) == 1
+
+    assert hub.update(_games(home_score=7)) == [GAME_ID]
+    assert received[-1]['EventId'].tolist() == [GAME_ID]
+    assert received[-1]['HomeScore'].tolist() == [7]
+
+def test_subscribers_only_receive_the_games_they_follow():
+    hub = XFLScoreboardHub('token')
+    followers = []
+    hub.subscribe(callback=followers.append,game_ids=[OTHER_GAME_ID])
+
+    hub.update(_games())
+    hub.update(_games(home_score=7))
+
+    assert len(followers) == 1
+    assert followers[0]['EventId'].tolist() == [OTHER_GAME_ID]
+
+def test_new_subscribers_receive_the_current_scoreboard():
+    hub = XFLScoreboardHub('token')
+    hub.update(_games(home_score=3))
+
+    received = []
+    hub.subscribe(callback=received.append,game_ids=[GAME_ID])
+    assert received[0]['HomeScore'].tolist() == [3]
+
+    hub.subscribe(callback=received.append,send_current=False)
+    assert len(received) == 1
+
+def test_unsubscribed_callbacks_are_not_called():
+    hub = XFLScoreboardHub('token')
+    received = []
+    subscriber_id = hub.subscribe(callback=received.append)
+    hub.unsubscribe(subscriber_id)
+
+    hub.update(_games())
+    assert received == []
+
+def test_one_request_per_update_for_every_subscriber(scripted_client):
+    client = scripted_client([(200,{},json.dumps(_games()))])
+    hub = XFLScoreboardHub('token',client=client)
+    received = [[],[],[]]
+    for x in received:
+        hub.subscribe(callback=x.append)
+
+    hub.update()
+
+    assert len(client.session.get_adapter('https://').requests) == 1
+    assert all(len(x) == 1 for x in received)
+
+def test_queues_are_filled_from_their_event_loop():
+    async def main():
+        hub = XFLScoreboardHub('token')
+        queue = asyncio.Queue()
+        hub.subscribe(queue=queue)
+
+        await asyncio.get_running_loop().run_in_executor(None,hub.update,_games())
+        return await asyncio.wait_for(queue.get(),timeout=5)
+
+    data = asyncio.run(main())
+    assert sorted(data['EventId'].tolist()) == sorted([GAME_ID,OTHER_GAME_ID])
@@ -0,0 +1,125 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pytest
+
+from payloads import make_player, make_player_stats
+from xfl_fast_r.get_xfl import _SEASON_MAX_COLUMNS, _SEASON_STATS_COLUMNS, _SEASON_SUM_COLUMNS, _parse_xfl_game_participation, _parse_xfl_player_box, \
+    generate_xfl_season_stats
+from xfl_fast_r.rate_stats import add_rate_stats, SEASON_RATE_STATS
+from xfl_fast_r.save_xfl import XFLParquetWriter
+from xfl_fast_r.schemas import restore_categories
+
+@pytest.mark.parametrize('games_df',[pd.DataFrame(),pd.DataFrame({'game_id':pd.Series([],dtype='str')})])
+def test_incremental_update_without_state_or_new_games(tmp_path,games_df):
+    season_df = generate_xfl_season_stats(games_df,state_path=str(tmp_path / 'season_stats.parquet'))
+
+    assert len(season_df) == 0
+    assert list(season_df.columns) == _SEASON_STATS_COLUMNS
+
+###################################################################################################################################################################################################################
+##
+##      Season Totals
+##
+###################################################################################################################################################################################################################
+
+GAME_IDS = ["FOOTBALL_XFL_2023_2_18_VGS@ARL","FOOTBALL_XFL_2023_2_25_ARL@HOU","FOOTBALL_XFL_2023_3_4_SA@ARL"]
+
+## Player 7 is traded from ARL to VGS before the last game.
+TRADED_PLAYER = 7
+
+def _game_logs():
+    """
+    Returns the player box scores of three games, with the dtypes `get_xfl_player_box()` returns.
+    """
+    game_dfs = []
+    for n,game_id in enumerate(GAME_IDS):
+        players = [make_player(i,'VGS' if i == TRADED_PLAYER and n == 2 else 'ARL',position=('QB','WR','RB','LB')[i % 4]) for i in range(1,11)]
+        stats = [make_player_stats(i,PassAtt=(i + n) % 4 * 10,PassComp=(i + n) % 4 * 6,PassYardsLong=(i * 7 + n * 11) % 40) for i in range(1,11)]
+        participation_df = _parse_xfl_game_participation(players,game_id)
+        game_dfs.append(_parse_xfl_player_box(stats,participation_df,game_id))
+
+    return restore_categories(pd.concat(game_dfs,ignore_index=True),game_dfs[0])
+
+def _old_season_totals(games_df:pd.DataFrame):
+    """
+    The season totals as they were calculated before they were aggregated in one pass:
+    one grouped sum and one grouped max on the player's season, team and name, merged back together.
+    """
+    keys = ['Season','OfficialID','TeamId','FirstName','LastName']
+    stats_df = games_df.reindex(columns=_SEASON_SUM_COLUMNS + _SEASON_MAX_COLUMNS).astype('float64').fillna(0)
+    keys_df = games_df[keys].astype({x:'str' for x in keys if isinstance(games_df[x].dtype,pd.CategoricalDtype)})
+    stats_df = pd.concat([keys_df,stats_df],axis=1)
+
+    sum_df = stats_df.groupby(keys,as_index=False,dropna=False)[_SEASON_SUM_COLUMNS].sum()
+    max_df = stats_df.groupby(keys,as_index=False,dropna=False)[_SEASON_MAX_COLUMNS].max()
+    return pd.merge(sum_df,max_df,on=keys,how='left')
+
+def _sorted(df:pd.DataFrame):
+    df = df.sort_values(by=['Season','OfficialID'],ignore_index=True)
+    return df.astype({x:'str' for x,dtype in df.dtypes.items() if isinstance(dtype,pd.CategoricalDtype)})
+
+def test_one_pass_matches_the_old_season_totals():
+    games_df = _game_logs()
+    season_df = _sorted(generate_xfl_season_stats(games_df))
+
+    old_df = _old_season_totals(games_df)
+    not_traded = old_df['OfficialID'] != TRADED_PLAYER
+    expected = _sorted(add_rate_stats(old_df[not_traded],SEASON_RATE_STATS).reindex(columns=_SEASON_STATS_COLUMNS))
+
+    pd.testing.assert_frame_equal(season_df[season_df['OfficialID'] != TRADED_PLAYER].reset_index(drop=True),expected,check_dtype=False)
+
+    ## A traded player has one row, with the stats from both teams, and the team they played for last.
+    traded_df = season_df[season_df['OfficialID'] == TRADED_PLAYER]
+    old_traded_df = old_df[~not_traded]
+    assert len(traded_df) == 1
+    assert len(old_traded_df) == 2
+    assert traded_df['TeamId'].iloc[0] == 'VGS'
+    for column in [x for x in _SEASON_SUM_COLUMNS if x in season_df.columns]:
+        assert traded_df[column].iloc[0] == old_traded_df[column].sum(), column
+    for column in _SEASON_MAX_COLUMNS:
+        assert traded_df[column].iloc[0] == old_traded_df[column].max(), column
+
+###################################################################################################################################################################################################################
+##
+##      Local Sources
+##
+###################################################################################################################################################################################################################
+
+def _write_table(tmp_path,games_df:pd.DataFrame):
+    return pa.Table.from_pandas(games_df,preserve_index=False)
+
+def _write_parquet_file(tmp_path,games_df:pd.DataFrame):
+    path = str(tmp_path / '2023_xfl_player_game_stats.parquet')
+    games_df.to_parquet(path,index=False)
+    return path
+
+def _write_ipc_file(tmp_path,games_df:pd.DataFrame):
+    path = str(tmp_path / '2023_xfl_player_game_stats.arrow')
+    feather.write_feather(pa.Table.from_pandas(games_df,preserve_index=False),path)
+    return path
+
+def _write_directory(tmp_path,games_df:pd.DataFrame):
+    for game_id,game_df in games_df.groupby('game_id',observed=True):
+        game_df.to_parquet(str(tmp_path / f'{game_id}.parquet'),index=False)
+    return str(tmp_path)
+
+def _write_writer_root(tmp_path,games_df:pd.DataFrame):
+    writer = XFLParquetWriter(str(tmp_path))
+    for game_id,game_df in games_df.groupby('game_id',observed=True):
+        writer.write_game('player_box',game_df,game_id)
+    return str(tmp_path)
+
+@pytest.mark.parametrize('write_source',[_write_table,_write_parquet_file,_write_ipc_file,_write_directory,_write_writer_root])
+def test_local_sources_match_games_df(tmp_path,write_source):
+    games_df = _game_logs()
+    expected = _sorted(generate_xfl_season_stats(games_df))
+
+    season_df = _sorted(generate_xfl_season_stats(source=write_source(tmp_path,games_df)))
+
+    pd.testing.assert_frame_equal(season_df,expected,check_dtype=False)
+
+def test_games_df_and_source_can_not_both_be_set(tmp_path):
+    games_df = _game_logs()
+    with pytest.raises(ValueError):
+        generate_xfl_season_stats(games_df,source=_write_table(tmp_path,games_df))
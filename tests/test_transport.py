@@ -0,0 +1,102 @@
+import gzip
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import ScriptedAdapter
+from payloads import GAME_ID, make_play
+from xfl_fast_r.client import XFLClient
+from xfl_fast_r.get_xfl import get_xfl_pbp
+from xfl_fast_r.transport import XFLRecordingAdapter, XFLReplayAdapter, get_fixture_path
+
+PLAYS = [make_play(100000 + i,1676750000 + i * 30) for i in range(20)]
+TOKEN = 'secret-token-1234'
+
+class ScriptedRecordingAdapter(XFLRecordingAdapter,ScriptedAdapter):
+    """
+    A `XFLRecordingAdapter` that records the responses of a `ScriptedAdapter`, instead of the network.
+    """
+
+def _fixture_files(fixture_dir):
+    return [os.path.join(root,x) for root,_,files in os.walk(fixture_dir) for x in files]
+
+def _record_pbp(fixture_dir,responses):
+    with XFLClient(memory_cache=False,transport=ScriptedRecordingAdapter(str(fixture_dir),responses=responses)) as client:
+        return get_xfl_pbp(TOKEN,GAME_ID,client=client)
+
+def test_replay_round_trip(tmp_path):
+    recorded = _record_pbp(tmp_path,[(200,{'Content-Type':'application/json'},json.dumps(PLAYS))])
+
+    ## API tokens are never recorded, so any token matches the recorded responses.
+    with XFLClient(memory_cache=False,transport=XFLReplayAdapter(str(tmp_path))) as client:
+        replayed = get_xfl_pbp('another-token',GAME_ID,client=client)
+
+    pd.testing.assert_frame_equal(recorded,replayed)
+
+def test_tokens_are_never_recorded(tmp_path):
+    _record_pbp(tmp_path,[(200,{},json.dumps(PLAYS))])
+
+    files = _fixture_files(tmp_path)
+    assert len(files) == 2
+    for path in files:
+        assert TOKEN not in path
+        with open(path,'rb') as f:
+            assert TOKEN.encode('utf-8') not in f.read()
+
+def test_compressed_bodies_are_recorded_decompressed(tmp_path):
+    body = gzip.compress(json.dumps(PLAYS).encode('utf-8'))
+    recorded = _record_pbp(tmp_path,[(200,{'Content-Encoding':'gzip','Content-Length':str(len(body))},body)])
+
+    [body_path] = [x for x in _fixture_files(tmp_path) if x.endswith('.body')]
+    with open(body_path,'rb') as f:
+        assert json.loads(f.read()) == PLAYS
+    with open(body_path[:-len('.body')] + '.json') as f:
+        meta = json.load(f)
+    assert 'Content-Encoding' not in meta['headers']
+
+    with XFLClient(memory_cache=False,transport=XFLReplayAdapter(str(tmp_path))) as client:
+        pd.testing.assert_frame_equal(recorded,get_xfl_pbp('token',GAME_ID,client=client))
+
+def test_not_modified_responses_are_not_recorded(tmp_path):
+    adapter = ScriptedRecordingAdapter(str(tmp_path),responses=[(304,{},'')])
+    with XFLClient(memory_cache=False,transport=adapter) as client:
+        client.session.get(f'https://api.xfl.com/scoring/v3.30/markeractivity?game={GAME_ID}')
+
+    assert _fixture_files(tmp_path) == []
+
+def test_missing_fixture_raises(tmp_path):
+    with XFLClient(memory_cache=False,transport=XFLReplayAdapter(str(tmp_path))) as client:
+        with pytest.raises(FileNotFoundError):
+            get_xfl_pbp('token',GAME_ID,client=client)
+
+def test_fixture_paths_ignore_tokens_and_parameter_order(tmp_path):
+    url = 'https://api.xfl.com/scoring/v3.30/markeractivity'
+    path = get_fixture_path(str(tmp_path),'GET',f'{url}?game={GAME_ID}&access_token=a&x=1')
+
+    assert path == get_fixture_path(str(tmp_path),'get',f'{url}?x=1&access_token=b&game={GAME_ID}')
+    assert path != get_fixture_path(str(tmp_path),'GET',f'{url}?game={GAME_ID}&x=2')
+    assert path.startswith(os.path.join(str(tmp_path),'api.xfl.com','scoring','v3.30','markeractivity',''))
+
+@pytest.mark.parametrize('latency,expected',[(None,[]),(0,[]),(0.25,[0.25]),('recorded',[1.5])])
+def test_replay_latency(tmp_path,monkeypatch,latency,expected):
+    _record_pbp(tmp_path,[(200,{},json.dumps(PLAYS))])
+    [meta_path] = [x for x in _fixture_files(tmp_path) if x.endswith('.json')]
+    with open(meta_path) as f:
+        meta = json.load(f)
+    meta['elapsed'] = 1.5
+    with open(meta_path,'w') as f:
+        json.dump(meta,f)
+
+    sleeps = []
+    monkeypatch.setattr('xfl_fast_r.transport.time.sleep',sleeps.append)
+    with XFLClient(memory_cache=False,transport=XFLReplayAdapter(str(tmp_path),latency=latency)) as client:
+        get_xfl_pbp('token',GAME_ID,client=client)
+
+    assert sleeps == expected
+
+@pytest.mark.parametrize('latency',[-1,'fast'])
+def test_invalid_latency_raises(tmp_path,latency):
+    with pytest.raises(ValueError):
+        XFLReplayAdapter(str(tmp_path),latency=latency)
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+import xfl_fast_r.utils
+from xfl_fast_r.utils import get_json_backend, iter_json_array, json_loads, set_json_backend, JSON_BACKEND_ENV_VAR
+
+def _chunks(document:str,size:int):
+    data = document.encode('utf-8')
+    return [data[i:i + size] for i in range(0,len(data),size)]
+
+@pytest.mark.parametrize('size',[1,2,3,7,1 << 16])
+@pytest.mark.parametrize('document',[
+    '[]',
+    '[ ]',
+    '[1, 2 ,3]\n',
+    '[1500.5e3,-0.25,true,null]',
+    '[{"Descriptor_":"café, \\"ok\\"","Participants":[{"Role":"Passer"}]},[1,[2]],"x,]"]',
+])
+def test_matches_json_loads(document,size):
+    assert list(iter_json_array(_chunks(document,size))) == json.loads(document)
+
+@pytest.mark.parametrize('size',[1,3,1 << 16])
+@pytest.mark.parametrize('document',['[1 2]','[1,,2]','[,1]','[1,]','[1]x','[1','','{}'])
+def test_malformed_arrays_raise(document,size):
+    with pytest.raises(ValueError):
+        list(iter_json_array(_chunks(document,size)))
+
+###################################################################################################################################################################################################################
+##
+##      JSON Backends
+##
+###################################################################################################################################################################################################################
+
+@pytest.fixture
+def json_backend():
+    """
+    Restores the JSON backend that was in use before the test.
+    """
+    backend = xfl_fast_r.utils.get_json_backend()
+    yield
+    set_json_backend(backend)
+
+def test_set_and_get_json_backend(json_backend):
+    assert set_json_backend('json') == 'json'
+    assert get_json_backend() == 'json'
+
+    with pytest.raises(ValueError):
+        set_json_backend('simplejson')
+    assert get_json_backend() == 'json'
+
+def test_missing_orjson(json_backend,monkeypatch):
+    monkeypatch.setattr('xfl_fast_r.utils.orjson',None)
+
+    with pytest.raises(ImportError):
+        set_json_backend('orjson')
+    assert set_json_backend('auto') == 'json'
+
+@pytest.mark.parametrize('value,backend',[('JSON','json'),(' json ','json'),('ORJSON','orjson')])
+def test_json_backend_env_var_is_not_case_sensitive(json_backend,monkeypatch,value,backend):
+    pytest.importorskip('orjson')
+    monkeypatch.setenv(JSON_BACKEND_ENV_VAR,value)
+
+    assert xfl_fast_r.utils._set_json_backend_from_env() == backend
+
+@pytest.mark.parametrize('value',['simplejson','orjson'])
+def test_bad_json_backend_env_var_falls_back_to_auto(json_backend,monkeypatch,value):
+    monkeypatch.setattr('xfl_fast_r.utils.orjson',None)
+    monkeypatch.setenv(JSON_BACKEND_ENV_VAR,value)
+
+    with pytest.warns(UserWarning,match=JSON_BACKEND_ENV_VAR):
+        assert xfl_fast_r.utils._set_json_backend_from_env() == 'json'
+
+@pytest.mark.parametrize('document',[b'[{"a":1,"b":[1.5,null,true]},{"c":"\\u00e9"}]','{"nested":{"x":-1e3,"y":""}}'])
+def test_json_backends_decode_the_same(json_backend,document):
+    pytest.importorskip('orjson')
+
+    set_json_backend('json')
+    expected = json_loads(document)
+    set_json_backend('orjson')
+    assert json_loads(document) == expected
+
+    with pytest.raises(json.JSONDecodeError):
+        json_loads(b'{"a":')
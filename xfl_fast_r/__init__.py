@@ -1,3 +1,11 @@
+from xfl_fast_r.cache import XFLMemoryCache, XFLResponseCache
+from xfl_fast_r.client import XFLCircuitBreaker, XFLCircuitOpenError, XFLClient, XFLRateLimiter, XFLRetryPolicy, get_xfl_client, set_xfl_client
 from xfl_fast_r.get_xfl import *
+from xfl_fast_r.aget_xfl import *
+from xfl_fast_r.live import XFLLivePBPPoller, XFLPollScheduler, XFLScoreboardHub, get_xfl_game_state
 from xfl_fast_r.load_xfl import *
-from xfl_fast_r.utils import raise_html_status_code
\ No newline at end of file
+from xfl_fast_r.rate_stats import RateStat, add_rate_stats, calculate_rate_stats, catch_percent, cfb_passer_rating, completion_percent, fg_percent, nfl_passer_rating, nfl_passer_rating_from_api_rates, \
+    sack_percent, safe_divide, yards_per_attempt, PLAYER_BOX_RATE_STATS, SEASON_RATE_STATS
+from xfl_fast_r.save_xfl import XFLParquetWriter, get_xfl_game_date, get_xfl_week
+from xfl_fast_r.transport import XFLRecordingAdapter, XFLReplayAdapter, get_fixture_path, REDACTED_PARAMS
+from xfl_fast_r.utils import get_json_backend, iter_json_array, json_loads, raise_html_status_code, set_json_backend, JSON_BACKENDS
\ No newline at end of file
@@ -0,0 +1,331 @@
+import asyncio
+
+from xfl_fast_r.client import XFLClient
+from xfl_fast_r.get_xfl import get_xfl_game_participation, get_xfl_player_box, get_xfl_team_box, get_xfl_pbp, get_xfl_rosters, get_xfl_schedule, \
+    get_xfl_standings, get_xfl_transactions
+from xfl_fast_r.save_xfl import XFLParquetWriter
+from xfl_fast_r.schemas import check_output
+
+###################################################################################################################################################################################################################
+##
+##      asyncio Game Data
+##
+###################################################################################################################################################################################################################
+
+async def aget_xfl_game_participation(xfl_api_token:str,game_id:str,client:XFLClient=None,executor=None,output='pandas',writer:XFLParquetWriter=None):
+    """
+    The asyncio counterpart to `get_xfl_game_participation()`.
+    Retrives the player participation data in a given XFL 3.0 game, without blocking the event loop.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this function to work.
+
+    game_id (str, manditory):
+        The game you want all player participation data from. Must be valid for this function to work.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    executor (concurrent.futures.Executor, optional) = None:
+        The executor that the downloaded data is parsed in.
+        If ```executor = None```, the data is parsed in the worker thread that downloads it.
+        A `ProcessPoolExecutor` can be passed in to parse many games in parallel.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is built directly from the downloaded data, without creating a pandas DataFrame.
+
+    writer (XFLParquetWriter, optional) = None:
+        If set, the data this function returns is also saved to this writer's partitioned Parquet datasets.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) containing all the player participation data in a given XFL 3.0 game.
+    """
+    check_output(output)
+
+    return await asyncio.to_thread(get_xfl_game_participation,xfl_api_token,game_id,client=client,output=output,writer=writer,executor=executor)
+
+async def aget_xfl_player_box(xfl_api_token:str,game_id:str,replace_col_names=False,client:XFLClient=None,executor=None,output='pandas',writer:XFLParquetWriter=None):
+    """
+    The asyncio counterpart to `get_xfl_player_box()`.
+    Retrives the player box score data in a given XFL 3.0 game, without blocking the event loop.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this function to work.
+
+    game_id (str, manditory):
+        The game you want all the player box score data from. Must be valid for this function to work.
+
+    replace_col_names (bool, optional) = False:
+        If ```replace_col_names = True```, the column names for XFL stats will be renamed to more conventional abreviations.
+        At this time, setting ```replace_col_names = True``` will raise a NotImplementedError() exception.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    executor (concurrent.futures.Executor, optional) = None:
+        The executor that the downloaded data is parsed in.
+        If ```executor = None```, the data is parsed in the worker thread that downloads it.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is built directly from the downloaded data, without creating a pandas DataFrame.
+
+    writer (XFLParquetWriter, optional) = None:
+        If set, the data this function returns is also saved to this writer's partitioned Parquet datasets.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) containing all the player box score data in a given XFL 3.0 game.
+    """
+    check_output(output)
+
+    return await asyncio.to_thread(get_xfl_player_box,xfl_api_token,game_id,replace_col_names=replace_col_names,client=client,output=output,writer=writer,executor=executor)
+
+async def aget_xfl_team_box(xfl_api_token:str,game_id:str,client:XFLClient=None,executor=None,output='pandas',writer:XFLParquetWriter=None):
+    """
+    The asyncio counterpart to `get_xfl_team_box()`.
+    Retrives the team stats data in a given XFL 3.0 game, without blocking the event loop.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this function to work.
+
+    game_id (str, manditory):
+        The game you want all the team stats data from. Must be valid for this function to work.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    executor (concurrent.futures.Executor, optional) = None:
+        The executor that the downloaded data is parsed in.
+        If ```executor = None```, the data is parsed in the worker thread that downloads it.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is built directly from the downloaded data, without creating a pandas DataFrame.
+
+    writer (XFLParquetWriter, optional) = None:
+        If set, the data this function returns is also saved to this writer's partitioned Parquet datasets.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) containing all the team stats data in a given XFL 3.0 game.
+    """
+    check_output(output)
+
+    return await asyncio.to_thread(get_xfl_team_box,xfl_api_token,game_id,client=client,output=output,writer=writer,executor=executor)
+
+async def aget_xfl_pbp(xfl_api_token:str,game_id:str,client:XFLClient=None,executor=None,output='pandas',writer:XFLParquetWriter=None,batch_size=None):
+    """
+    The asyncio counterpart to `get_xfl_pbp()`.
+    Retrives the play-by-play data in a given XFL 3.0 game, without blocking the event loop.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this function to work.
+
+    game_id (str, manditory):
+        The game you want all the play-by-play data from. Must be valid for this function to work.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    executor (concurrent.futures.Executor, optional) = None:
+        The executor that the downloaded data is parsed in.
+        If ```executor = None```, the data is parsed in the worker thread that downloads it.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is built directly from the downloaded data, without creating a pandas DataFrame.
+
+    writer (XFLParquetWriter, optional) = None:
+        If set, the data this function returns is also saved to this writer's partitioned Parquet datasets.
+
+    batch_size (int, optional) = None:
+        If set, the `markeractivity` payload is decoded and parsed ```batch_size``` plays at a time as it is downloaded (see `get_xfl_pbp()`).
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) containing all the play-by-play data in a given XFL 3.0 game.
+    """
+    check_output(output)
+
+    return await asyncio.to_thread(get_xfl_pbp,xfl_api_token,game_id,client=client,output=output,writer=writer,batch_size=batch_size,executor=executor)
+
+###################################################################################################################################################################################################################
+##
+##      asyncio League Data
+##
+###################################################################################################################################################################################################################
+
+async def aget_xfl_rosters(xfl_api_token:str,season=2023,week=0,client:XFLClient=None,executor=None,output='pandas',writer:XFLParquetWriter=None):
+    """
+    The asyncio counterpart to `get_xfl_rosters()`.
+    Retrives the current team rosters in a given XFL 3.0 season, without blocking the event loop.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this function to work.
+
+    season (int, optional) = 2023:
+        The season you want all current rosters from. Until the XFL makes it to a second season, this should stay at 2023
+
+    week (int, optional) = 0:
+        If ```week != 0``` or ```week != None``` (null), an additional column is added to the dataframe with the inputted value in every row.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    executor (concurrent.futures.Executor, optional) = None:
+        The executor that the downloaded data is parsed in.
+        If ```executor = None```, the data is parsed in the worker thread that downloads it.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is built directly from the downloaded data, without creating a pandas DataFrame.
+
+    writer (XFLParquetWriter, optional) = None:
+        If set, the data this function returns is also saved to this writer's partitioned Parquet datasets.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) containing the current team rosters in a given XFL 3.0 season.
+    """
+    check_output(output)
+
+    return await asyncio.to_thread(get_xfl_rosters,xfl_api_token,season=season,week=week,client=client,output=output,writer=writer,executor=executor)
+
+async def aget_xfl_schedule(xfl_api_token:str,season=2023,client:XFLClient=None,executor=None,output='pandas',writer:XFLParquetWriter=None):
+    """
+    The asyncio counterpart to `get_xfl_schedule()`.
+    Retrives the league schedule in a given XFL 3.0 season, without blocking the event loop.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this function to work.
+
+    season (int, optional) = 2023:
+        The season you want a schedule from. Until the XFL makes it to a second season, this should stay at 2023
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    executor (concurrent.futures.Executor, optional) = None:
+        The executor that the downloaded data is parsed in.
+        If ```executor = None```, the data is parsed in the worker thread that downloads it.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is built directly from the downloaded data, without creating a pandas DataFrame.
+
+    writer (XFLParquetWriter, optional) = None:
+        If set, the data this function returns is also saved to this writer's partitioned Parquet datasets.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) containing the league schedule in a given XFL 3.0 season.
+    """
+    check_output(output)
+
+    return await asyncio.to_thread(get_xfl_schedule,xfl_api_token,season=season,client=client,output=output,writer=writer,executor=executor)
+
+async def aget_xfl_standings(xfl_api_token:str,season=2023,client:XFLClient=None,executor=None,output='pandas',writer:XFLParquetWriter=None):
+    """
+    The asyncio counterpart to `get_xfl_standings()`.
+    Retrives the current standings in a given XFL 3.0 season, without blocking the event loop.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this function to work.
+
+    season (int, optional) = 2023:
+        The season you want standings from. Until the XFL makes it to a second season, this should stay at 2023
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    executor (concurrent.futures.Executor, optional) = None:
+        The executor that the downloaded data is parsed in.
+        If ```executor = None```, the data is parsed in the worker thread that downloads it.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is built directly from the downloaded data, without creating a pandas DataFrame.
+
+    writer (XFLParquetWriter, optional) = None:
+        If set, the data this function returns is also saved to this writer's partitioned Parquet datasets.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) containing the current standings in a given XFL 3.0 season.
+    """
+    check_output(output)
+
+    return await asyncio.to_thread(get_xfl_standings,xfl_api_token,season=season,client=client,output=output,writer=writer,executor=executor)
+
+async def aget_xfl_transactions(season=2023,client:XFLClient=None,executor=None,output='pandas',writer:XFLParquetWriter=None):
+    """
+    The asyncio counterpart to `get_xfl_transactions()`.
+    Retrives the active list of roster transactions from the XFL's website, without blocking the event loop.
+
+    Parameters
+    ----------
+
+    season (int, optional) = 2023:
+        The season you want transactions from. Until the XFL makes it to a second season, this should stay at 2023
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL website.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    executor (concurrent.futures.Executor, optional) = None:
+        The executor that the downloaded HTML is parsed in.
+        If ```executor = None```, the HTML is parsed in the worker thread that downloads it.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is built directly from the downloaded data, without creating a pandas DataFrame.
+
+    writer (XFLParquetWriter, optional) = None:
+        If set, the data this function returns is also saved to this writer's partitioned Parquet datasets.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) containing roster transactions in a given XFL 3.0 season.
+    """
+    check_output(output)
+
+    return await asyncio.to_thread(get_xfl_transactions,season=season,client=client,output=output,writer=writer,executor=executor)
@@ -0,0 +1,350 @@
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+import time
+
+from xfl_fast_r.utils import atomic_write
+
+###################################################################################################################################################################################################################
+##
+##      On-Disk Response Cache
+##
+###################################################################################################################################################################################################################
+
+## How long (in seconds) a cached response from each scoring API endpoint stays fresh.
+## `None` means that a response never expires, and `0` means that an endpoint is never cached.
+DEFAULT_ENDPOINT_TTLS = {
+    'players':3600,
+    'playerstats':60,
+    'teamstats':60,
+    'markeractivity':30,
+    'scoreboards':30,
+    'standings':3600
+}
+
+## Values of `EventStatus` in the `scoreboards` endpoint that mean a game is over,
+## and that every game-level payload for that game can be cached forever.
+FINAL_EVENT_STATUSES = ('final','final/ot','completed','complete','closed')
+
+class XFLResponseCache:
+    """
+    A persistent, directory-backed cache of raw XFL scoring API responses.
+
+    Every response is stored under a SHA-256 hash of the endpoint and its query string parameters (the API token is never part of the key),
+    alongside a SHA-256 hash of the response body that is checked every time the response is read back.
+
+    Game-level responses (anything requested with ```game=```) for games that the `scoreboards` endpoint reports as final never expire,
+    as long as they were fetched after the game was reported as final. Responses fetched while the game was still being played are fetched again once.
+
+    Parameters
+    ----------
+
+    cache_dir (str, manditory):
+        The directory responses are stored in. It will be created if it does not exist.
+
+    default_ttl (int, optional) = 300:
+        How long (in seconds) a cached response stays fresh, for endpoints that are not in ```endpoint_ttls```.
+
+    endpoint_ttls (dict, optional) = None:
+        Overrides for how long (in seconds) responses from specific endpoints stay fresh (ex. ```{"standings":86400}```).
+        These are merged on top of `DEFAULT_ENDPOINT_TTLS`.
+        A TTL of ```None``` means a response never expires, and a TTL of ```0``` means an endpoint is never cached.
+
+    final_event_statuses (tuple, optional) = FINAL_EVENT_STATUSES:
+        The (case-insensitive) values of `EventStatus` that mean a game is final.
+    """
+
+    def __init__(self,cache_dir:str,default_ttl=300,endpoint_ttls:dict=None,final_event_statuses=FINAL_EVENT_STATUSES):
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = dict(DEFAULT_ENDPOINT_TTLS)
+        if endpoint_ttls != None:
+            self.endpoint_ttls.update(endpoint_ttls)
+        self.final_event_statuses = tuple(str(x).lower() for x in final_event_statuses)
+
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir,exist_ok=True)
+        self._final_games_path = os.path.join(self.cache_dir,'final_games.json')
+        self._final_games = self._read_final_games()
+
+    ###############################################################################################################
+    ## Keys and paths
+    ###############################################################################################################
+
+    @staticmethod
+    def make_key(endpoint:str,params:dict):
+        """
+        Returns the cache key for an endpoint and its query string parameters.
+        The `access_token` parameter is ignored, so that cached responses survive token rotation.
+        """
+        key_params = sorted((k,str(v)) for k,v in params.items() if k != 'access_token')
+        key_str = endpoint + '?' + '&'.join(f'{k}={v}' for k,v in key_params)
+        return hashlib.sha256(key_str.encode('utf-8')).hexdigest()
+
+    def _paths(self,endpoint:str,key:str):
+        endpoint_dir = os.path.join(self.cache_dir,endpoint)
+        return os.path.join(endpoint_dir,f'{key}.json'), os.path.join(endpoint_dir,f'{key}.meta.json')
+
+    @staticmethod
+    def _read_json(path:str,default=None):
+        try:
+            with open(path,'rb') as f:
+                return json.loads(f.read())
+        except (OSError,ValueError):
+            return default
+
+    def _read_final_games(self):
+        """
+        Returns a dictionary of every game that has been reported as final, and the time (as a UNIX timestamp) it was first reported as final.
+        """
+        final_games = self._read_json(self._final_games_path,default={})
+
+        if isinstance(final_games,list):
+            ## Older caches only stored which games are final, and not when.
+            ## Those games are treated as if they became final now, so responses cached before now are fetched again once.
+            now = time.time()
+            final_games = {x:now for x in final_games}
+            atomic_write(self._final_games_path,json.dumps(final_games).encode('utf-8'))
+        elif not isinstance(final_games,dict):
+            final_games = {}
+
+        return final_games
+
+    ###############################################################################################################
+    ## Expiry rules
+    ###############################################################################################################
+
+    def get_ttl(self,endpoint:str,params:dict,fetched_at:float=None):
+        """
+        Returns how long (in seconds) a response for this request stays fresh, or `None` if it never expires.
+
+        A response for a game that is final never expires, if it was fetched (at ```fetched_at```, a UNIX timestamp) after the game was reported as final.
+        If ```fetched_at = None```, the response is assumed to be fetched now.
+        """
+        game_id = params.get('game')
+        if game_id != None and self.is_game_final(game_id):
+            if fetched_at == None or fetched_at >= self._final_games[game_id]:
+                return None
+
+        return self.endpoint_ttls.get(endpoint,self.default_ttl)
+
+    def is_game_final(self,game_id:str):
+        """
+        Returns `True` if the `scoreboards` endpoint has reported this game as final.
+        """
+        return game_id in self._final_games
+
+    def update_final_games(self,scoreboards_json):
+        """
+        Records every game in a decoded `scoreboards` payload whose `EventStatus` means that the game is final.
+        """
+        final_games = set()
+        for game in scoreboards_json:
+            try:
+                if str(game['EventStatus']).strip().lower() in self.final_event_statuses:
+                    final_games.add(game['EventId'])
+            except (KeyError,TypeError):
+                pass
+
+        with self._lock:
+            new_games = final_games.difference(self._final_games)
+            if len(new_games) == 0:
+                return
+
+            now = time.time()
+            self._final_games.update({x:now for x in new_games})
+            atomic_write(self._final_games_path,json.dumps(dict(sorted(self._final_games.items()))).encode('utf-8'))
+
+    ###############################################################################################################
+    ## Reading and writing
+    ###############################################################################################################
+
+    def get(self,endpoint:str,params:dict):
+        """
+        Returns the raw, cached response body for this request,
+        or `None` if it is not cached, has expired, or fails its content hash check.
+        """
+        if self.endpoint_ttls.get(endpoint,self.default_ttl) == 0 and not self.is_game_final(params.get('game')):
+            return None
+
+        key = self.make_key(endpoint,params)
+        body_path, meta_path = self._paths(endpoint,key)
+        meta = self._read_json(meta_path)
+        if not isinstance(meta,dict):
+            return None
+
+        ## A truncated, or older, metadata file is treated as a cache miss.
+        fetched_at = meta.get('fetched_at')
+        body_hash = meta.get('sha256')
+        if not isinstance(fetched_at,(int,float)) or body_hash == None:
+            return None
+
+        ttl = self.get_ttl(endpoint,params,fetched_at=fetched_at)
+        if ttl == 0:
+            return None
+        elif ttl != None and time.time() - fetched_at > ttl:
+            return None
+
+        try:
+            with open(body_path,'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        if hashlib.sha256(body).hexdigest() != body_hash:
+            return None
+
+        return body
+
+    def set(self,endpoint:str,params:dict,body:bytes,json_data=None):
+        """
+        Stores the raw response body for this request.
+
+        If this is a `scoreboards` response, and the decoded payload is passed in as ```json_data```,
+        every game it reports as final is recorded so that those games never expire.
+        """
+        if endpoint == 'scoreboards' and json_data != None:
+            self.update_final_games(json_data)
+
+        if self.get_ttl(endpoint,params) == 0:
+            return
+
+        key = self.make_key(endpoint,params)
+        body_path, meta_path = self._paths(endpoint,key)
+        meta = {
+            'endpoint':endpoint,
+            'params':{k:str(v) for k,v in params.items() if k != 'access_token'},
+            'fetched_at':time.time(),
+            'sha256':hashlib.sha256(body).hexdigest()
+        }
+
+        ## The body is written first, so that a metadata file always points at a complete body.
+        atomic_write(body_path,body)
+        atomic_write(meta_path,json.dumps(meta).encode('utf-8'))
+
+    def clear(self,endpoint:str=None):
+        """
+        Deletes every cached response, or every cached response for one endpoint.
+        The list of final games is kept.
+        """
+        if endpoint == None:
+            endpoints = [x for x in os.listdir(self.cache_dir) if os.path.isdir(os.path.join(self.cache_dir,x))]
+        else:
+            endpoints = [endpoint]
+
+        for e in endpoints:
+            endpoint_dir = os.path.join(self.cache_dir,e)
+            if not os.path.isdir(endpoint_dir):
+                continue
+            for file_name in os.listdir(endpoint_dir):
+                os.remove(os.path.join(endpoint_dir,file_name))
+
+###################################################################################################################################################################################################################
+##
+##      In-Process Memoization
+##
+###################################################################################################################################################################################################################
+
+class _InFlightCall:
+    """
+    A call that one thread is currently computing, and that other threads asking for the same key can wait on.
+    """
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class XFLMemoryCache:
+    """
+    A thread-safe, bounded, in-process LRU cache with single-flight request coalescing.
+
+    If two threads ask for the same key at the same time, only one of them computes the value, and the other waits for, and shares, that result.
+    `XFLClient` uses this so that identical `get_xfl_*()` calls made at the same time (ex. from `get_xfl_pbp_many()`) share one download and one parse.
+
+    By default, a result is only shared with the calls that were waiting for it, and is not kept afterwards,
+    so that a `get_xfl_*()` function called in a loop (ex. for a live game) always gets new data.
+    Set ```ttl``` to also reuse finished results, which can then be up to ```ttl``` seconds old.
+
+    Parameters
+    ----------
+
+    maxsize (int, optional) = 128:
+        The maximum number of results kept. When full, the least recently used result is evicted.
+
+    ttl (float, optional) = 0:
+        How long (in seconds) a finished result is reused for.
+        If ```ttl = 0```, results are not kept once they have been computed.
+        If ```ttl = None```, results are kept until they are evicted.
+    """
+
+    def __init__(self,maxsize=128,ttl=0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _copy(value):
+        ## DataFrames are copied on the way out, so a caller modifying their result does not modify the cached one.
+        try:
+            return value.copy()
+        except AttributeError:
+            return value
+
+    def get_or_compute(self,key,compute):
+        """
+        Returns the cached result for ```key```, or calls ```compute()``` to create it.
+        If another thread is already computing ```key```, this waits for that result instead of calling ```compute()``` again.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry != None:
+                stored_at, value = entry
+                if self.ttl == None or time.monotonic() - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    return self._copy(value)
+                del self._entries[key]
+
+            call = self._in_flight.get(key)
+            is_leader = call == None
+            if is_leader:
+                call = _InFlightCall()
+                self._in_flight[key] = call
+
+        if not is_leader:
+            call.event.wait()
+            if call.error != None:
+                raise call.error
+            return self._copy(call.result)
+
+        try:
+            call.result = compute()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            if self.ttl != 0:
+                with self._lock:
+                    self._entries[key] = (time.monotonic(),call.result)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.event.set()
+
+        return self._copy(call.result)
+
+    def clear(self):
+        """
+        Removes every cached result.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,642 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import hashlib
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from xfl_fast_r.cache import XFLMemoryCache, XFLResponseCache
+from xfl_fast_r.utils import iter_json_array, json_loads, raise_html_status_code
+
+###################################################################################################################################################################################################################
+##
+##      Retries, Rate Limiting, and Circuit Breaking
+##
+###################################################################################################################################################################################################################
+
+## HTTP status codes that mean a request may work if it is retried.
+RETRY_STATUS_CODES = (429,500,502,503,504)
+
+class XFLCircuitOpenError(ConnectionAbortedError):
+    """
+    Raised instead of making a request, while a `XFLCircuitBreaker` is open.
+    """
+
+class XFLRateLimiter:
+    """
+    A thread-safe token bucket, that limits how many requests a `XFLClient` makes per second across every thread that uses it.
+
+    Parameters
+    ----------
+
+    rate (float, optional) = 10:
+        The average number of requests allowed per second.
+
+    burst (int, optional) = None:
+        The number of requests that can be made at once, after the limiter has been idle.
+        If ```burst = None```, this is the same as ```rate``` (rounded up), with a minimum of 1.
+    """
+
+    def __init__(self,rate=10,burst:int=None):
+        if rate <= 0:
+            raise ValueError('`rate` must be greater than 0.')
+
+        self.rate = rate
+        self.burst = max(1,-(-rate // 1)) if burst == None else burst
+
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._paused_until = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Waits until a request can be made, and then uses up one token.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst,self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+    def pause(self,seconds:float):
+        """
+        Stops every thread from making a request for ```seconds``` seconds (ex. after a `Retry-After` header).
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until,time.monotonic() + seconds)
+            self._tokens = 0
+
+class XFLRetryPolicy:
+    """
+    Describes when, and how long after, a failed request to the XFL API is retried.
+
+    Requests that time out, fail to connect, or get a response with a status code in ```retry_status_codes``` are retried,
+    with jittered exponential backoff (a random wait between 0 and ```backoff_factor * 2 ** attempt``` seconds, capped at ```max_backoff```).
+    If the response has a `Retry-After` header, that wait is used instead.
+
+    Parameters
+    ----------
+
+    max_retries (int, optional) = 4:
+        The number of times a request is retried before the error is raised.
+
+    backoff_factor (float, optional) = 0.5:
+        The base of the exponential backoff, in seconds.
+
+    max_backoff (float, optional) = 30:
+        The longest wait (in seconds) between two attempts, including waits from `Retry-After` headers.
+
+    retry_status_codes (tuple, optional) = (429, 500, 502, 503, 504):
+        The HTTP status codes that are retried.
+    """
+
+    def __init__(self,max_retries=4,backoff_factor=0.5,max_backoff=30,retry_status_codes=RETRY_STATUS_CODES):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_status_codes = tuple(retry_status_codes)
+
+    def get_backoff(self,attempt:int):
+        """
+        Returns a random wait (in seconds) before retrying a request that has failed ```attempt + 1``` times.
+        """
+        return random.uniform(0,min(self.max_backoff,self.backoff_factor * (2 ** attempt)))
+
+    def get_retry_after(self,response:requests.Response):
+        """
+        Returns the wait (in seconds) in a response's `Retry-After` header, or `None` if it does not have a valid one.
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after == None:
+            return None
+
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError,ValueError):
+                return None
+
+        return min(self.max_backoff,max(0,seconds))
+
+class XFLCircuitBreaker:
+    """
+    Stops a `XFLClient` from making requests to the XFL API for a while, after too many requests in a row have failed,
+    so that a batch of requests fails fast (with a `XFLCircuitOpenError`) instead of waiting on every retry of every request while the API is down.
+
+    After ```reset_timeout``` seconds, one request is allowed through. If it works, requests are allowed again.
+    If it fails, requests are stopped for another ```reset_timeout``` seconds.
+
+    Parameters
+    ----------
+
+    failure_threshold (int, optional) = 5:
+        The number of failed requests in a row (after retries) that stop requests from being made.
+
+    reset_timeout (float, optional) = 30:
+        How long (in seconds) requests are stopped for.
+    """
+
+    def __init__(self,failure_threshold=5,reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """
+        `"closed"` if requests are allowed, `"open"` if requests are stopped, or `"half-open"` if the next request is a trial.
+        """
+        with self._lock:
+            if self._opened_at == None:
+                return 'closed'
+            elif time.monotonic() - self._opened_at < self.reset_timeout:
+                return 'open'
+            return 'half-open'
+
+    def before_request(self):
+        """
+        Raises a `XFLCircuitOpenError` if a request can not be made right now.
+        """
+        with self._lock:
+            if self._opened_at == None:
+                return
+
+            remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial_in_progress:
+                raise XFLCircuitOpenError(f'The XFL API has failed {self._failures} requests in a row. No requests will be made for the next {max(0,remaining):.1f} seconds.')
+
+            self._trial_in_progress = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_progress or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_progress = False
+
+def _raise_for_status(response:requests.Response):
+    """
+    Raises a `requests.HTTPError`, with the description of its status code from `raise_html_status_code()`, if ```response``` is an error.
+    """
+    if response.status_code < 400:
+        return
+
+    try:
+        raise_html_status_code(response.status_code)
+    except Exception as e:
+        ## The query string is left out, since it has the API token in it.
+        raise requests.HTTPError(f'{e}\n\tURL: {response.url.split("?")[0]}',response=response) from e
+
+###################################################################################################################################################################################################################
+##
+##      XFL API Client
+##
+###################################################################################################################################################################################################################
+
+XFL_SCORING_API_URL = "https://api.xfl.com/scoring/v3.30"
+
+## The maximum number of results `XFLClient.get_scoring_data()` keeps for conditional requests. When full, the least recently used result is dropped.
+MAX_CONDITIONAL_RESULTS = 64
+
+DEFAULT_HEADERS = {
+    "User-Agent":"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.97 Safari/537.36",
+    "Accept-Encoding":"gzip, deflate",
+    "Accept":"application/json, text/html;q=0.9, */*;q=0.8",
+    "Connection":"keep-alive"
+}
+
+class XFLClient:
+    """
+    A reusable HTTP client that every `get_xfl_*()` function in this package routes its requests through.
+
+    Keeping one client around for the lifetime of a job means that TCP and TLS connections to the XFL API are kept alive and reused,
+    instead of a new connection being opened for every endpoint of every game.
+
+    Parameters
+    ----------
+
+    timeout (float or tuple, optional) = 30:
+        The default timeout (in seconds) for every request made with this client.
+        A ```(connect, read)``` tuple can be passed to set the connect and read timeouts separately.
+
+    headers (dict, optional) = None:
+        Additional HTTP headers that will be sent with every request made with this client.
+        These are merged on top of the default headers, which request gzip-compressed responses.
+
+    pool_connections (int, optional) = 4:
+        The number of distinct hosts this client will keep a connection pool for.
+
+    pool_maxsize (int, optional) = 16:
+        The maximum number of keep-alive connections kept open per host.
+        If you plan on calling the XFL API from many threads at once, this should be at least the number of threads.
+
+    cache (XFLResponseCache, optional) = None:
+        If set, responses from the XFL scoring API are read from and written to this on-disk cache,
+        and the network is only used when a cached response is missing or has expired.
+
+    memory_cache (XFLMemoryCache or bool, optional) = True:
+        The in-process cache that `get_xfl_*()` functions use to share one download and one parse between identical calls
+        made at the same time from different threads.
+        If ```memory_cache = True```, a `XFLMemoryCache` with its default settings is created, which does not keep results once they are finished,
+        so repeated calls always get new data. Pass ```XFLMemoryCache(ttl=...)``` to also reuse finished results for that many seconds.
+        If ```memory_cache = False``` (or `None`), every call downloads and parses its data again.
+
+    retry (XFLRetryPolicy or bool, optional) = True:
+        When, and how long after, a failed request is retried.
+        If ```retry = True```, a `XFLRetryPolicy` with its default settings is created,
+        which retries timeouts, connection errors, and HTTP 429, 500, 502, 503, and 504 responses up to 4 times, with jittered exponential backoff and `Retry-After` handling.
+        If ```retry = False``` (or `None`), failed requests are never retried.
+
+    rate_limiter (XFLRateLimiter, optional) = None:
+        If set, this client waits for a token from this rate limiter before every request it makes to the network.
+        Share one rate limiter between clients to limit them all together.
+
+    circuit_breaker (XFLCircuitBreaker or bool, optional) = True:
+        Stops this client from making requests for a while, after too many requests in a row have failed,
+        so that a batch of requests fails fast while the XFL API is down.
+        If ```circuit_breaker = True```, a `XFLCircuitBreaker` with its default settings is created.
+        If ```circuit_breaker = False``` (or `None`), requests are always made.
+
+    transport (requests.adapters.HTTPAdapter, optional) = None:
+        If set, every request made with this client is sent through this transport adapter,
+        instead of a new `HTTPAdapter` (ex. a `XFLRecordingAdapter` that saves every response to fixture files,
+        or a `XFLReplayAdapter` that answers every request from those files without using the network).
+        ```pool_connections``` and ```pool_maxsize``` are ignored if this is set.
+    """
+
+    def __init__(self,timeout=30,headers:dict=None,pool_connections=4,pool_maxsize=16,cache:XFLResponseCache=None,memory_cache=True,
+                 retry=True,rate_limiter:XFLRateLimiter=None,circuit_breaker=True,transport:HTTPAdapter=None):
+        self.timeout = timeout
+        self.cache = cache
+
+        if retry == True:
+            retry = XFLRetryPolicy()
+        elif retry == False:
+            retry = None
+        self.retry = retry
+
+        self.rate_limiter = rate_limiter
+
+        if circuit_breaker == True:
+            circuit_breaker = XFLCircuitBreaker()
+        elif circuit_breaker == False:
+            circuit_breaker = None
+        self.circuit_breaker = circuit_breaker
+
+        if memory_cache == True:
+            memory_cache = XFLMemoryCache()
+        elif memory_cache == False:
+            memory_cache = None
+        self.memory_cache = memory_cache
+
+        ## The validators (`ETag` and `Last-Modified`), body hash, and parsed result of the last response, for every `get_scoring_data()` key.
+        self._conditional_results = OrderedDict()
+        self._conditional_lock = threading.Lock()
+
+        self.session = requests.Session()
+
+        if transport == None:
+            transport = HTTPAdapter(pool_connections=pool_connections,pool_maxsize=pool_maxsize)
+        self.session.mount('https://',transport)
+        self.session.mount('http://',transport)
+
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers != None:
+            self.session.headers.update(headers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes every pooled connection held by this client.
+        """
+        self.session.close()
+
+    def _send(self,url:str,params:dict,headers:dict,timeout,stream=False):
+        """
+        Sends a GET request, and retries it according to this client's `XFLRetryPolicy`.
+        Returns the last response, which may be an error.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter != None:
+                self.rate_limiter.acquire()
+
+            try:
+                response = self.session.get(url,params=params,headers=headers,timeout=timeout,stream=stream)
+            except (requests.ConnectionError,requests.Timeout):
+                if self.retry == None or attempt >= self.retry.max_retries:
+                    raise
+                wait = self.retry.get_backoff(attempt)
+            else:
+                if self.retry == None or response.status_code not in self.retry.retry_status_codes or attempt >= self.retry.max_retries:
+                    return response
+
+                wait = self.retry.get_retry_after(response)
+                if wait == None:
+                    wait = self.retry.get_backoff(attempt)
+                elif self.rate_limiter != None:
+                    ## The server asked for every request to wait, not just this one.
+                    self.rate_limiter.pause(wait)
+                response.close()
+
+            attempt += 1
+            time.sleep(wait)
+
+    def get(self,url:str,params:dict=None,headers:dict=None,timeout=None,stream=False):
+        """
+        Sends a GET request through this client's connection pool.
+        Failed requests are retried according to this client's `XFLRetryPolicy`, and every request waits for this client's `XFLRateLimiter`.
+
+        Parameters
+        ----------
+
+        url (str, manditory):
+            The URL you want to request.
+
+        params (dict, optional) = None:
+            Query string parameters to add to ```url```.
+
+        headers (dict, optional) = None:
+            Headers to send with this request only, on top of this client's headers.
+
+        timeout (float or tuple, optional) = None:
+            The timeout for this request only. If ```timeout = None```, the client's default timeout is used.
+
+        stream (bool, optional) = False:
+            If ```stream = True```, the body of the response is not downloaded until it is read (ex. with ```response.iter_content()```).
+
+        Returns
+        ----------
+
+        A `requests.Response` object.
+        If the request still fails after every retry, a `requests.HTTPError` is raised.
+        If this client's `XFLCircuitBreaker` is open, a `XFLCircuitOpenError` is raised without making a request.
+        """
+        if timeout == None:
+            timeout = self.timeout
+
+        if self.circuit_breaker == None:
+            response = self._send(url,params,headers,timeout,stream=stream)
+        else:
+            self.circuit_breaker.before_request()
+
+            ## Only errors that mean the API is down count against the circuit breaker.
+            ## Other errors (ex. HTTP 404) mean that the API is up.
+            failure_status_codes = RETRY_STATUS_CODES if self.retry == None else self.retry.retry_status_codes
+            succeeded = False
+            try:
+                response = self._send(url,params,headers,timeout,stream=stream)
+                succeeded = response.status_code not in failure_status_codes
+            finally:
+                if succeeded:
+                    self.circuit_breaker.record_success()
+                else:
+                    self.circuit_breaker.record_failure()
+
+        _raise_for_status(response)
+        return response
+
+    def get_scoring_json(self,endpoint:str,xfl_api_token:str,timeout=None,**params):
+        """
+        Requests an endpoint of the XFL scoring API, and returns the decoded JSON payload.
+        If this client has a `XFLResponseCache`, a fresh cached response is returned instead of making a request.
+
+        Parameters
+        ----------
+
+        endpoint (str, manditory):
+            The scoring API endpoint you want data from (ex. ```"players"```, ```"markeractivity"```, or ```"standings"```).
+
+        xfl_api_token (str, manditory):
+            A valid XFL API token. Must be valid for this function to work.
+
+        timeout (float or tuple, optional) = None:
+            The timeout for this request only. If ```timeout = None```, the client's default timeout is used.
+
+        **params:
+            Any additional query string parameters for this endpoint (ex. ```game="FOOTBALL_XFL_2023_2_18_VGS@ARL"```).
+
+        Returns
+        ----------
+
+        The decoded JSON payload for this endpoint.
+        """
+        params['access_token'] = xfl_api_token
+
+        if self.cache != None:
+            body = self.cache.get(endpoint,params)
+            if body != None:
+                return json_loads(body)
+
+        response = self.get(f"{XFL_SCORING_API_URL}/{endpoint}",params=params,timeout=timeout)
+        json_data = json_loads(response.content)
+
+        if self.cache != None:
+            self.cache.set(endpoint,params,response.content,json_data)
+
+        return json_data
+
+    def iter_scoring_json(self,endpoint:str,xfl_api_token:str,chunk_size=65536,timeout=None,**params):
+        """
+        Requests an endpoint of the XFL scoring API whose payload is a JSON array (ex. ```"markeractivity"```),
+        and decodes it one element at a time as the response is downloaded,
+        so that neither the raw payload, nor the whole decoded payload, is held in memory at once.
+
+        A fresh response from this client's `XFLResponseCache` is used if there is one,
+        but streamed responses are not written to the cache, since that would require keeping the whole payload.
+
+        Parameters
+        ----------
+
+        endpoint (str, manditory):
+            The scoring API endpoint you want data from (ex. ```"markeractivity"```).
+
+        xfl_api_token (str, manditory):
+            A valid XFL API token. Must be valid for this function to work.
+
+        chunk_size (int, optional) = 65536:
+            The number of bytes read from the response at a time.
+
+        timeout (float or tuple, optional) = None:
+            The timeout for this request only. If ```timeout = None```, the client's default timeout is used.
+
+        **params:
+            Any additional query string parameters for this endpoint (ex. ```game="FOOTBALL_XFL_2023_2_18_VGS@ARL"```).
+
+        Returns
+        ----------
+
+        A generator of every element of the payload, in order.
+        """
+        params['access_token'] = xfl_api_token
+
+        if self.cache != None:
+            body = self.cache.get(endpoint,params)
+            if body != None:
+                yield from iter_json_array([body])
+                return
+
+        with self.get(f"{XFL_SCORING_API_URL}/{endpoint}",params=params,timeout=timeout,stream=True) as response:
+            yield from iter_json_array(response.iter_content(chunk_size=chunk_size))
+
+    def get_scoring_data(self,key,endpoint:str,xfl_api_token:str,parse,timeout=None,**params):
+        """
+        Requests an endpoint of the XFL scoring API, and returns ```parse(json_data)```,
+        reusing the result from the last call with the same ```key``` if the payload has not changed since then.
+
+        The `ETag` and `Last-Modified` headers of the last response are sent back as `If-None-Match` and `If-Modified-Since`.
+        If the XFL API responds with HTTP 304 (Not Modified), or with a body that is identical to the last one (checked with a SHA-256 hash),
+        the last result is returned without decoding or parsing the payload again.
+        Like the results of a `XFLMemoryCache`, every result is a copy, so modifying it does not change the result of a later call.
+
+        Parameters
+        ----------
+
+        key (hashable, manditory):
+            Identifies what ```parse``` builds (ex. ```("standings", 2023, "pandas")```), so that different parsers of the same endpoint do not share results.
+
+        endpoint (str, manditory):
+            The scoring API endpoint you want data from (ex. ```"scoreboards"``` or ```"standings"```).
+
+        xfl_api_token (str, manditory):
+            A valid XFL API token. Must be valid for this function to work.
+
+        parse (callable, manditory):
+            A function that builds the result from the decoded JSON payload.
+
+        timeout (float or tuple, optional) = None:
+            The timeout for this request only. If ```timeout = None```, the client's default timeout is used.
+
+        **params:
+            Any additional query string parameters for this endpoint.
+
+        Returns
+        ----------
+
+        The result of ```parse```, for the latest payload of this endpoint.
+        """
+        params['access_token'] = xfl_api_token
+        result_key = (XFLResponseCache.make_key(endpoint,params),key)
+
+        with self._conditional_lock:
+            last = self._conditional_results.get(result_key)
+
+        response = None
+        body = None
+        if self.cache != None:
+            body = self.cache.get(endpoint,params)
+
+        if body == None:
+            headers = {}
+            if last != None:
+                if last['etag'] != None:
+                    headers['If-None-Match'] = last['etag']
+                if last['last_modified'] != None:
+                    headers['If-Modified-Since'] = last['last_modified']
+
+            response = self.get(f"{XFL_SCORING_API_URL}/{endpoint}",params=params,headers=headers,timeout=timeout)
+            if response.status_code == 304:
+                if last == None:
+                    raise requests.HTTPError(f'HTTP 304 Not Modified:\n\tThe XFL API reported that the "{endpoint}" endpoint has not changed, but there is no earlier response to reuse.',response=response)
+                return XFLMemoryCache._copy(last['result'])
+            body = response.content
+
+        body_hash = hashlib.sha256(body).hexdigest()
+        if last != None and last['body_hash'] == body_hash:
+            result = last['result']
+        else:
+            json_data = json_loads(body)
+            if response != None and self.cache != None:
+                self.cache.set(endpoint,params,body,json_data)
+            result = parse(json_data)
+
+        with self._conditional_lock:
+            self._conditional_results[result_key] = {
+                'etag':None if response == None else response.headers.get('ETag'),
+                'last_modified':None if response == None else response.headers.get('Last-Modified'),
+                'body_hash':body_hash,
+                'result':result
+            }
+            self._conditional_results.move_to_end(result_key)
+            while len(self._conditional_results) > MAX_CONDITIONAL_RESULTS:
+                self._conditional_results.popitem(last=False)
+
+        return XFLMemoryCache._copy(result)
+
+    def memoize(self,key,compute):
+        """
+        Returns the result of ```compute()```, sharing it with any other call made with the same ```key```
+        while that result is being computed, or while it is kept by this client's `XFLMemoryCache` (see ```XFLMemoryCache.ttl```).
+        If this client has no memory cache, ```compute()``` is always called.
+        """
+        if self.memory_cache == None:
+            return compute()
+
+        return self.memory_cache.get_or_compute(key,compute)
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+def get_xfl_client():
+    """
+    Returns the package-wide `XFLClient` that `get_xfl_*()` functions use when no client is passed in.
+
+    The client is created the first time this function is called.
+    """
+    global _default_client
+
+    if _default_client == None:
+        with _default_client_lock:
+            if _default_client == None:
+                _default_client = XFLClient()
+
+    return _default_client
+
+def set_xfl_client(client:XFLClient):
+    """
+    Replaces the package-wide `XFLClient` that `get_xfl_*()` functions use when no client is passed in.
+
+    Parameters
+    ----------
+
+    client (XFLClient, manditory):
+        The client you want every `get_xfl_*()` function to use by default.
+        If ```client = None```, a new default client will be created the next time one is needed.
+    """
+    global _default_client
+
+    with _default_client_lock:
+        _default_client = client
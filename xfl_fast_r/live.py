@@ -0,0 +1,697 @@
+import asyncio
+import threading
+import time
+import warnings
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from xfl_fast_r.cache import FINAL_EVENT_STATUSES
+from xfl_fast_r.client import XFLClient, get_xfl_client
+from xfl_fast_r.get_xfl import _parse_xfl_pbp, _parse_xfl_player_box, _parse_xfl_schedule, _parse_xfl_team_box, get_xfl_game_participation
+from xfl_fast_r.schemas import check_output, restore_categories
+
+###################################################################################################################################################################################################################
+##
+##      Live Play-by-Play
+##
+###################################################################################################################################################################################################################
+
+class XFLLivePBPPoller:
+    """
+    Polls the play-by-play data of a live XFL 3.0 game, and only parses the plays that are new, or that have changed, since the last poll.
+
+    Every marker is tracked by its `MarkerId`.
+    A marker that has already been seen is emitted again only if its `IsOfficial` flag has changed (ex. when a play is made official after a review).
+    Every emitted row is appended to an in-memory frame (`XFLLivePBPPoller.frame`), so the plays from earlier polls are never parsed again.
+
+    The `markeractivity` endpoint always returns every marker in a game,
+    so each poll still downloads and decodes the full payload,
+    but only the new and changed markers are parsed into rows.
+    Because every parsed DataFrame is cast to `PBP_DTYPES` one column at a time, each poll with new plays has a fixed cost (~20 ms), however few plays are new.
+    If ```output = "arrow"```, that cost is much smaller, and the time a poll takes mostly depends on the number of new plays.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this class to work.
+
+    game_id (str, manditory):
+        The game you want to follow (ex. ```"FOOTBALL_XFL_2023_2_18_VGS@ARL"```).
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+        If this client has a `XFLResponseCache`, a cached `markeractivity` response is reused until it expires.
+
+    output (str, optional) = "pandas":
+        The type of table every poll returns.
+        If ```output = "arrow"```, `pyarrow.Table` objects are built directly from the downloaded data, without creating pandas DataFrames.
+    """
+
+    def __init__(self,xfl_api_token:str,game_id:str,client:XFLClient=None,output='pandas'):
+        check_output(output)
+
+        self.xfl_api_token = xfl_api_token
+        self.game_id = game_id
+        self.client = client
+        self.output = output
+
+        ## The last `IsOfficial` value seen for every `MarkerId`.
+        self._is_official = {}
+
+        ## Every table that has been emitted, in order. These are combined into one frame when `frame` is read.
+        self._chunks = []
+        self._lock = threading.Lock()
+
+        self.polls = 0
+
+    def _empty(self):
+        if self.output == 'arrow':
+            return pa.table({})
+        return pd.DataFrame()
+
+    def _get_client(self):
+        if self.client == None:
+            return get_xfl_client()
+        return self.client
+
+    def _new_markers(self,json_data):
+        """
+        Returns the markers in a decoded `markeractivity` payload that are new, or whose `IsOfficial` flag has changed,
+        and records them as seen.
+        """
+        new_markers = []
+        for play in json_data:
+            marker_id = play['MarkerId']
+            is_official = play.get('IsOfficial')
+
+            if marker_id in self._is_official and self._is_official[marker_id] == is_official:
+                continue
+
+            self._is_official[marker_id] = is_official
+            new_markers.append(play)
+
+        return new_markers
+
+    def update(self,json_data):
+        """
+        Adds the new and changed plays from a decoded `markeractivity` payload that was downloaded elsewhere.
+
+        Parameters
+        ----------
+
+        json_data (list, manditory):
+            A decoded `markeractivity` payload for this game.
+
+        Returns
+        ----------
+
+        A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with only the new and changed plays, in the same format as `get_xfl_pbp()`.
+        If there are no new or changed plays, the table is empty.
+        """
+        with self._lock:
+            new_markers = self._new_markers(json_data)
+            self.polls += 1
+
+            if len(new_markers) == 0:
+                return self._empty()
+
+            delta = _parse_xfl_pbp(new_markers,self.game_id,output=self.output)
+            self._chunks.append(delta)
+            return delta
+
+    def poll(self):
+        """
+        Downloads the play-by-play data of this game once, and returns only the plays that are new or changed since the last poll.
+
+        Returns
+        ----------
+
+        A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with only the new and changed plays, in the same format as `get_xfl_pbp()`.
+        If there are no new or changed plays, the table is empty.
+        """
+        json_data = self._get_client().get_scoring_json('markeractivity',self.xfl_api_token,game=self.game_id)
+        return self.update(json_data)
+
+    def watch(self,interval=10,max_polls=None):
+        """
+        Polls this game every ```interval``` seconds, and yields a table every time there are new or changed plays.
+
+        Parameters
+        ----------
+
+        interval (float, optional) = 10:
+            The number of seconds between the start of each poll.
+
+        max_polls (int, optional) = None:
+            The number of polls made before this generator stops. If ```max_polls = None```, this game is polled until the generator is closed.
+
+        Returns
+        ----------
+
+        A generator of pandas DataFrames (or `pyarrow.Table` objects, if ```output = "arrow"```), with only the new and changed plays from each poll.
+        """
+        polls = 0
+        while max_polls == None or polls < max_polls:
+            started_at = time.monotonic()
+
+            delta = self.poll()
+            polls += 1
+            if len(delta) > 0:
+                yield delta
+
+            if max_polls == None or polls < max_polls:
+                time.sleep(max(0,interval - (time.monotonic() - started_at)))
+
+    @property
+    def frame(self):
+        """
+        Every play that has been emitted, in the order it was emitted.
+        A play that has changed appears once for each version of it that was emitted.
+        """
+        with self._lock:
+            if len(self._chunks) == 0:
+                return self._empty()
+
+            if len(self._chunks) > 1:
+                ## The chunks are combined once, so reading `frame` again only combines the chunks emitted since.
+                if self.output == 'arrow':
+                    self._chunks = [pa.concat_tables(self._chunks,promote_options='permissive')]
+                else:
+                    self._chunks = [restore_categories(pd.concat(self._chunks,ignore_index=True),self._chunks[-1])]
+
+            return self._chunks[0]
+
+    @property
+    def plays(self):
+        """
+        The latest version of every play that has been emitted, sorted by `MarkerUTC`.
+        """
+        frame = self.frame
+        if len(frame) == 0:
+            return frame
+
+        if self.output == 'arrow':
+            ## The row of the last version of each marker.
+            last_rows = {x:i for i,x in enumerate(frame['MarkerId'].to_pylist())}
+            return frame.take(sorted(last_rows.values())).sort_by('MarkerUTC')
+
+        return frame.drop_duplicates(subset=['MarkerId'],keep='last').sort_values(by=['MarkerUTC'],kind='stable',ignore_index=True)
+
+###################################################################################################################################################################################################################
+##
+##      Adaptive Polling
+##
+###################################################################################################################################################################################################################
+
+## How often (in seconds) games in each state are polled. `None` means that games in that state are not polled at all.
+DEFAULT_POLL_INTERVALS = {
+    'live':5,
+    'stopped':15,
+    'break':60,
+    'scheduled':None,
+    'final':None
+}
+
+## Values of `EventStatus` that mean a game has not started yet.
+SCHEDULED_EVENT_STATUSES = ('scheduled','pre-game','pregame','not started','upcoming','')
+
+## Values of `ClockState` that mean the game clock is running.
+RUNNING_CLOCK_STATES = ('running','run','started','on')
+
+## Words in `EventStatusDetail` that mean play is stopped for a while (ex. `"Halftime"`, `"End of 1st"`, or `"Timeout ARL"`).
+BREAK_STATUS_WORDS = ('half','end','timeout','delay','review')
+
+## The datasets `XFLPollScheduler` can fetch for every game that is being played.
+POLL_DATASETS = ('pbp','player_box','team_box')
+
+def get_xfl_game_state(scoreboard:dict):
+    """
+    Returns the state of a XFL 3.0 game from its entry in the `scoreboards` endpoint
+    (a decoded JSON record, or a row of `get_xfl_schedule()`).
+
+    Parameters
+    ----------
+
+    scoreboard (dict, manditory):
+        A game's `scoreboards` entry, with at least `EventStatus`, `ClockState`, `Period`, and `PlayClock`.
+
+    Returns
+    ----------
+
+    One of the following:
+    - `"scheduled"`: The game has not started yet.
+    - `"live"`: The game clock is running.
+    - `"stopped"`: The game clock is stopped between plays, and the play clock is running.
+    - `"break"`: Play is stopped for a while (ex. halftime, the end of a quarter, or a timeout).
+    - `"final"`: The game is over.
+    """
+    event_status = str(scoreboard.get('EventStatus') or '').strip().lower()
+    if event_status in FINAL_EVENT_STATUSES:
+        return 'final'
+    elif event_status in SCHEDULED_EVENT_STATUSES or not scoreboard.get('Period'):
+        return 'scheduled'
+
+    if str(scoreboard.get('ClockState') or '').strip().lower() in RUNNING_CLOCK_STATES:
+        return 'live'
+
+    event_status_detail = str(scoreboard.get('EventStatusDetail') or '').lower()
+    if any(x in event_status_detail for x in BREAK_STATUS_WORDS):
+        return 'break'
+
+    ## With the game clock stopped, a running play clock means that the next snap is coming soon.
+    play_clock = scoreboard.get('PlayClock')
+    if play_clock == None or pd.isna(play_clock) or play_clock <= 0:
+        return 'break'
+
+    return 'stopped'
+
+class XFLPollScheduler:
+    """
+    Follows every XFL 3.0 game on the `scoreboards` endpoint, and polls each game's data at an interval that depends on the state of that game.
+
+    The `scoreboards` endpoint is requested every ```scoreboard_interval``` seconds, and each game's state is read from it with `get_xfl_game_state()`.
+    Games with the clock running are polled the most often, games that are stopped between plays less often, and games at halftime, the end of a quarter, or a timeout even less often.
+    Games that have not started, and games that are over, are not polled at all.
+    When a game becomes final, it is polled one last time, so that its final data is always fetched.
+
+    Play-by-play data is fetched with a `XFLLivePBPPoller` for each game, so only new and changed plays are parsed and returned.
+    Box scores are fetched in full every time they are polled.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this class to work.
+
+    game_ids (list, optional) = None:
+        The games you want to follow. If ```game_ids = None```, every game on the `scoreboards` endpoint is followed.
+
+    datasets (tuple, optional) = ("pbp", "player_box", "team_box"):
+        The data fetched for every game that is being played.
+
+    intervals (dict, optional) = None:
+        Overrides for how often (in seconds) games in each state are polled (ex. ```{"live":3}```).
+        These are merged on top of `DEFAULT_POLL_INTERVALS`. An interval of `None` means that games in that state are not polled.
+
+    scoreboard_interval (float, optional) = 15:
+        How often (in seconds) the `scoreboards` endpoint is requested.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    output (str, optional) = "pandas":
+        The type of table every update contains.
+        If ```output = "arrow"```, `pyarrow.Table` objects are built directly from the downloaded data, without creating pandas DataFrames.
+    """
+
+    def __init__(self,xfl_api_token:str,game_ids:list=None,datasets=POLL_DATASETS,intervals:dict=None,scoreboard_interval=15,client:XFLClient=None,output='pandas'):
+        check_output(output)
+
+        for dataset in datasets:
+            if dataset not in POLL_DATASETS:
+                raise ValueError(f'`datasets` can only contain {POLL_DATASETS}, not "{dataset}".')
+
+        self.xfl_api_token = xfl_api_token
+        self.game_ids = None if game_ids == None else set(game_ids)
+        self.datasets = tuple(datasets)
+        self.intervals = dict(DEFAULT_POLL_INTERVALS)
+        if intervals != None:
+            self.intervals.update(intervals)
+        self.scoreboard_interval = scoreboard_interval
+        self.client = client
+        self.output = output
+
+        ## The last known state of every game, and when each game is next polled (in `time.monotonic()` seconds).
+        self.states = {}
+        self._next_poll = {}
+        self._next_scoreboard = None
+        self._pbp_pollers = {}
+
+    def _get_client(self):
+        if self.client == None:
+            return get_xfl_client()
+        return self.client
+
+    def update_scoreboard(self,scoreboards_json=None):
+        """
+        Updates the state of every followed game from the `scoreboards` endpoint.
+
+        Parameters
+        ----------
+
+        scoreboards_json (list, optional) = None:
+            A decoded `scoreboards` payload that was downloaded elsewhere. If ```scoreboards_json = None```, the `scoreboards` endpoint is requested.
+
+        Returns
+        ----------
+
+        A dict of the games whose state changed, and their new state.
+        """
+        if scoreboards_json == None:
+            scoreboards_json = self._get_client().get_scoring_json('scoreboards',self.xfl_api_token)
+
+        now = time.monotonic()
+        changed = {}
+
+        for scoreboard in scoreboards_json:
+            game_id = scoreboard.get('EventId')
+            if game_id == None or (self.game_ids != None and game_id not in self.game_ids):
+                continue
+
+            state = get_xfl_game_state(scoreboard)
+            old_state = self.states.get(game_id)
+            if state == old_state:
+                continue
+
+            self.states[game_id] = state
+            changed[game_id] = state
+
+            if state == 'final' and old_state not in (None,'scheduled'):
+                ## One last poll, so that the final data of this game is fetched.
+                self._next_poll[game_id] = now
+            elif self.intervals.get(state) == None:
+                self._next_poll.pop(game_id,None)
+            else:
+                ## A change of state usually means that something happened, so the game is polled right away.
+                self._next_poll[game_id] = now
+
+        self._next_scoreboard = now + self.scoreboard_interval
+        return changed
+
+    def _fetch(self,game_id:str,dataset:str):
+        """
+        Fetches one dataset of one game.
+        """
+        client = self._get_client()
+
+        if dataset == 'pbp':
+            if game_id not in self._pbp_pollers:
+                self._pbp_pollers[game_id] = XFLLivePBPPoller(self.xfl_api_token,game_id,client=client,output=self.output)
+            return self._pbp_pollers[game_id].poll()
+
+        elif dataset == 'team_box':
+            json_data = client.get_scoring_json('teamstats',self.xfl_api_token,game=game_id)
+            return _parse_xfl_team_box(json_data,game_id,output=self.output)
+
+        elif dataset == 'player_box':
+            json_data = client.get_scoring_json('playerstats',self.xfl_api_token,game=game_id)
+            participation = get_xfl_game_participation(self.xfl_api_token,game_id,client=client,output=self.output)
+            return _parse_xfl_player_box(json_data,participation,game_id,output=self.output)
+
+    def step(self):
+        """
+        Requests the `scoreboards` endpoint if it is due, and polls every game that is due.
+
+        Returns
+        ----------
+
+        A list of ```(game_id, dataset, data)``` tuples, one for every dataset that was fetched.
+        Play-by-play data only has the new and changed plays, and is left out if there are none.
+        If a dataset could not be fetched, ```data``` is the exception that was raised.
+        """
+        if self._next_scoreboard == None or time.monotonic() >= self._next_scoreboard:
+            self.update_scoreboard()
+
+        updates = []
+        now = time.monotonic()
+        for game_id,next_poll in list(self._next_poll.items()):
+            if next_poll > now:
+                continue
+
+            for dataset in self.datasets:
+                try:
+                    data = self._fetch(game_id,dataset)
+                except Exception as e:
+                    data = e
+                if dataset == 'pbp' and not isinstance(data,Exception) and len(data) == 0:
+                    continue
+                updates.append((game_id,dataset,data))
+
+            interval = self.intervals.get(self.states.get(game_id))
+            if interval == None:
+                del self._next_poll[game_id]
+            else:
+                self._next_poll[game_id] = now + interval
+
+        return updates
+
+    def seconds_until_next_step(self):
+        """
+        Returns the number of seconds until the `scoreboards` endpoint, or a game, is next due to be polled.
+        """
+        if self._next_scoreboard == None:
+            return 0
+        return max(0,min([self._next_scoreboard] + list(self._next_poll.values())) - time.monotonic())
+
+    def run(self,stop_when_final=True):
+        """
+        Follows every game, and yields every update as soon as it is fetched.
+
+        Parameters
+        ----------
+
+        stop_when_final (bool, optional) = True:
+            If ```stop_when_final = True```, this generator stops once every followed game is final and has been polled for the last time.
+            Otherwise, games are followed until the generator is closed.
+
+        Returns
+        ----------
+
+        A generator of ```(game_id, dataset, data)``` tuples, in the same format as `XFLPollScheduler.step()`.
+        """
+        while True:
+            for update in self.step():
+                yield update
+
+            if stop_when_final and len(self.states) > 0 and len(self._next_poll) == 0 \
+                and all(x == 'final' for x in self.states.values()):
+                return
+
+            time.sleep(self.seconds_until_next_step())
+
+###################################################################################################################################################################################################################
+##
+##      Scoreboard Hub
+##
+###################################################################################################################################################################################################################
+
+## Keys of a `scoreboards` entry that change on every request, and are ignored when checking if a game has changed.
+SCOREBOARD_IGNORED_KEYS = ('NowUTC','NowLTC')
+
+class XFLScoreboardHub:
+    """
+    Requests the `scoreboards` endpoint once per interval, and pushes only the games that have changed to every subscriber.
+
+    However many subscribers there are, each interval costs one request, and every changed game is parsed once.
+    Subscribers can be callbacks, which are called from the thread that fetched the scoreboard,
+    or `asyncio.Queue` objects, which are filled from their event loop.
+
+    Parameters
+    ----------
+
+    xfl_api_token (str, manditory):
+        A valid XFL API token. Must be valid for this class to work.
+
+    interval (float, optional) = 15:
+        How often (in seconds) the `scoreboards` endpoint is requested, once `start()` is called.
+
+    season (int, optional) = 2023:
+        The season these games are from.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to make requests to the XFL API.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    output (str, optional) = "pandas":
+        The type of table every subscriber receives, in the same format as `get_xfl_schedule()`.
+        If ```output = "arrow"```, `pyarrow.Table` objects are built directly from the downloaded data, without creating pandas DataFrames.
+    """
+
+    def __init__(self,xfl_api_token:str,interval=15,season=2023,client:XFLClient=None,output='pandas'):
+        check_output(output)
+
+        self.xfl_api_token = xfl_api_token
+        self.interval = interval
+        self.season = season
+        self.client = client
+        self.output = output
+
+        ## The latest `scoreboards` entry of every game, without `SCOREBOARD_IGNORED_KEYS`, and as it was received.
+        self._compare_records = {}
+        self._records = {}
+
+        self._subscribers = {}
+        self._next_subscriber_id = 0
+        self._lock = threading.Lock()
+
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def _get_client(self):
+        if self.client == None:
+            return get_xfl_client()
+        return self.client
+
+    ###############################################################################################################
+    ## Subscribers
+    ###############################################################################################################
+
+    def subscribe(self,callback=None,queue:asyncio.Queue=None,game_ids:list=None,loop:asyncio.AbstractEventLoop=None,send_current=True):
+        """
+        Registers a subscriber, which receives a table of every game that has changed after each request.
+
+        Parameters
+        ----------
+
+        callback (callable, optional) = None:
+            A function that is called with a table of every changed game.
+
+        queue (asyncio.Queue, optional) = None:
+            An `asyncio.Queue` that a table of every changed game is put into.
+            Exactly one of ```callback``` and ```queue``` must be set.
+
+        game_ids (list, optional) = None:
+            The games this subscriber receives. If ```game_ids = None```, this subscriber receives every game.
+
+        loop (asyncio.AbstractEventLoop, optional) = None:
+            The event loop ```queue``` belongs to. If ```loop = None```, the running event loop is used.
+
+        send_current (bool, optional) = True:
+            If ```send_current = True```, and the scoreboard has already been requested,
+            this subscriber immediately receives the latest state of every game it follows.
+
+        Returns
+        ----------
+
+        The ID of this subscriber, which can be passed to `unsubscribe()`.
+        """
+        if (callback == None) == (queue == None):
+            raise ValueError('Exactly one of `callback` and `queue` must be set.')
+
+        if queue != None:
+            if loop == None:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    raise ValueError('`loop` must be set when subscribing a queue outside of a running event loop.')
+            callback = lambda data: loop.call_soon_threadsafe(queue.put_nowait,data)
+
+        game_ids = None if game_ids == None else set(game_ids)
+
+        with self._lock:
+            subscriber_id = self._next_subscriber_id
+            self._next_subscriber_id += 1
+            self._subscribers[subscriber_id] = (callback,game_ids)
+            current = [x for game_id,x in self._records.items() if game_ids == None or game_id in game_ids]
+
+        if send_current and len(current) > 0:
+            self._notify(callback,_parse_xfl_schedule(current,season=self.season,output=self.output))
+
+        return subscriber_id
+
+    def unsubscribe(self,subscriber_id:int):
+        """
+        Removes a subscriber, so that it does not receive any more changes.
+        """
+        with self._lock:
+            self._subscribers.pop(subscriber_id,None)
+
+    @staticmethod
+    def _notify(callback,data):
+        try:
+            callback(data)
+        except Exception as e:
+            warnings.warn(f'A scoreboard subscriber raised an exception:\n\t{e!r}')
+
+    ###############################################################################################################
+    ## Updates
+    ###############################################################################################################
+
+    def update(self,scoreboards_json=None):
+        """
+        Finds every game that has changed since the last request, and sends them to every subscriber that follows them.
+
+        Parameters
+        ----------
+
+        scoreboards_json (list, optional) = None:
+            A decoded `scoreboards` payload that was downloaded elsewhere. If ```scoreboards_json = None```, the `scoreboards` endpoint is requested.
+
+        Returns
+        ----------
+
+        A list of the `EventId` of every game that changed.
+        """
+        if scoreboards_json == None:
+            scoreboards_json = self._get_client().get_scoring_json('scoreboards',self.xfl_api_token)
+
+        changed = {}
+        with self._lock:
+            for record in scoreboards_json:
+                game_id = record.get('EventId')
+                compare_record = {k:v for k,v in record.items() if k not in SCOREBOARD_IGNORED_KEYS}
+                if self._compare_records.get(game_id) == compare_record:
+                    continue
+
+                self._compare_records[game_id] = compare_record
+                self._records[game_id] = record
+                changed[game_id] = record
+
+            subscribers = list(self._subscribers.values())
+
+        if len(changed) == 0 or len(subscribers) == 0:
+            return list(changed)
+
+        ## Every changed game is parsed once, and each subscriber gets the rows of the games it follows.
+        data = _parse_xfl_schedule(list(changed.values()),season=self.season,output=self.output)
+        for callback,game_ids in subscribers:
+            if game_ids == None:
+                self._notify(callback,data)
+            elif not game_ids.isdisjoint(changed):
+                if self.output == 'arrow':
+                    self._notify(callback,data.filter(pc.is_in(data['EventId'],value_set=pa.array(list(game_ids),type=pa.string()))))
+                else:
+                    self._notify(callback,data[data['EventId'].isin(game_ids)])
+
+        return list(changed)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            started_at = time.monotonic()
+            try:
+                self.update()
+            except Exception as e:
+                warnings.warn(f'Could not update the XFL scoreboard:\n\t{e!r}')
+            self._stop_event.wait(max(0,self.interval - (time.monotonic() - started_at)))
+
+    def start(self):
+        """
+        Starts requesting the `scoreboards` endpoint every ```interval``` seconds, in a background thread.
+        """
+        if self._thread != None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run,name='XFLScoreboardHub',daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread started by `start()`, and waits for it to finish.
+        """
+        self._stop_event.set()
+        if self._thread != None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        self.stop()
@@ -0,0 +1,661 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import re
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import requests
+
+from xfl_fast_r.client import XFLClient, get_xfl_client
+from xfl_fast_r.save_xfl import XFL_DATASETS, XFL_GAME_DATASETS, XFL_SEASON_START_DATES, PARTITION_COLUMNS, get_xfl_game_date, get_xfl_week
+from xfl_fast_r.schemas import apply_dtypes, apply_arrow_dtypes, check_output, GAME_PARTICIPATION_DTYPES, PLAYER_BOX_DTYPES, TEAM_BOX_DTYPES, PBP_DTYPES, ROSTER_DTYPES, SCHEDULE_DTYPES, \
+    STANDINGS_DTYPES, TRANSACTIONS_DTYPES
+
+###################################################################################################################################################################################################################
+##
+##      Dataset Sources
+##
+###################################################################################################################################################################################################################
+
+XFL_DATA_REPOSITORY_URL = "https://raw.githubusercontent.com/armstjc/xfl-2023-data-repository/main"
+
+## Where each dataset is stored in the `xfl-2023-data-repository`.
+## Game-level datasets are stored as one file per game, and every other dataset as one file per season (or per season and week).
+_REPOSITORY_GAME_PATHS = {
+    'participation':'player_info/participation_data/parquet/{game_id}.parquet',
+    'player_box':'game_stats/player/raw/parquet/{game_id}.parquet',
+    'team_box':'game_stats/team/raw/parquet/{game_id}.parquet',
+    'pbp':'pbp/single_game/parquet/{game_id}.parquet'
+}
+
+_REPOSITORY_SEASON_PATHS = {
+    'player_box':'game_stats/player/parquet/{season}_xfl_player_game_stats.parquet',
+    'rosters':'rosters/{season}_xfl_roster.parquet',
+    'weekly_rosters':'rosters/weekly_rosters/parquet/{season}_{week}_xfl_roster.parquet',
+    'schedule':'schedule/{season}_xfl_schedule.parquet',
+    'standings':'standings/{season}_xfl_standings.parquet',
+    'weekly_standings':'standings/weekly_standings/parquet/{season}_{week}_xfl_standings.parquet'
+}
+
+## The types of the partition columns, which are stored in the directory names of a `XFLParquetWriter` dataset.
+_PARTITION_TYPES = {
+    'Season':pa.int16(),
+    'Week':pa.int16(),
+    'game_id':pa.string()
+}
+
+## The dtype schema each dataset is loaded with, so that loaded data has the same dtypes as the matching `get_xfl_*()` function.
+_DATASET_DTYPES = {
+    'participation':GAME_PARTICIPATION_DTYPES,
+    'player_box':PLAYER_BOX_DTYPES,
+    'team_box':TEAM_BOX_DTYPES,
+    'pbp':PBP_DTYPES,
+    'rosters':ROSTER_DTYPES,
+    'weekly_rosters':ROSTER_DTYPES,
+    'schedule':SCHEDULE_DTYPES,
+    'standings':STANDINGS_DTYPES,
+    'weekly_standings':STANDINGS_DTYPES,
+    'transactions':TRANSACTIONS_DTYPES
+}
+
+## Partition columns that the matching `get_xfl_*()` function names differently (ex. the `season` column of transactions).
+## A `XFLParquetWriter` stores these as the partition column, so they are renamed back when the dataset is loaded.
+_RENAMED_PARTITION_COLUMNS = {
+    'transactions':{'Season':'season'}
+}
+
+## The column that ```teams``` is matched against in each dataset.
+## Datasets with a game ID column instead are filtered to the games that a team played in.
+_TEAM_COLUMNS = {
+    'participation':'TeamId',
+    'player_box':'TeamId',
+    'team_box':'OfficialID',
+    'pbp':'game_id',
+    'rosters':'TeamId',
+    'weekly_rosters':'TeamId',
+    'schedule':'EventId',
+    'standings':'OfficialID',
+    'weekly_standings':'OfficialID',
+    'transactions':'team_id'
+}
+
+###################################################################################################################################################################################################################
+##
+##      Filters
+##
+###################################################################################################################################################################################################################
+
+def _as_list(x):
+    if x == None:
+        return None
+    elif isinstance(x,(str,int)):
+        return [x]
+    else:
+        return list(x)
+
+def _games_played_by(column:str,teams:list):
+    """
+    Returns an expression that matches every game ID (ex. ```"FOOTBALL_XFL_2023_2_18_VGS@ARL"```) with one of ```teams``` as the visitor or home team.
+    """
+    teams = '|'.join(re.escape(x) for x in teams)
+    return pc.match_substring_regex(ds.field(column),f'_({teams})@|@({teams})$')
+
+def _game_matches(game_id:str,seasons:list,weeks:list,teams:list):
+    """
+    Returns `True` if a game ID passes the ```seasons```, ```weeks```, and ```teams``` filters,
+    so that files for games that would be filtered out are never read.
+    """
+    if seasons != None and get_xfl_game_date(game_id).year not in seasons:
+        return False
+    if weeks != None and get_xfl_week(game_id) not in weeks:
+        return False
+    if teams != None:
+        visitor, _, home = game_id.rsplit('_',1)[-1].partition('@')
+        if visitor not in teams and home not in teams:
+            return False
+    return True
+
+def _build_filter(dataset:str,seasons=None,weeks=None,game_ids=None,teams=None):
+    """
+    Returns a `pyarrow.dataset` expression for the rows that pass every filter, or `None` if there are no filters.
+    """
+    expressions = []
+
+    if seasons != None:
+        expressions.append(ds.field('Season').isin(seasons))
+    if weeks != None:
+        expressions.append(ds.field('Week').isin(weeks))
+    if game_ids != None:
+        expressions.append(ds.field('game_id').isin(game_ids))
+
+    if teams != None:
+        team_column = _TEAM_COLUMNS[dataset]
+        if team_column in ('game_id','EventId'):
+            expressions.append(_games_played_by(team_column,teams))
+        else:
+            ## A team's players only show up in that team's games,
+            ## so matching the game ID as well lets whole games be skipped without reading them.
+            if dataset in XFL_GAME_DATASETS:
+                expressions.append(_games_played_by('game_id',teams))
+            expressions.append(ds.field(team_column).isin(teams))
+
+    if len(expressions) == 0:
+        return None
+
+    expression = expressions[0]
+    for x in expressions[1:]:
+        expression = expression & x
+    return expression
+
+###################################################################################################################################################################################################################
+##
+##      Readers
+##
+###################################################################################################################################################################################################################
+
+def _is_data_lake(dataset_dir:str):
+    """
+    Returns `True` if ```dataset_dir``` was written by a `XFLParquetWriter`.
+    """
+    if os.path.exists(os.path.join(dataset_dir,'_common_metadata')):
+        return True
+    return os.path.isdir(dataset_dir) and any(x.startswith('Season=') for x in os.listdir(dataset_dir))
+
+def _read_data_lake(dataset:str,dataset_dir:str,columns:list,filter_expression):
+    """
+    Reads a Hive-partitioned `XFLParquetWriter` dataset with `pyarrow.dataset`,
+    so that only the requested columns, and only the partitions and row groups that pass the filter, are read.
+    """
+    if dataset in XFL_GAME_DATASETS:
+        partition_columns = list(PARTITION_COLUMNS)
+    elif dataset.startswith('weekly_'):
+        partition_columns = ['Season','Week']
+    else:
+        partition_columns = ['Season']
+
+    partition_schema = pa.schema([(x,_PARTITION_TYPES[x]) for x in partition_columns])
+
+    ## The dataset-level schema is used instead of the schema of the first file,
+    ## so that columns that only exist in some games (ex. penalty columns) are always read.
+    try:
+        schema = pq.read_schema(os.path.join(dataset_dir,'_common_metadata'))
+        for x in partition_columns:
+            if x in schema.names:
+                schema = schema.remove(schema.get_field_index(x))
+        schema = pa.schema(list(partition_schema) + list(schema),metadata=schema.metadata)
+    except (OSError,pa.ArrowInvalid):
+        schema = None
+
+    dataset_obj = ds.dataset(dataset_dir,format='parquet',partitioning=ds.partitioning(partition_schema,flavor='hive'),schema=schema)
+    return dataset_obj.to_table(columns=columns,filter=filter_expression)
+
+def _repository_paths(dataset:str,seasons:list,weeks:list,game_ids:list,teams:list,source:str,client:XFLClient):
+    """
+    Returns the path of every file in a `xfl-2023-data-repository` layout that could have rows that pass the filters.
+    """
+    if dataset in XFL_GAME_DATASETS and (game_ids != None or dataset not in _REPOSITORY_SEASON_PATHS):
+        if game_ids == None:
+            game_ids = _list_repository_games(dataset,seasons,source,client)
+        game_ids = [x for x in game_ids if _game_matches(x,seasons,weeks,teams)]
+        return [_REPOSITORY_GAME_PATHS[dataset].format(game_id=x) for x in game_ids]
+
+    if dataset.startswith('weekly_'):
+        return [_REPOSITORY_SEASON_PATHS[dataset].format(season=s,week=w) for s in seasons for w in weeks]
+
+    try:
+        return [_REPOSITORY_SEASON_PATHS[dataset].format(season=s) for s in seasons]
+    except KeyError:
+        raise ValueError(f'`{dataset}` data is not stored in the xfl-2023-data-repository. Pass a `XFLParquetWriter` directory as `source` instead.')
+
+def _list_repository_games(dataset:str,seasons:list,source:str,client:XFLClient):
+    """
+    Returns every game ID in a `xfl-2023-data-repository` layout.
+    A local copy is listed directly, and the games in a remote copy are read from its schedule.
+    """
+    if source != None:
+        game_dir = os.path.dirname(os.path.join(source,_REPOSITORY_GAME_PATHS[dataset]))
+        try:
+            return sorted(x[:-len('.parquet')] for x in os.listdir(game_dir) if x.endswith('.parquet'))
+        except OSError:
+            return []
+
+    schedule = _read_repository('schedule',seasons=seasons,weeks=None,game_ids=None,teams=None,source=None,client=client)
+    if 'EventId' not in schedule.column_names:
+        return []
+    return pc.unique(schedule['EventId']).to_pylist()
+
+def _read_parquet_file(path:str,client:XFLClient):
+    """
+    Reads one Parquet file from a local path or a URL.
+    Returns `None` if that file does not exist.
+    """
+    if not path.startswith(('http://','https://')):
+        try:
+            return pq.read_table(path)
+        except FileNotFoundError:
+            return None
+
+    try:
+        response = client.get(path)
+    except requests.HTTPError as e:
+        if e.response != None and e.response.status_code == 404:
+            return None
+        raise
+
+    return pq.read_table(pa.BufferReader(response.content))
+
+def _read_repository(dataset:str,seasons:list,weeks:list,game_ids:list,teams:list,source:str,client:XFLClient,max_workers=8):
+    """
+    Reads every file in a `xfl-2023-data-repository` layout that could have rows that pass the filters,
+    and combines them into one `pyarrow.Table`.
+    """
+    root = XFL_DATA_REPOSITORY_URL if source == None else source
+    paths = _repository_paths(dataset,seasons,weeks,game_ids,teams,source,client)
+    if source == None:
+        paths = [f'{root}/{x}' for x in paths]
+    else:
+        paths = [os.path.join(root,x) for x in paths]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tables = [x for x in executor.map(lambda x: _read_parquet_file(x,client),paths) if x != None]
+
+    if len(tables) == 0:
+        return pa.table({})
+
+    ## Drop the pandas index that older files were written with.
+    tables = [x.drop_columns([c for c in x.column_names if c.startswith('__index_level_')]) for x in tables]
+    return pa.concat_tables(tables,promote_options='permissive')
+
+def _add_week_column(table:pa.Table):
+    """
+    Adds the `Week` column that a `XFLParquetWriter` dataset would have, calculated from each row's game ID.
+    """
+    if 'Week' in table.column_names or 'game_id' not in table.column_names or table.num_rows == 0:
+        return table
+
+    game_ids = pc.unique(table['game_id'])
+    weeks = pa.array([get_xfl_week(x) for x in game_ids.to_pylist()],type=pa.int16())
+    return table.append_column('Week',pc.take(weeks,pc.index_in(table['game_id'],game_ids)))
+
+def _load_xfl(dataset:str,seasons=None,weeks=None,game_ids=None,teams=None,columns=None,source=None,client:XFLClient=None,output='pandas'):
+    """
+    Loads a dataset from a `XFLParquetWriter` directory, a local copy of the `xfl-2023-data-repository`, or the `xfl-2023-data-repository` on GitHub,
+    and returns only the requested columns for the rows that pass every filter.
+    """
+    check_output(output)
+
+    seasons = _as_list(seasons)
+    weeks = _as_list(weeks)
+    game_ids = _as_list(game_ids)
+    teams = _as_list(teams)
+    columns = _as_list(columns)
+
+    renamed_columns = _RENAMED_PARTITION_COLUMNS.get(dataset,{})
+    if columns != None:
+        columns = [{v:k for k,v in renamed_columns.items()}.get(x,x) for x in columns]
+
+    if source != None and _is_data_lake(os.path.join(os.path.expanduser(source),XFL_DATASETS[dataset])):
+        dataset_dir = os.path.join(os.path.expanduser(source),XFL_DATASETS[dataset])
+        table = _read_data_lake(dataset,dataset_dir,columns,_build_filter(dataset,seasons,weeks,game_ids,teams))
+    else:
+        if source != None:
+            source = os.path.expanduser(source)
+        elif client == None:
+            client = get_xfl_client()
+
+        table = _read_repository(dataset,seasons or list(XFL_SEASON_START_DATES),weeks,game_ids,teams,source,client)
+
+        if dataset in XFL_GAME_DATASETS:
+            table = _add_week_column(table)
+
+        ## Files are only read for the requested seasons (and weeks, for weekly snapshots),
+        ## so the remaining filters are applied to the rows that were read.
+        if table.num_rows > 0:
+            filter_expression = _build_filter(dataset,None,weeks if dataset in XFL_GAME_DATASETS else None,game_ids,teams)
+            if filter_expression is not None:
+                table = table.filter(filter_expression)
+            if columns != None:
+                table = table.select(columns)
+
+    ## The partition columns are moved to the front, where the matching `get_xfl_*()` function puts them.
+    if columns == None:
+        partition_columns = [x for x in PARTITION_COLUMNS if x in table.column_names]
+        table = table.select(partition_columns + [x for x in table.column_names if x not in partition_columns])
+
+    dtypes = {'Season':'Int16','Week':'Int16',**_DATASET_DTYPES[dataset]}
+    if len(renamed_columns) > 0:
+        table = table.rename_columns([renamed_columns.get(x,x) for x in table.column_names])
+        dtypes = {renamed_columns.get(k,k):v for k,v in dtypes.items()}
+    if output == 'arrow':
+        return apply_arrow_dtypes(table,dtypes)
+
+    return apply_dtypes(table.to_pandas(),dtypes)
+
+###################################################################################################################################################################################################################
+##
+##      Game Data
+##
+###################################################################################################################################################################################################################
+
+def load_xfl_game_participation(seasons=None,weeks=None,game_ids=None,teams=None,columns=None,source=None,client:XFLClient=None,output='pandas'):
+    """
+    Loads saved player participation data for XFL 3.0 games, without calling the XFL API.
+
+    Parameters
+    ----------
+
+    seasons (int or list, optional) = None:
+        The season(s) you want player participation data from. If ```seasons = None```, every season is loaded.
+
+    weeks (int or list, optional) = None:
+        The week(s) you want player participation data from. If ```weeks = None```, every week is loaded.
+
+    game_ids (str or list, optional) = None:
+        The game(s) you want player participation data from (ex. ```["FOOTBALL_XFL_2023_2_18_VGS@ARL"]```). If ```game_ids = None```, every game is loaded.
+
+    teams (str or list, optional) = None:
+        The team(s) you want player participation data for (ex. ```["ARL","VGS"]```). If ```teams = None```, every team is loaded.
+
+    columns (list, optional) = None:
+        The columns you want. If ```columns = None```, every column is loaded.
+
+    source (str, optional) = None:
+        The directory this data is loaded from.
+        This can be the ```root_dir``` of a `XFLParquetWriter`, or a local copy of the `xfl-2023-data-repository`.
+        If ```source = None```, this data is downloaded from the `xfl-2023-data-repository` on GitHub.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to download this data, if ```source = None```.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is returned instead of a pandas DataFrame.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with the same columns as `get_xfl_game_participation()`, plus a `Week` column.
+    """
+    return _load_xfl('participation',seasons=seasons,weeks=weeks,game_ids=game_ids,teams=teams,columns=columns,source=source,client=client,output=output)
+
+def load_xfl_player_box(seasons=None,weeks=None,game_ids=None,teams=None,columns=None,source=None,client:XFLClient=None,output='pandas'):
+    """
+    Loads saved player box score data for XFL 3.0 games, without calling the XFL API.
+
+    Parameters
+    ----------
+
+    seasons (int or list, optional) = None:
+        The season(s) you want player box score data from. If ```seasons = None```, every season is loaded.
+
+    weeks (int or list, optional) = None:
+        The week(s) you want player box score data from. If ```weeks = None```, every week is loaded.
+
+    game_ids (str or list, optional) = None:
+        The game(s) you want player box score data from (ex. ```["FOOTBALL_XFL_2023_2_18_VGS@ARL"]```). If ```game_ids = None```, every game is loaded.
+
+    teams (str or list, optional) = None:
+        The team(s) you want player box score data for (ex. ```["ARL","VGS"]```). If ```teams = None```, every team is loaded.
+
+    columns (list, optional) = None:
+        The columns you want (ex. ```["game_id","OfficialID","PassYards"]```). If ```columns = None```, every column is loaded.
+
+    source (str, optional) = None:
+        The directory this data is loaded from.
+        This can be the ```root_dir``` of a `XFLParquetWriter`, or a local copy of the `xfl-2023-data-repository`.
+        If ```source = None```, this data is downloaded from the `xfl-2023-data-repository` on GitHub.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to download this data, if ```source = None```.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is returned instead of a pandas DataFrame.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with the same columns as `get_xfl_player_box()`, plus a `Week` column.
+    """
+    return _load_xfl('player_box',seasons=seasons,weeks=weeks,game_ids=game_ids,teams=teams,columns=columns,source=source,client=client,output=output)
+
+def load_xfl_team_box(seasons=None,weeks=None,game_ids=None,teams=None,columns=None,source=None,client:XFLClient=None,output='pandas'):
+    """
+    Loads saved team box score data for XFL 3.0 games, without calling the XFL API.
+
+    Parameters
+    ----------
+
+    seasons (int or list, optional) = None:
+        The season(s) you want team box score data from. If ```seasons = None```, every season is loaded.
+
+    weeks (int or list, optional) = None:
+        The week(s) you want team box score data from. If ```weeks = None```, every week is loaded.
+
+    game_ids (str or list, optional) = None:
+        The game(s) you want team box score data from (ex. ```["FOOTBALL_XFL_2023_2_18_VGS@ARL"]```). If ```game_ids = None```, every game is loaded.
+
+    teams (str or list, optional) = None:
+        The team(s) you want team box score data for (ex. ```["ARL","VGS"]```). If ```teams = None```, every team is loaded.
+
+    columns (list, optional) = None:
+        The columns you want. If ```columns = None```, every column is loaded.
+
+    source (str, optional) = None:
+        The directory this data is loaded from.
+        This can be the ```root_dir``` of a `XFLParquetWriter`, or a local copy of the `xfl-2023-data-repository`.
+        If ```source = None```, this data is downloaded from the `xfl-2023-data-repository` on GitHub.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to download this data, if ```source = None```.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is returned instead of a pandas DataFrame.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with the same columns as `get_xfl_team_box()`, plus a `Week` column.
+    """
+    return _load_xfl('team_box',seasons=seasons,weeks=weeks,game_ids=game_ids,teams=teams,columns=columns,source=source,client=client,output=output)
+
+def load_xfl_pbp(seasons=None,weeks=None,game_ids=None,teams=None,columns=None,source=None,client:XFLClient=None,output='pandas'):
+    """
+    Loads saved play-by-play data for XFL 3.0 games, without calling the XFL API.
+
+    Parameters
+    ----------
+
+    seasons (int or list, optional) = None:
+        The season(s) you want play-by-play data from. If ```seasons = None```, every season is loaded.
+
+    weeks (int or list, optional) = None:
+        The week(s) you want play-by-play data from. If ```weeks = None```, every week is loaded.
+
+    game_ids (str or list, optional) = None:
+        The game(s) you want play-by-play data from (ex. ```["FOOTBALL_XFL_2023_2_18_VGS@ARL"]```). If ```game_ids = None```, every game is loaded.
+
+    teams (str or list, optional) = None:
+        If set, only the games these team(s) played in are loaded (ex. ```["ARL","VGS"]```).
+
+    columns (list, optional) = None:
+        The columns you want (ex. ```["game_id","MarkerUTC","MinorType"]```). If ```columns = None```, every column is loaded.
+
+    source (str, optional) = None:
+        The directory this data is loaded from.
+        This can be the ```root_dir``` of a `XFLParquetWriter`, or a local copy of the `xfl-2023-data-repository`.
+        If ```source = None```, this data is downloaded from the `xfl-2023-data-repository` on GitHub.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to download this data, if ```source = None```.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is returned instead of a pandas DataFrame.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with the same columns as `get_xfl_pbp()`, plus a `Week` column.
+    """
+    return _load_xfl('pbp',seasons=seasons,weeks=weeks,game_ids=game_ids,teams=teams,columns=columns,source=source,client=client,output=output)
+
+###################################################################################################################################################################################################################
+##
+##      Season Data
+##
+###################################################################################################################################################################################################################
+
+def load_xfl_rosters(seasons=None,weeks=None,teams=None,columns=None,source=None,client:XFLClient=None,output='pandas'):
+    """
+    Loads saved XFL 3.0 rosters, without calling the XFL API.
+
+    Parameters
+    ----------
+
+    seasons (int or list, optional) = None:
+        The season(s) you want rosters from. If ```seasons = None```, every season is loaded.
+
+    weeks (int or list, optional) = None:
+        If set, the weekly roster snapshots for these week(s) are loaded, instead of the season-level rosters.
+
+    teams (str or list, optional) = None:
+        The team(s) you want rosters for (ex. ```["ARL","VGS"]```). If ```teams = None```, every team is loaded.
+
+    columns (list, optional) = None:
+        The columns you want. If ```columns = None```, every column is loaded.
+
+    source (str, optional) = None:
+        The directory this data is loaded from.
+        This can be the ```root_dir``` of a `XFLParquetWriter`, or a local copy of the `xfl-2023-data-repository`.
+        If ```source = None```, this data is downloaded from the `xfl-2023-data-repository` on GitHub.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to download this data, if ```source = None```.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is returned instead of a pandas DataFrame.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with the same columns as `get_xfl_rosters()`.
+    """
+    dataset = 'rosters' if weeks == None else 'weekly_rosters'
+    return _load_xfl(dataset,seasons=seasons,weeks=weeks,teams=teams,columns=columns,source=source,client=client,output=output)
+
+def load_xfl_schedule(seasons=None,teams=None,columns=None,source=None,client:XFLClient=None,output='pandas'):
+    """
+    Loads saved XFL 3.0 schedules, without calling the XFL API.
+
+    Parameters
+    ----------
+
+    seasons (int or list, optional) = None:
+        The season(s) you want a schedule from. If ```seasons = None```, every season is loaded.
+
+    teams (str or list, optional) = None:
+        If set, only the games these team(s) play in are loaded (ex. ```["ARL","VGS"]```).
+
+    columns (list, optional) = None:
+        The columns you want. If ```columns = None```, every column is loaded.
+
+    source (str, optional) = None:
+        The directory this data is loaded from.
+        This can be the ```root_dir``` of a `XFLParquetWriter`, or a local copy of the `xfl-2023-data-repository`.
+        If ```source = None```, this data is downloaded from the `xfl-2023-data-repository` on GitHub.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to download this data, if ```source = None```.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is returned instead of a pandas DataFrame.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with the same columns as `get_xfl_schedule()`.
+    """
+    return _load_xfl('schedule',seasons=seasons,teams=teams,columns=columns,source=source,client=client,output=output)
+
+def load_xfl_standings(seasons=None,weeks=None,teams=None,columns=None,source=None,client:XFLClient=None,output='pandas'):
+    """
+    Loads saved XFL 3.0 standings, without calling the XFL API.
+
+    Parameters
+    ----------
+
+    seasons (int or list, optional) = None:
+        The season(s) you want standings from. If ```seasons = None```, every season is loaded.
+
+    weeks (int or list, optional) = None:
+        If set, the weekly standings snapshots for these week(s) are loaded, instead of the season-level standings.
+
+    teams (str or list, optional) = None:
+        The team(s) you want standings for (ex. ```["ARL","VGS"]```). If ```teams = None```, every team is loaded.
+
+    columns (list, optional) = None:
+        The columns you want. If ```columns = None```, every column is loaded.
+
+    source (str, optional) = None:
+        The directory this data is loaded from.
+        This can be the ```root_dir``` of a `XFLParquetWriter`, or a local copy of the `xfl-2023-data-repository`.
+        If ```source = None```, this data is downloaded from the `xfl-2023-data-repository` on GitHub.
+
+    client (XFLClient, optional) = None:
+        The `XFLClient` used to download this data, if ```source = None```.
+        If ```client = None```, the package-wide client from `get_xfl_client()` is used.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is returned instead of a pandas DataFrame.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with the same columns as `get_xfl_standings()`.
+    """
+    dataset = 'standings' if weeks == None else 'weekly_standings'
+    return _load_xfl(dataset,seasons=seasons,weeks=weeks,teams=teams,columns=columns,source=source,client=client,output=output)
+
+def load_xfl_transactions(seasons=None,teams=None,columns=None,source=None,output='pandas'):
+    """
+    Loads saved XFL 3.0 roster transactions, without scraping the XFL's website.
+    Transactions are not stored in the `xfl-2023-data-repository`, so they can only be loaded from a `XFLParquetWriter` directory.
+
+    Parameters
+    ----------
+
+    seasons (int or list, optional) = None:
+        The season(s) you want transactions from. If ```seasons = None```, every season is loaded.
+
+    teams (str or list, optional) = None:
+        The team(s) you want transactions for (ex. ```["ARL","VGS"]```). If ```teams = None```, every team is loaded.
+
+    columns (list, optional) = None:
+        The columns you want. If ```columns = None```, every column is loaded.
+
+    source (str, optional) = None:
+        The ```root_dir``` of the `XFLParquetWriter` this data was saved with. Must be set for this function to work.
+
+    output (str, optional) = "pandas":
+        The type of table this function returns.
+        If ```output = "arrow"```, a `pyarrow.Table` is returned instead of a pandas DataFrame.
+
+    Returns
+    ----------
+
+    A pandas DataFrame (or a `pyarrow.Table`, if ```output = "arrow"```) with the same columns as `get_xfl_transactions()`.
+    """
+    return _load_xfl('transactions',seasons=seasons,teams=teams,columns=columns,source=source,output=output)
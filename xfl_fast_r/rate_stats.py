@@ -0,0 +1,232 @@
+from typing import Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+###################################################################################################################################################################################################################
+##
+##      Rate Stat Kernels
+##
+###################################################################################################################################################################################################################
+
+## Each of the four parts of the NFL passer rating is capped between 0 and 2.375.
+NFL_PASSER_RATING_PART_MAX = 2.375
+
+def _as_float(values):
+    """
+    Returns ```values``` (a pandas Series, a `pyarrow` array, a NumPy array, or a number) as a `float64` NumPy array,
+    with every null value as NaN.
+    """
+    if isinstance(values,(pa.Array,pa.ChunkedArray)):
+        return values.to_numpy(zero_copy_only=False).astype('float64')
+    elif isinstance(values,(pd.Series,pd.Index)):
+        return values.to_numpy(dtype='float64',na_value=np.nan)
+    return np.asarray(values,dtype='float64')
+
+def safe_divide(numerator,denominator,where=None):
+    """
+    Divides ```numerator``` by ```denominator```, element by element, without any divide by zero warnings.
+
+    Parameters
+    ----------
+
+    numerator (array-like, manditory):
+        The values being divided.
+
+    denominator (array-like, manditory):
+        The values ```numerator``` is divided by.
+
+    where (array-like, optional) = None:
+        A boolean mask of the rows that are divided. Every other row is NaN.
+        If ```where = None```, only rows where ```denominator``` is at least 1 are divided,
+        since every denominator in a rate stat is a count (ex. pass attempts).
+
+    Returns
+    ----------
+
+    A `float64` NumPy array.
+    """
+    numerator = _as_float(numerator)
+    denominator = _as_float(denominator)
+
+    if where is None:
+        where = denominator >= 1
+
+    result = np.full(np.broadcast(numerator,denominator).shape,np.nan)
+    np.divide(numerator,denominator,out=result,where=where)
+    return result
+
+def completion_percent(completions,attempts):
+    """
+    Returns the completion percentage (as a fraction between 0 and 1) of every passer, or NaN for passers without a pass attempt.
+    """
+    return safe_divide(completions,attempts)
+
+def yards_per_attempt(yards,attempts):
+    """
+    Returns the yards per attempt (ex. pass yards per pass attempt, or rush yards per rush attempt), or NaN for players without an attempt.
+    """
+    return safe_divide(yards,attempts)
+
+def catch_percent(receptions,targets):
+    """
+    Returns the share of the passes thrown at every receiver that they caught, or NaN for receivers without a target.
+    """
+    return safe_divide(receptions,targets)
+
+def fg_percent(fg_made,fg_attempts):
+    """
+    Returns the field goal percentage (as a fraction between 0 and 1) of every kicker, or NaN for kickers without a field goal attempt.
+    """
+    return safe_divide(fg_made,fg_attempts)
+
+def sack_percent(sacked,pass_attempts):
+    """
+    Returns the share of every passer's dropbacks (pass attempts and sacks) that ended in a sack, or NaN for passers without a pass attempt.
+    """
+    sacked = _as_float(sacked)
+    pass_attempts = _as_float(pass_attempts)
+    return safe_divide(sacked,pass_attempts + sacked,where=pass_attempts >= 1)
+
+def cfb_passer_rating(completions,attempts,yards,touchdowns,interceptions):
+    """
+    Returns the NCAA passer efficiency rating of every passer, or NaN for passers without a pass attempt.
+    """
+    numerator = (8.4 * _as_float(yards)) + (330 * _as_float(touchdowns)) + (100 * _as_float(completions)) - (200 * _as_float(interceptions))
+    return safe_divide(numerator,attempts)
+
+def _nfl_passer_rating(completion_rate,yards_per_att,touchdown_rate,interception_rate):
+    """
+    Returns the NFL passer rating from its four per-attempt rates. A NaN rate makes the rating NaN.
+    """
+    parts = np.array([
+        (_as_float(completion_rate) - 0.3) * 5,
+        (_as_float(yards_per_att) - 3) * 0.25,
+        _as_float(touchdown_rate) * 20,
+        NFL_PASSER_RATING_PART_MAX - (_as_float(interception_rate) * 25)
+    ])
+    parts = np.clip(parts,0,NFL_PASSER_RATING_PART_MAX)
+    return (parts.sum(axis=0) / 6) * 100
+
+def nfl_passer_rating(completions,attempts,yards,touchdowns,interceptions):
+    """
+    Returns the NFL passer rating (between 0 and 158.3) of every passer, or NaN for passers without a pass attempt.
+    """
+    return _nfl_passer_rating(
+        safe_divide(completions,attempts),
+        safe_divide(yards,attempts),
+        safe_divide(touchdowns,attempts),
+        safe_divide(interceptions,attempts)
+    )
+
+def nfl_passer_rating_from_api_rates(completion_percent,yards_per_att,attempts,touchdowns,interceptions):
+    """
+    Returns the NFL passer rating of every passer, with the completion percentage and yards per attempt reported by the XFL API
+    (`PassCompPercent` and `PassYardsPerAtt`) instead of ones calculated from the counting stats, or NaN for passers without a pass attempt.
+    This is how the NFL passer rating in a player box score has always been calculated.
+    """
+    return _nfl_passer_rating(
+        completion_percent,
+        yards_per_att,
+        safe_divide(touchdowns,attempts),
+        safe_divide(interceptions,attempts)
+    )
+
+###################################################################################################################################################################################################################
+##
+##      Rate Stat Tables
+##
+###################################################################################################################################################################################################################
+
+class RateStat(NamedTuple):
+    """
+    Describes one rate stat column, and how it is calculated from the counting stats in a DataFrame.
+
+    column (str):
+        The name of the rate stat column.
+
+    kernel (callable):
+        The function that calculates this rate stat (ex. `nfl_passer_rating`).
+
+    inputs (tuple):
+        The columns passed to ```kernel```, in order.
+    """
+    column: str
+    kernel: Callable
+    inputs: tuple
+
+_PASSER_RATING_INPUTS = ('PassComp','PassAtt','PassYards','PassTD','PassINT')
+
+## The rate stats calculated by `get_xfl_player_box()`. Every other rate stat in a player box score comes from the XFL API.
+## The player box `NFL_QBR` uses the completion percentage and yards per attempt from the XFL API, rather than recalculating them.
+PLAYER_BOX_RATE_STATS = [
+    RateStat('CFB_QBR',cfb_passer_rating,_PASSER_RATING_INPUTS),
+    RateStat('NFL_QBR',nfl_passer_rating_from_api_rates,('PassCompPercent','PassYardsPerAtt','PassAtt','PassTD','PassINT'))
+]
+
+## The rate stats calculated by `generate_xfl_season_stats()`.
+SEASON_RATE_STATS = [
+    RateStat('PassCompPercent',completion_percent,('PassComp','PassAtt')),
+    RateStat('FirstDownPercentOfPasses',safe_divide,('FirstDownsByPass','PassAtt')),
+    RateStat('PASS_YPA',yards_per_attempt,('PassYards','PassAtt')),
+    RateStat('PASS_YPC',safe_divide,('PassYards','PassComp')),
+    RateStat('PASS_YDS_GM',safe_divide,('PassYards','Participated')),
+    RateStat('CFB_QBR',cfb_passer_rating,_PASSER_RATING_INPUTS),
+    RateStat('NFL_QBR',nfl_passer_rating,_PASSER_RATING_INPUTS),
+    RateStat('SackedYardsAvg',safe_divide,('SackedYards','Sacked')),
+    RateStat('SACKED%',sack_percent,('Sacked','PassAtt')),
+    RateStat('RushYardsAvg',yards_per_attempt,('RushYards','RushAtt')),
+    RateStat('FirstDownPercentOfRushes',safe_divide,('FirstDownsByRush','RushAtt')),
+    RateStat('RecYardsAvg',safe_divide,('RecYards','Recs')),
+    RateStat('FirstDownPercentOfRecs',safe_divide,('FirstDownsByRec','Recs')),
+    RateStat('CATCH%',catch_percent,('Recs','RecThrownAt')),
+    RateStat('RecYardsAfterCatchAvg',safe_divide,('RecYardsAfterCatch','Recs')),
+    RateStat('DefSackYardsAvg',safe_divide,('DefSackYards','DefSacks')),
+    RateStat('DefINTReturnYardsAvg',safe_divide,('DefINTReturnYards','DefINT')),
+    RateStat('FG%',fg_percent,('FGMade','FGAtt')),
+    RateStat('PuntGrossYardsAvg',safe_divide,('PuntGrossYards','Punts')),
+    RateStat('PuntRetYardsAvg',safe_divide,('PuntRetYards','PuntRetReturns')),
+    RateStat('KickRetYardsAvg',safe_divide,('KickRetYards','KickRetReturns'))
+]
+
+def calculate_rate_stats(data,rate_stats:list=SEASON_RATE_STATS):
+    """
+    Calculates rate stats from the counting stats in a DataFrame or `pyarrow.Table`.
+
+    Parameters
+    ----------
+
+    data (pandas.DataFrame or pyarrow.Table, manditory):
+        The counting stats every rate stat is calculated from (ex. player game logs, or season stats).
+
+    rate_stats (list, optional) = SEASON_RATE_STATS:
+        A list of `RateStat`s, describing every rate stat you want.
+
+    Returns
+    ----------
+
+    A dictionary of `float64` NumPy arrays, one per rate stat, in the same order as ```rate_stats```.
+    """
+    return {x.column:x.kernel(*[data[c] for c in x.inputs]) for x in rate_stats}
+
+def add_rate_stats(df:pd.DataFrame,rate_stats:list=SEASON_RATE_STATS):
+    """
+    Returns a copy of ```df``` with every rate stat in ```rate_stats``` added (or replaced), in a single call.
+
+    Parameters
+    ----------
+
+    df (pandas.DataFrame, manditory):
+        The counting stats every rate stat is calculated from (ex. player game logs, or season stats).
+
+    rate_stats (list, optional) = SEASON_RATE_STATS:
+        A list of `RateStat`s, describing every rate stat you want.
+
+    Returns
+    ----------
+
+    A pandas DataFrame.
+    """
+    rates_df = pd.DataFrame(calculate_rate_stats(df,rate_stats),index=df.index)
+    return pd.concat([df.drop(columns=[x for x in rates_df.columns if x in df.columns]),rates_df],axis=1)
@@ -0,0 +1,298 @@
+from datetime import date
+import os
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from xfl_fast_r.utils import atomic_write
+
+###################################################################################################################################################################################################################
+##
+##      Dataset Layout
+##
+###################################################################################################################################################################################################################
+
+## Where each dataset is stored under a writer's root directory.
+## This is the same layout as the `xfl-2023-data-repository`.
+XFL_DATASETS = {
+    'participation':'player_info/participation_data',
+    'player_box':'game_stats/player',
+    'team_box':'game_stats/team',
+    'pbp':'pbp',
+    'rosters':'rosters/season',
+    'weekly_rosters':'rosters/weekly',
+    'schedule':'schedule',
+    'standings':'standings/season',
+    'weekly_standings':'standings/weekly',
+    'transactions':'player_info/transactions'
+}
+
+## The datasets that are partitioned by game, as well as by season and week.
+XFL_GAME_DATASETS = ('participation','player_box','team_box','pbp')
+
+## The Monday of the week of each season's first game. Week 1 starts on this date.
+XFL_SEASON_START_DATES = {
+    2023:date(2023,2,13)
+}
+
+## The partition columns, in the order they are nested in.
+## These are stored in the directory names of a dataset (ex. `pbp/Season=2023/Week=1/game_id=.../part-0.parquet`),
+## and are removed from the Parquet files themselves.
+PARTITION_COLUMNS = ('Season','Week','game_id')
+
+## The number of rows in each Parquet row group.
+## A game's data easily fits in one row group, so this mostly matters for season-level datasets.
+DEFAULT_ROW_GROUP_SIZE = 65536
+
+def get_xfl_game_date(game_id:str):
+    """
+    Returns the date of a XFL 3.0 game, as a `datetime.date`, from its game ID.
+
+    Parameters
+    ----------
+
+    game_id (str, manditory):
+        A XFL API game ID (ex. ```"FOOTBALL_XFL_2023_2_18_VGS@ARL"```).
+    """
+    try:
+        _, _, year, month, day, _ = game_id.split('_',5)
+        return date(int(year),int(month),int(day))
+    except (AttributeError,ValueError):
+        raise ValueError(f'Could not read a date from the following game ID:\n\t{game_id}')
+
+def get_xfl_week(game_id:str):
+    """
+    Returns the week of the season a XFL 3.0 game was played in, from its game ID.
+
+    Parameters
+    ----------
+
+    game_id (str, manditory):
+        A XFL API game ID (ex. ```"FOOTBALL_XFL_2023_2_18_VGS@ARL"```).
+
+    Returns
+    ----------
+
+    The week (starting at 1) that game was played in.
+    """
+    game_date = get_xfl_game_date(game_id)
+
+    try:
+        season_start = XFL_SEASON_START_DATES[game_date.year]
+    except KeyError:
+        raise ValueError(f'The start date of the {game_date.year} XFL season is not known. Pass in the week of this game explicitly.')
+
+    return (game_date - season_start).days // 7 + 1
+
+###################################################################################################################################################################################################################
+##
+##      Parquet Writer
+##
+###################################################################################################################################################################################################################
+
+class XFLParquetWriter:
+    """
+    Saves XFL data to a local data lake of Hive-partitioned Parquet datasets,
+    so that analysts can read just the seasons, weeks, and games they need instead of downloading them again.
+
+    Game-level datasets are partitioned by season, week, and game (ex. `pbp/Season=2023/Week=1/game_id=FOOTBALL_XFL_2023_2_18_VGS@ARL/part-0.parquet`),
+    and every other dataset is partitioned by season (ex. `schedule/Season=2023/part-0.parquet`).
+    Weekly snapshots of rosters and standings are saved to their own datasets, which are also partitioned by week (ex. `rosters/weekly/Season=2023/Week=5/part-0.parquet`).
+
+    Every file is written to a temporary file first, and then moved into place, so a reader never sees a partially written file.
+    Saving a partition again replaces it, so re-running a job does not create duplicate rows.
+    Each dataset also has a `_common_metadata` file with a schema that every file in that dataset can be read with.
+
+    Parameters
+    ----------
+
+    root_dir (str, manditory):
+        The directory that every dataset is saved under. It will be created if it does not exist.
+
+    row_group_size (int, optional) = 65536:
+        The maximum number of rows in each Parquet row group.
+
+    compression (str, optional) = "zstd":
+        The compression codec used for every Parquet file (ex. ```"snappy"```, ```"zstd"```, or ```"none"```).
+    """
+
+    def __init__(self,root_dir:str,row_group_size=DEFAULT_ROW_GROUP_SIZE,compression='zstd'):
+        self.root_dir = os.path.expanduser(root_dir)
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self._lock = threading.Lock()
+        os.makedirs(self.root_dir,exist_ok=True)
+
+    ###############################################################################################################
+    ## Paths
+    ###############################################################################################################
+
+    def dataset_dir(self,dataset:str):
+        """
+        Returns the directory a dataset (ex. ```"pbp"```) is saved in.
+        """
+        try:
+            return os.path.join(self.root_dir,XFL_DATASETS[dataset])
+        except KeyError:
+            raise ValueError(f'`dataset` must be one of {tuple(XFL_DATASETS)}, not "{dataset}".')
+
+    def partition_dir(self,dataset:str,season:int,week:int=None,game_id:str=None):
+        """
+        Returns the directory a single partition of a dataset is saved in.
+        """
+        path = os.path.join(self.dataset_dir(dataset),f'Season={season}')
+        if week != None:
+            path = os.path.join(path,f'Week={week}')
+        if game_id != None:
+            path = os.path.join(path,f'game_id={game_id}')
+        return path
+
+    ###############################################################################################################
+    ## Writing
+    ###############################################################################################################
+
+    @staticmethod
+    def _to_table(data):
+        if isinstance(data,pa.Table):
+            return data
+        elif isinstance(data,pd.DataFrame):
+            return pa.Table.from_pandas(data,preserve_index=False)
+        else:
+            raise TypeError(f'`data` must be a pandas DataFrame or a `pyarrow.Table`, not a {type(data).__name__}.')
+
+    def _update_common_metadata(self,dataset:str,schema:pa.Schema):
+        """
+        Merges ```schema``` into the `_common_metadata` file of a dataset.
+        Columns that only exist in some partitions are kept, and columns with different types in different partitions are promoted to a common type.
+        """
+        path = os.path.join(self.dataset_dir(dataset),'_common_metadata')
+
+        with self._lock:
+            try:
+                old_schema = pq.read_schema(path)
+            except (OSError,pa.ArrowInvalid):
+                old_schema = None
+
+            if old_schema != None:
+                if old_schema.equals(schema,check_metadata=False):
+                    return
+                try:
+                    schema = pa.unify_schemas([old_schema,schema],promote_options='permissive')
+                except (pa.ArrowInvalid,pa.ArrowTypeError):
+                    ## These types can not be promoted to a common type, so the newest schema is kept.
+                    pass
+
+            atomic_write(path,lambda tmp_path: pq.write_metadata(schema,tmp_path))
+
+    def write(self,dataset:str,data,season:int,week:int=None,game_id:str=None):
+        """
+        Saves a DataFrame or `pyarrow.Table` as one partition of a dataset, replacing that partition if it has already been saved.
+
+        Parameters
+        ----------
+
+        dataset (str, manditory):
+            The dataset you are saving (any key of `XFL_DATASETS`, ex. ```"pbp"``` or ```"weekly_rosters"```).
+
+        data (pandas.DataFrame or pyarrow.Table, manditory):
+            The data you want to save.
+
+        season (int, manditory):
+            The season this data is from.
+
+        week (int, optional) = None:
+            The week this data is from. If ```week = None```, this data is not partitioned by week.
+
+        game_id (str, optional) = None:
+            The game this data is from. If ```game_id = None```, this data is not partitioned by game.
+
+        Returns
+        ----------
+
+        The path of the Parquet file that was written, or `None` if ```data``` has no rows.
+        """
+        table = self._to_table(data)
+        if table.num_rows == 0:
+            return None
+
+        ## The partition columns are stored in the directory names, and are restored when the dataset is read.
+        ## They are matched regardless of case (ex. the `season` column of transactions), so that a dataset never has two season columns.
+        ## Columns that this partition is not split by (ex. `Week`, in a season-level dataset) are kept in the file.
+        partition_columns = [x for x,value in zip(PARTITION_COLUMNS,(season,week,game_id)) if value != None]
+        dropped_columns = [x for x in table.column_names if x.lower() in (c.lower() for c in partition_columns)]
+        table = table.drop_columns(dropped_columns)
+
+        path = os.path.join(self.partition_dir(dataset,season,week,game_id),'part-0.parquet')
+        atomic_write(path,lambda tmp_path: pq.write_table(table,tmp_path,row_group_size=self.row_group_size,compression=self.compression))
+        self._update_common_metadata(dataset,table.schema)
+
+        return path
+
+    def write_game(self,dataset:str,data,game_id:str,week:int=None):
+        """
+        Saves the data from a single XFL 3.0 game, partitioned by season, week, and game.
+
+        Parameters
+        ----------
+
+        dataset (str, manditory):
+            The dataset you are saving (one of ```"participation"```, ```"player_box"```, ```"team_box"```, or ```"pbp"```).
+
+        data (pandas.DataFrame or pyarrow.Table, manditory):
+            The data you want to save.
+
+        game_id (str, manditory):
+            The game this data is from (ex. ```"FOOTBALL_XFL_2023_2_18_VGS@ARL"```).
+
+        week (int, optional) = None:
+            The week this game was played in. If ```week = None```, the week is calculated from the date in ```game_id```.
+
+        Returns
+        ----------
+
+        The path of the Parquet file that was written, or `None` if ```data``` has no rows.
+        """
+        if dataset not in XFL_GAME_DATASETS:
+            raise ValueError(f'`dataset` must be one of {XFL_GAME_DATASETS}, not "{dataset}".')
+
+        if week == None:
+            week = get_xfl_week(game_id)
+
+        return self.write(dataset,data,get_xfl_game_date(game_id).year,week=week,game_id=game_id)
+
+    def write_season(self,dataset:str,data,season:int,week:int=None):
+        """
+        Saves season-level data (ex. rosters, schedules, standings, and transactions), partitioned by season, and optionally by week.
+
+        Parameters
+        ----------
+
+        dataset (str, manditory):
+            The dataset you are saving (one of ```"rosters"```, ```"schedule"```, ```"standings"```, or ```"transactions"```).
+
+        data (pandas.DataFrame or pyarrow.Table, manditory):
+            The data you want to save.
+
+        season (int, manditory):
+            The season this data is from.
+
+        week (int, optional) = None:
+            If ```week != 0``` or ```week != None``` (null), this data is saved as a weekly snapshot to the `weekly_rosters` or `weekly_standings` dataset.
+            Otherwise, this data replaces the season-level copy of this dataset.
+
+        Returns
+        ----------
+
+        The path of the Parquet file that was written, or `None` if ```data``` has no rows.
+        """
+        if week == 0:
+            week = None
+
+        if week != None:
+            dataset = f'weekly_{dataset}'
+            if dataset not in XFL_DATASETS:
+                raise ValueError('Only rosters and standings can be saved as weekly snapshots.')
+
+        return self.write(dataset,data,season,week=week)
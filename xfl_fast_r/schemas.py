@@ -0,0 +1,855 @@
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+###################################################################################################################################################################################################################
+##
+##      Field Specs
+##
+###################################################################################################################################################################################################################
+
+class FieldSpec(NamedTuple):
+    """
+    Describes one column that is extracted from a record in a XFL API payload.
+
+    source (str):
+        The key in the JSON record that the value is read from.
+
+    column (str):
+        The name of the column in the returned DataFrame.
+
+    default (any) = None:
+        The value used when ```source``` is missing from a record, or is null.
+
+    dtype (str) = None:
+        The dtype the column is cast to. If ```dtype = None```, the dtype is inferred.
+        If a column's values can not be safely cast to ```dtype``` (ex. a fractional value in an integer column),
+        the inferred dtype is kept instead, so no data is lost.
+    """
+    source: str
+    column: str
+    default: object = None
+    dtype: str = None
+
+def _typed_array(values,dtype:str):
+    """
+    Returns ```values``` as a NumPy array of ```dtype```, or with its inferred dtype if it can not be safely cast.
+    """
+    if dtype == None:
+        return list(values)
+
+    if len(values) == 0:
+        return np.array([],dtype=dtype)
+
+    array = np.asarray(values)
+    try:
+        return array.astype(dtype,casting='safe')
+    except TypeError:
+        return array
+
+class FieldExtractor:
+    """
+    Extracts a list of `FieldSpec` columns from a list of JSON records in a single pass.
+
+    The field table is compiled once into a function that reads every field of a record with `dict.get()`,
+    instead of a `try`/`except KeyError` block per field per record.
+
+    Parameters
+    ----------
+
+    fields (list, manditory):
+        The `FieldSpec` entries to extract, in the order they should appear in the returned DataFrame.
+    """
+
+    def __init__(self,fields:list):
+        self.fields = tuple(fields)
+        self.columns = [f.column for f in self.fields]
+        self._extract_row = self._compile(self.fields)
+
+    @staticmethod
+    def _compile(fields:tuple):
+        namespace = {}
+        lines = [
+            'def extract_row(record):',
+            '    get = record.get',
+            '    return ('
+        ]
+        for i,f in enumerate(fields):
+            namespace[f'default_{i}'] = f.default
+            lines.append(f'        default_{i} if (value := get({f.source!r})) is None else value,')
+        lines.append('    )')
+
+        exec('\n'.join(lines),namespace)
+        return namespace['extract_row']
+
+    def extract(self,records:list):
+        """
+        Returns a dict of column name to column values for every record in ```records```.
+        """
+        rows = list(map(self._extract_row,records))
+
+        if len(rows) > 0:
+            values = zip(*rows)
+        else:
+            values = [()] * len(self.fields)
+
+        return {f.column:_typed_array(v,f.dtype) for f,v in zip(self.fields,values)}
+
+    def to_frame(self,records:list,constants:dict=None):
+        """
+        Returns a pandas DataFrame with one row for every record in ```records```.
+
+        Parameters
+        ----------
+
+        records (list, manditory):
+            The JSON records you want to extract the fields from.
+
+        constants (dict, optional) = None:
+            Columns that have the same value in every row (ex. ```{"Season":2023}```).
+            These are placed before the extracted columns.
+        """
+        columns = self.extract(records)
+        n_rows = len(records)
+
+        if constants != None:
+            columns = {**{k:[v] * n_rows for k,v in constants.items()},**columns}
+
+        ## Every column array was just created by `extract()`, so pandas does not need to copy them.
+        return pd.DataFrame(columns,copy=False)
+
+    def to_table(self,records:list,constants:dict=None,dtypes:dict=None):
+        """
+        Returns a `pyarrow.Table` with one row for every record in ```records```, without creating a pandas DataFrame.
+
+        Parameters
+        ----------
+
+        records (list, manditory):
+            The JSON records you want to extract the fields from.
+
+        constants (dict, optional) = None:
+            Columns that have the same value in every row (ex. ```{"Season":2023}```).
+            These are placed before the extracted columns.
+
+        dtypes (dict, optional) = None:
+            A per-endpoint dtype schema (ex. `TEAM_BOX_DTYPES`) to cast the table's columns with.
+        """
+        columns = self.extract(records)
+        n_rows = len(records)
+
+        if constants != None:
+            columns = {**{k:[v] * n_rows for k,v in constants.items()},**columns}
+
+        return columns_to_table(columns,dtypes)
+
+###################################################################################################################################################################################################################
+##
+##      Dtype Schemas
+##
+###################################################################################################################################################################################################################
+
+def _cast_column(values:pd.Series,dtype:str):
+    """
+    Returns ```values``` cast to ```dtype```.
+    Numeric columns cast to a `datetime64` dtype are read as seconds since the Unix epoch, which is how the XFL API sends timestamps.
+    """
+    if dtype.startswith('datetime64') and pd.api.types.is_numeric_dtype(values):
+        return pd.to_datetime(values,unit='s',utc=dtype.endswith('UTC]')).astype(dtype)
+
+    return values.astype(dtype)
+
+def apply_dtypes(df:pd.DataFrame,dtypes:dict):
+    """
+    Returns ```df``` with every column that has an entry in ```dtypes``` cast to that dtype.
+
+    Columns that are not in ```dtypes``` keep their inferred dtype.
+    If a column's values can not be cast to its dtype (ex. a fractional value in an integer column),
+    that column keeps its inferred dtype instead, so no data is lost.
+
+    Parameters
+    ----------
+
+    df (pandas.DataFrame, manditory):
+        The DataFrame you want to cast.
+
+    dtypes (dict, manditory):
+        A dict of column name to dtype (ex. `PBP_DTYPES`).
+    """
+    columns = {}
+    for column,values in df.items():
+        dtype = dtypes.get(column)
+        if dtype != None and values.dtype != dtype:
+            try:
+                values = _cast_column(values,dtype)
+            except (TypeError,ValueError):
+                pass
+        columns[column] = values
+
+    return pd.DataFrame(columns,index=df.index,copy=False)
+
+def restore_categories(df:pd.DataFrame,like:pd.DataFrame):
+    """
+    Returns ```df``` with every column that is a `category` in ```like``` cast back to a `category`.
+    `pd.concat()` turns a `category` column into a string column when the frames being combined have different categories (ex. two different games).
+    """
+    categories = {column:'category' for column,dtype in like.dtypes.items() if isinstance(dtype,pd.CategoricalDtype) and column in df.columns}
+    if len(categories) == 0:
+        return df
+
+    return df.astype(categories)
+
+###################################################################################################################################################################################################################
+##
+##      Output Types
+##
+###################################################################################################################################################################################################################
+
+## The values every `get_xfl_*()` and `load_xfl_*()` function accepts for ```output```.
+## `"pandas"` returns a pandas DataFrame, and `"arrow"` returns a `pyarrow.Table` that is built without creating a pandas DataFrame.
+OUTPUT_TYPES = ('pandas','arrow')
+
+def check_output(output:str):
+    """
+    Raises a `ValueError` if ```output``` is not one of `OUTPUT_TYPES`.
+    """
+    if output not in OUTPUT_TYPES:
+        raise ValueError(f'`output` must be one of {OUTPUT_TYPES}, not "{output}".')
+
+###################################################################################################################################################################################################################
+##
+##      Arrow Tables
+##
+###################################################################################################################################################################################################################
+
+## The Arrow type for every dtype used in the per-endpoint dtype schemas, other than `category` (which becomes a dictionary-encoded column).
+_ARROW_TYPES = {
+    'Int16':pa.int16(),
+    'Int32':pa.int32(),
+    'Int64':pa.int64(),
+    'boolean':pa.bool_(),
+    'datetime64[s]':pa.timestamp('s'),
+    'datetime64[s, UTC]':pa.timestamp('s',tz='UTC')
+}
+
+def _arrow_array(values):
+    """
+    Returns ```values``` as a `pyarrow.Array`, with its type inferred.
+    A column with mixed types (ex. numbers and strings) is kept as strings.
+    """
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid,pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in values],type=pa.string())
+
+def _cast_arrow_column(array,dtype:str):
+    """
+    Returns ```array``` cast to the Arrow type for ```dtype```.
+    Integers cast to a timestamp are read as seconds since the Unix epoch, which is how the XFL API sends timestamps.
+    """
+    if dtype == 'category':
+        if pa.types.is_dictionary(array.type):
+            return array
+        return pc.dictionary_encode(array)
+
+    arrow_type = _ARROW_TYPES.get(dtype)
+    if arrow_type == None or array.type == arrow_type:
+        return array
+
+    return array.cast(arrow_type)
+
+def apply_arrow_dtypes(table:pa.Table,dtypes:dict):
+    """
+    The `pyarrow.Table` counterpart to `apply_dtypes()`.
+    Returns ```table``` with every column that has an entry in ```dtypes``` cast to the matching Arrow type.
+    If a column's values can not be cast (ex. a fractional value in an integer column), that column keeps its inferred type instead.
+    """
+    arrays = []
+    for column,array in zip(table.column_names,table.columns):
+        dtype = dtypes.get(column)
+        if dtype != None:
+            try:
+                array = _cast_arrow_column(array,dtype)
+            except (pa.ArrowInvalid,pa.ArrowNotImplementedError,pa.ArrowTypeError):
+                pass
+        arrays.append(array)
+
+    return pa.Table.from_arrays(arrays,names=table.column_names)
+
+def columns_to_table(columns:dict,dtypes:dict=None):
+    """
+    Returns a `pyarrow.Table` built from a dict of column name to column values.
+    If ```dtypes``` is set, the table's columns are cast with that per-endpoint dtype schema.
+    """
+    table = pa.table({column:_arrow_array(values) for column,values in columns.items()})
+
+    if dtypes != None:
+        table = apply_arrow_dtypes(table,dtypes)
+
+    return table
+
+def rows_to_table(rows:list,dtypes:dict=None):
+    """
+    Returns a `pyarrow.Table` with one row for every dict in ```rows```, without creating a pandas DataFrame.
+
+    Like `pd.DataFrame(rows)`, columns are in the order they first appear in ```rows```,
+    and a column that is missing from a row is null in that row.
+    """
+    columns = list(dict.fromkeys(column for row in rows for column in row))
+    return columns_to_table({column:[row.get(column) for row in rows] for column in columns},dtypes)
+
+###################################################################################################################################################################################################################
+##
+##      Player Box Scores
+##
+###################################################################################################################################################################################################################
+
+## The fields read from each player in the `playerstats` endpoint.
+## Every stat that is missing from a player (which is how the XFL API says a player did not record that stat) defaults to 0.
+PLAYER_BOX_FIELDS = [
+    FieldSpec('OfficialId','OfficialID'),
+    ## Passing
+    FieldSpec('PassComp','PassComp',0,'int64'),
+    FieldSpec('PassAtt','PassAtt',0,'int64'),
+    FieldSpec('PassCompPercent','PassCompPercent',0,'float64'),
+    FieldSpec('PassYards','PassYards',0,'int64'),
+    FieldSpec('PassTD','PassTD',0,'int64'),
+    FieldSpec('PassINT','PassINT',0,'int64'),
+    FieldSpec('FirstDownsByPass','FirstDownsByPass',0,'int64'),
+    FieldSpec('FirstDownPercentOfPasses','FirstDownPercentOfPasses',0,'float64'),
+    FieldSpec('PassYardsLong','PassYardsLong',0,'int64'),
+    FieldSpec('PassYardsLongTD','PassYardsLongTD',0,'int64'),
+    FieldSpec('PassYardsPerAtt','PassYardsPerAtt',0,'float64'),
+    FieldSpec('PassYardsPerComp','PassYardsPerComp',0,'float64'),
+    FieldSpec('QBRating','QBRating',0,'float64'),
+    FieldSpec('Sacked','Sacked',0,'int64'),
+    FieldSpec('SackedYards','SackedYards',0,'int64'),
+    FieldSpec('SackedYardsAvg','SackedYardsAvg',0,'float64'),
+    FieldSpec('Pass20YdPlays','Pass20YdPlays',0,'int64'),
+    FieldSpec('Pass40YdPlays','Pass40YdPlays',0,'int64'),
+    ## Rushing
+    FieldSpec('RushAtt','RushAtt',0,'int64'),
+    FieldSpec('RushYards','RushYards',0,'int64'),
+    FieldSpec('RushYardsAvg','RushYardsAvg',0,'float64'),
+    FieldSpec('RushTD','RushTD',0,'int64'),
+    FieldSpec('FirstDownsByRush','FirstDownsByRush',0,'int64'),
+    FieldSpec('FirstDownPercentOfRushes','FirstDownPercentOfRushes',0,'float64'),
+    FieldSpec('RushYardsLong','RushYardsLong',0,'int64'),
+    FieldSpec('RushYardsLongTD','RushYardsLongTD',0,'int64'),
+    FieldSpec('Rush10YdPlays','Rush10YdPlays',0,'int64'),
+    FieldSpec('Rush20YdPlays','Rush20YdPlays',0,'int64'),
+    ## Reciving
+    FieldSpec('RecThrownAt','RecThrownAt',0,'int64'),
+    FieldSpec('Recs','Recs',0,'int64'),
+    FieldSpec('RecYards','RecYards',0,'int64'),
+    FieldSpec('RecYardsAvg','RecYardsAvg',0,'float64'),
+    FieldSpec('RecTD','RecTD',0,'int64'),
+    FieldSpec('FirstDownsByRec','FirstDownsByRec',0,'int64'),
+    FieldSpec('FirstDownPercentOfRecs','FirstDownPercentOfRecs',0,'float64'),
+    FieldSpec('RecYardsLong','RecYardsLong',0,'int64'),
+    FieldSpec('RecYardsLongTD','RecYardsLongTD',0,'int64'),
+    FieldSpec('RecYardsAfterCatch','RecYardsAfterCatch',0,'int64'),
+    FieldSpec('RecYardsAfterCatchAvg','RecYardsAfterCatchAvg',0,'float64'),
+    FieldSpec('RecDropped','RecDropped',0,'int64'),
+    FieldSpec('Rec20YdPlays','Rec20YdPlays',0,'int64'),
+    FieldSpec('Rec40YdPlays','Rec40YdPlays',0,'int64'),
+    ## Fumble Stats
+    FieldSpec('Fumbles','Fumbles',0,'int64'),
+    FieldSpec('FumblesLost','FumblesLost',0,'int64'),
+    FieldSpec('OffTD','OffTD',0,'int64'),
+    ## Misc. Offense
+    FieldSpec('FirstDowns','FirstDowns',0,'int64'),
+    FieldSpec('FirstDownPercent','FirstDownPercent',0,'float64'),
+    FieldSpec('PAT1PtAttPass','PAT1PtAttPass',0,'int64'),
+    FieldSpec('PAT1PtAttRec','PAT1PtAttRec',0,'int64'),
+    FieldSpec('PAT1PtAttRush','PAT1PtAttRush',0,'int64'),
+    FieldSpec('PAT1PtConvRush','PAT1PtConvRush',0,'int64'),
+    FieldSpec('PAT1PtPctRush','PAT1PtPctRush',0,'float64'),
+    FieldSpec('PAT2PtAttPass','PAT2PtAttPass',0,'int64'),
+    FieldSpec('PAT2PtAttRec','PAT2PtAttRec',0,'int64'),
+    FieldSpec('PAT2PtAttRush','PAT2PtAttRush',0,'int64'),
+    FieldSpec('PAT2PtConvRush','PAT2PtConvRush',0,'int64'),
+    FieldSpec('PAT2PtPctRush','PAT2PtPctRush',0,'float64'),
+    FieldSpec('PAT3PtAttPass','PAT3PtAttPass',0,'int64'),
+    FieldSpec('PAT3PtAttRec','PAT3PtAttRec',0,'int64'),
+    FieldSpec('PAT3PtAttRush','PAT3PtAttRush',0,'int64'),
+    FieldSpec('PAT3PtConvRush','PAT3PtConvRush',0,'int64'),
+    FieldSpec('PAT3PtPctRush','PAT3PtPctRush',0,'float64'),
+    FieldSpec('TotalTD','TotalTD',0,'int64'),
+    FieldSpec('TotalYards','TotalYards',0,'int64'),
+    ## Penalty Stats
+    FieldSpec('Penalties','Penalties',0,'int64'),
+    FieldSpec('PenaltyYards','PenaltyYards',0,'int64'),
+    ## Defensive Stats
+    FieldSpec('DefTackles','DefTackles',0,'int64'),
+    FieldSpec('DefSoloTackles','DefSoloTackles',0,'int64'),
+    FieldSpec('DefAssistTackles','DefAssistTackles',0,'int64'),
+    FieldSpec('DefQBHits','DefQBHits',0,'int64'),
+    FieldSpec('DefTacklesForLoss','DefTacklesForLoss',0,'int64'),
+    FieldSpec('DefSacks','DefSacks',0,'float64'),
+    FieldSpec('DefSackYards','DefSackYards',0,'int64'),
+    FieldSpec('DefSackYardsAvg','DefSackYardsAvg',0,'float64'),
+    FieldSpec('DefINT','DefINT',0,'int64'),
+    FieldSpec('DefINTReturnYards','DefINTReturnYards',0,'int64'),
+    FieldSpec('DefINTReturnYardsAvg','DefINTReturnYardsAvg',0,'float64'),
+    FieldSpec('DefINTReturnTD','DefINTReturnTD',0,'int64'),
+    FieldSpec('DefINTReturnYardsLong','DefINTReturnYardsLong',0,'int64'),
+    ## Field Goal Stats
+    FieldSpec('FGAtt','FGAtt',0,'int64'),
+    FieldSpec('FGMade','FGMade',0,'int64'),
+    FieldSpec('FGLong','FGLong',0,'int64'),
+    FieldSpec('FG0To19Att','FG0To19Att',0,'int64'),
+    FieldSpec('FG0To19Made','FG0To19Made',0,'int64'),
+    FieldSpec('FG20To29Att','FG20To29Att',0,'int64'),
+    FieldSpec('FG20To29Made','FG20To29Made',0,'int64'),
+    FieldSpec('FG30To39Att','FG30To39Att',0,'int64'),
+    FieldSpec('FG30To39Made','FG30To39Made',0,'int64'),
+    FieldSpec('FG40To49Att','FG40To49Att',0,'int64'),
+    FieldSpec('FG40To49Made','FG40To49Made',0,'int64'),
+    FieldSpec('FG50PlusAtt','FG50PlusAtt',0,'int64'),
+    FieldSpec('FG50PlusMade','FG50PlusMade',0,'int64'),
+    ## Punting Stats
+    FieldSpec('Punts','Punts',0,'int64'),
+    FieldSpec('PuntGrossYards','PuntGrossYards',0,'int64'),
+    FieldSpec('PuntGrossYardsAvg','PuntGrossYardsAvg',0,'float64'),
+    FieldSpec('PuntGrossYardsLong','PuntGrossYardsLong',0,'int64'),
+    FieldSpec('PuntTouchbacks','PuntTouchbacks',0,'int64'),
+    FieldSpec('PuntInside20','PuntInside20',0,'int64'),
+    ## Punt Return Stats
+    FieldSpec('PuntRetReturns','PuntRetReturns',0,'int64'),
+    FieldSpec('PuntRetYards','PuntRetYards',0,'int64'),
+    FieldSpec('PuntRetYardsAvg','PuntRetYardsAvg',0,'float64'),
+    FieldSpec('PuntRetTD','PuntRetTD',0,'int64'),
+    FieldSpec('PuntRetYardsLong','PuntRetYardsLong',0,'int64'),
+    FieldSpec('PuntRetFairCatches','PuntRetFairCatches',0,'int64'),
+    ## Kick Return Stats
+    FieldSpec('KickRetReturns','KickRetReturns',0,'int64'),
+    FieldSpec('KickRetYards','KickRetYards',0,'int64'),
+    FieldSpec('KickRetYardsAvg','KickRetYardsAvg',0,'float64'),
+    FieldSpec('KickRetTD','KickRetTD',0,'int64'),
+    FieldSpec('KickRetYardsLong','KickRetYardsLong',0,'int64'),
+    FieldSpec('KickRetFairCatches','KickRetFairCatches',0,'int64'),
+]
+
+###################################################################################################################################################################################################################
+##
+##      Team Box Scores
+##
+###################################################################################################################################################################################################################
+
+## The fields read from each team in the `teamstats` endpoint.
+## Every stat that is missing from a team defaults to 0.
+TEAM_BOX_FIELDS = [
+    FieldSpec('OfficialId','OfficialID'),
+    ## Team Stats
+    FieldSpec('PlaysPerGame','PlaysPerGame',0,'float64'),
+    FieldSpec('Points','Points',0,'int64'),
+    FieldSpec('DefPointsAgainst','DefPointsAgainst',0,'int64'),
+    FieldSpec('YardsPerGame','YardsPerGame',0,'float64'),
+    FieldSpec('DefYardsAgainst','DefYardsAgainst',0,'int64'),
+    FieldSpec('PassYardsPerGame','PassYardsPerGame',0,'float64'),
+    FieldSpec('DefPassYardsAgainst','DefPassYardsAgainst',0,'int64'),
+    FieldSpec('RushYardsPerGame','RushYardsPerGame',0,'float64'),
+    FieldSpec('DefRushYardsAgainst','DefRushYardsAgainst',0,'int64'),
+    ## Drives, Downs, and Penalties
+    FieldSpec('DriveStartYardlineAvg','DriveStartYardlineAvg',0,'float64'),
+    FieldSpec('FirstDowns','FirstDowns',0,'int64'),
+    FieldSpec('FirstDownsByPass','FirstDownsByPass',0,'int64'),
+    FieldSpec('FirstDownsByPenalty','FirstDownsByPenalty',0,'int64'),
+    FieldSpec('FirstDownsByRush','FirstDownsByRush',0,'int64'),
+    FieldSpec('FirstDownPercent','FirstDownPercent',0,'float64'),
+    FieldSpec('FirstDownPercentOfPasses','FirstDownPercentOfPasses',0,'float64'),
+    FieldSpec('FirstDownPercentOfRushes','FirstDownPercentOfRushes',0,'float64'),
+    FieldSpec('ThirdDownConv','ThirdDownConv',0,'int64'),
+    FieldSpec('ThirdDownAtt','ThirdDownAtt',0,'int64'),
+    FieldSpec('ThirdDownPercent','ThirdDownPercent',0,'float64'),
+    FieldSpec('FourthDownConv','FourthDownConv',0,'int64'),
+    FieldSpec('FourthDownAtt','FourthDownAtt',0,'int64'),
+    FieldSpec('FourthDownPercent','FourthDownPercent',0,'float64'),
+    FieldSpec('Penalties','Penalties',0,'int64'),
+    FieldSpec('PenaltyYards','PenaltyYards',0,'int64'),
+    FieldSpec('PenaltiesOffensive','PenaltiesOffensive',0,'int64'),
+    FieldSpec('PenaltyYardsOffensive','PenaltyYardsOffensive',0,'int64'),
+    FieldSpec('PenaltiesDefensive','PenaltiesDefensive',0,'int64'),
+    FieldSpec('PenaltyYardsDefensive','PenaltyYardsDefensive',0,'int64'),
+    FieldSpec('Turnovers','Turnovers',0,'int64'),
+    FieldSpec('TotalTD','TotalTD',0,'int64'),
+    FieldSpec('OffTD','OffTD',0,'int64'),
+    ## Passing Stats
+    FieldSpec('PassComp','PassComp',0,'int64'),
+    FieldSpec('PassAtt','PassAtt',0,'int64'),
+    FieldSpec('PassCompPercent','PassCompPercent',0,'float64'),
+    FieldSpec('PassYards','PassYards',0,'int64'),
+    FieldSpec('PassTD','PassTD',0,'int64'),
+    FieldSpec('PassINT','PassINT',0,'int64'),
+    FieldSpec('PassYardsLong','PassYardsLong',0,'int64'),
+    FieldSpec('PassYardsLongTD','PassYardsLongTD',0,'int64'),
+    FieldSpec('PassYardsPerAtt','PassYardsPerAtt',0,'float64'),
+    FieldSpec('PassYardsPerComp','PassYardsPerComp',0,'float64'),
+    FieldSpec('RecYardsAfterCatch','PassYardsAfterCatch',0,'int64'),
+    FieldSpec('RecYardsAfterCatchAvg','PassYardsAfterCatchAvg',0,'float64'),
+    FieldSpec('RecDropped','RecDropped',0,'int64'),
+    FieldSpec('Sacked','Sacked',0,'int64'),
+    FieldSpec('SackedYards','SackedYards',0,'int64'),
+    FieldSpec('SackedYardsAvg','SackedYardsAvg',0,'float64'),
+    FieldSpec('Pass20YdPlays','Pass20YdPlays',0,'int64'),
+    FieldSpec('Pass40YdPlays','Pass40YdPlays',0,'int64'),
+    ## Rushing Stats
+    FieldSpec('RushAtt','RushAtt',0,'int64'),
+    FieldSpec('RushTD','RushTD',0,'int64'),
+    FieldSpec('RushYards','RushYards',0,'int64'),
+    FieldSpec('RushYardsAvg','RushYardsAvg',0,'float64'),
+    FieldSpec('RushYardsLong','RushYardsLong',0,'int64'),
+    FieldSpec('RushYardsLongTD','RushYardsLongTD',0,'int64'),
+    FieldSpec('Rush20YdPlays','Rush20YdPlays',0,'int64'),
+    FieldSpec('Rush40YdPlays','Rush40YdPlays',0,'int64'),
+    ## Conversion Stats
+    FieldSpec('PAT1PtAtt','PAT1PtAtt',0,'int64'),
+    FieldSpec('PAT1PtConv','PAT1PtConv',0,'int64'),
+    FieldSpec('PAT1PtPct','PAT1PtPct',0,'float64'),
+    FieldSpec('PAT1PtAttPass','PAT1PtAttPass',0,'int64'),
+    FieldSpec('PAT1PtConvPass','PAT1PtConvPass',0,'int64'),
+    FieldSpec('PAT1PtPctPass','PAT1PtPctPass',0,'float64'),
+    FieldSpec('PAT1PtAttRush','PAT1PtAttRush',0,'int64'),
+    FieldSpec('PAT1PtConvRush','PAT1PtConvRush',0,'int64'),
+    FieldSpec('PAT1PtPctRush','PAT1PtPctRush',0,'float64'),
+    FieldSpec('PAT2PtAtt','PAT2PtAtt',0,'int64'),
+    FieldSpec('PAT2PtConv','PAT2PtConv',0,'int64'),
+    FieldSpec('PAT2PtPct','PAT2PtPct',0,'float64'),
+    FieldSpec('PAT2PtAttPass','PAT2PtAttPass',0,'int64'),
+    FieldSpec('PAT2PtConvPass','PAT2PtConvPass',0,'int64'),
+    FieldSpec('PAT2PtPctPass','PAT2PtPctPass',0,'float64'),
+    FieldSpec('PAT2PtAttRush','PAT2PtAttRush',0,'int64'),
+    FieldSpec('PAT2PtConvRush','PAT2PtConvRush',0,'int64'),
+    FieldSpec('PAT2PtPctRush','PAT2PtPctRush',0,'float64'),
+    FieldSpec('PAT3PtAtt','PAT3PtAtt',0,'int64'),
+    FieldSpec('PAT3PtConv','PAT3PtConv',0,'int64'),
+    FieldSpec('PAT3PtPct','PAT3PtPct',0,'float64'),
+    FieldSpec('PAT3PtConvPass','PAT3PtConvPass',0,'int64'),
+    FieldSpec('PAT3PtAttPass','PAT3PtAttPass',0,'int64'),
+    FieldSpec('PAT3PtPctPass','PAT3PtPctPass',0,'float64'),
+    FieldSpec('PAT3PtConvRush','PAT3PtConvRush',0,'int64'),
+    FieldSpec('PAT3PtAttRush','PAT3PtAttRush',0,'int64'),
+    FieldSpec('PAT3PtPctRush','PAT3PtPctRush',0,'float64'),
+    ## Fumble Stats
+    FieldSpec('Fumbles','Fumbles',0,'int64'),
+    FieldSpec('FumblesLost','FumblesLost',0,'int64'),
+    ## Defensive Stats
+    FieldSpec('DefTackles','DefTackles',0,'int64'),
+    FieldSpec('DefTacklesForLoss','DefTacklesForLoss',0,'int64'),
+    FieldSpec('DefQBHits','DefQBHits',0,'int64'),
+    FieldSpec('DefSacks','DefSacks',0,'float64'),
+    FieldSpec('DefSackYards','DefSackYards',0,'int64'),
+    FieldSpec('DefSackYardsAvg','DefSackYardsAvg',0,'float64'),
+    FieldSpec('DefINT','DefINT',0,'int64'),
+    FieldSpec('DefINTReturnYards','DefINTReturnYards',0,'int64'),
+    FieldSpec('DefINTReturnYardsAvg','DefINTReturnYardsAvg',0,'float64'),
+    FieldSpec('DefINTReturnTD','DefINTReturnTD',0,'int64'),
+    FieldSpec('DefINTReturnYardsLong','DefINTReturnYardsLong',0,'int64'),
+    FieldSpec('DefPassesDefended','DefPassesDefended',0,'int64'),
+    FieldSpec('DefFumblesForced','DefFumblesForced',0,'int64'),
+    FieldSpec('DefFumblesRecovered','DefFumblesRecovered',0,'int64'),
+    ## Punting Stats
+    FieldSpec('Punts','Punts',0,'int64'),
+    FieldSpec('PuntGrossYards','PuntGrossYards',0,'int64'),
+    FieldSpec('PuntGrossYardsAvg','PuntGrossYardsAvg',0,'float64'),
+    FieldSpec('PuntGrossYardsLong','PuntGrossYardsLong',0,'int64'),
+    FieldSpec('PuntTouchbacks','PuntTouchbacks',0,'int64'),
+    FieldSpec('PuntInside20','PuntInside20',0,'int64'),
+    ## Field Goal Stats
+    FieldSpec('FGAtt','FGAtt',0,'int64'),
+    FieldSpec('FGMade','FGMade',0,'int64'),
+    FieldSpec('FGLong','FGLong',0,'int64'),
+    ## Kick Return Stats
+    FieldSpec('KickRetReturns','KickRetReturns',0,'int64'),
+    FieldSpec('KickRetYards','KickRetYards',0,'int64'),
+    FieldSpec('KickRetYardsAvg','KickRetYardsAvg',0,'float64'),
+    FieldSpec('KickRetTD','KickRetTD',0,'int64'),
+    FieldSpec('KickRetYardsLong','KickRetYardsLong',0,'int64'),
+    FieldSpec('KickRetFairCatches','KickRetFairCatches',0,'int64'),
+    ## Punt Return Stats
+    FieldSpec('PuntRetReturns','PuntRetReturns',0,'int64'),
+    FieldSpec('PuntRetYards','PuntRetYards',0,'int64'),
+    FieldSpec('PuntRetYardsAvg','PuntRetYardsAvg',0,'float64'),
+    FieldSpec('PuntRetTD','PuntRetTD',0,'int64'),
+    FieldSpec('PuntRetYardsLong','PuntRetYardsLong',0,'int64'),
+    FieldSpec('PuntRetFairCatches','PuntRetFairCatches',0,'int64'),
+]
+
+###################################################################################################################################################################################################################
+##
+##      Play-by-Play
+##
+###################################################################################################################################################################################################################
+
+## The columns read from each entry in a play's `Properties` list in the `markeractivity` endpoint, keyed by the property they are read from.
+## Each column is paired with the path of keys inside that property that leads to its value (an empty path means the property's value itself).
+## If a key in a path is missing, that column is not set for that property.
+## Properties are listed in the order their columns appear in the returned DataFrame.
+PBP_PROPERTY_FIELDS = {
+    ## Timeout info (if != Null, this is the teamID for who called a timeout on this play)
+    'FootballTimeoutTeamId':[('FootballTimeoutTeamId',())],
+    ## Down, Distance and Score
+    'FootballStatus':[('FootballStatus',())],
+    'FootballEventContext':[
+        ('Down',('Down',)),
+        ('Distance',('Distance',)),
+        ('VisScore',('VisScore',))
+    ],
+    'HomeScore':[('HomeScore',())],
+    ## Play Result, Zone, and Yards gained/lost
+    'FootballPlayResult':[('FootballPlayResult',())],
+    'FootballZone':[('FootballZone',())],
+    'FootballYards':[('FootballYards',())],
+    ## Drive Summary
+    'FootballDriveSummary':[
+        ('Drive_Start_VisOrHome',('DriveStart','VisOrHome')),
+        ('Drive_Start_YardNum',('DriveStart','YardNum')),
+        ('Drive_Plays',('Plays',)),
+        ('Drive_Yards',('Yards',)),
+        ('Drive_TOP',('TOP',)),
+        ('Result',('Result',))
+    ],
+    ## Scoring (on this play specifically)
+    'FootballMainScoringPlay':[('FootballMainScoringPlay',())],
+    'FootballConvAttPts':[('FootballConvAttPts',())],
+    'FootballMiscScore':[
+        ('FootballMiscScore_MiscScoreType',('MiscScoreType',)),
+        ('FootballMiscScore_TeamId',('TeamId',)),
+        ('FootballMiscScore_PlayerId',('PlayerId',))
+    ],
+    ## Special Teams Yards
+    'FootballKickYards':[('FootballKickYards',())],
+    'FootballPuntYards':[('FootballPuntYards',())],
+    'FootballKickRetYards':[('FootballKickRetYards',())],
+    'FootballPuntRetYards':[('FootballPuntRetYards',())],
+    ## Penalty Info
+    'FootballPenalty':[
+        ('FootballPenalty_TeamId',('TeamId',)),
+        ('FootballPenalty_PlayerId',('PlayerId',)),
+        ('FootballPenalty_Yards',('Yards',)),
+        ('FootballPenalty_PenaltyResult',('PenaltyResult',)),
+        ('FootballPenalty_Description',('Description',))
+    ],
+    ## Fumble Info
+    'FootballFumble':[
+        ('FootballFumble_TeamFumbled',('TeamFumbled',)),
+        ('FootballFumble_PlayerFumbled',('PlayerFumbled',)),
+        ('FootballFumble_TeamRecovered',('TeamRecovered',)),
+        ('FootballFumble_PlayerRecovered',('PlayerRecovered',)),
+        ('FootballFumble_PlayerForcedFumble',('PlayerForcedFumble',))
+    ],
+    ## Extra yards
+    'FootballExtraYards':[
+        ('FootballExtraYards_IndivOrTeam',('IndivOrTeam',)),
+        ('FootballExtraYards_TeamId',('TeamId',)),
+        ('FootballExtraYards_PlayerId',('PlayerId',)),
+        ('FootballExtraYards_Yards',('Yards',))
+    ],
+    ## "Ball Set On" info (TBD on the exact purpose of this stat)
+    'FootballSetBallOn':[
+        ('FootballSetBallOn_VisOrHome',('VisOrHome',)),
+        ('FootballSetBallOn_YardNum',('YardNum',))
+    ]
+}
+
+###################################################################################################################################################################################################################
+##
+##      Per-Endpoint Dtypes
+##
+###################################################################################################################################################################################################################
+
+## These are applied by every `get_xfl_*()` function to the DataFrame it returns.
+## Counting stats are nullable integers (a player or play without a stat is `<NA>`, not `NaN`),
+## values that repeat on every row (teams, positions, `VisOrHome`) are categories, flags are nullable booleans,
+## and `MarkerUTC` and `NowUTC` are UTC timestamps. Rate stats (ex. `PassCompPercent`) stay as `float64`.
+##
+## `Int16` is only used for values that can not get close to 32,767 (ex. downs, quarters, and yard lines).
+## Counting stats are `Int32`, so that adding them together can not overflow.
+
+_PLAYER_INFO_DTYPES = {
+    'Season':'Int16',
+    'OfficialID':'Int64',
+    'JerseyNum':'Int16',
+    'Position':'category',
+    'PositionLongName':'category',
+    'Weight':'Int16',
+    'Country':'category',
+    'CountryCode':'category',
+    'InjuryStatus':'category',
+    'TeamId':'category',
+    'Affiliate':'category',
+    'LeagueStatus':'category'
+}
+
+GAME_PARTICIPATION_DTYPES = {
+    **_PLAYER_INFO_DTYPES,
+    'game_id':'category',
+    'VisOrHome':'category',
+    'IsStarting':'boolean',
+    'Scratch':'boolean',
+    'Participated':'boolean'
+}
+
+ROSTER_DTYPES = {
+    **_PLAYER_INFO_DTYPES,
+    'Week':'Int16'
+}
+
+PLAYER_BOX_DTYPES = {
+    'Season':'Int16',
+    'game_id':'category',
+    'OfficialID':'Int64',
+    'TeamId':'category',
+    'VisOrHome':'category',
+    'JerseyNum':'Int16',
+    ## A player's name repeats in every game they play, so it is a category here, but not in the participation data.
+    'FirstName':'category',
+    'LastName':'category',
+    'LastNameSuffix':'category',
+    'Position':'category',
+    'Participated':'boolean',
+    'IsStarting':'boolean',
+    'Scratch':'boolean',
+    **{f.column:'Int32' for f in PLAYER_BOX_FIELDS if f.dtype == 'int64'}
+}
+
+TEAM_BOX_DTYPES = {
+    'Season':'Int16',
+    'game_id':'category',
+    'OfficialID':'category',
+    **{f.column:'Int32' for f in TEAM_BOX_FIELDS if f.dtype == 'int64'},
+    'TOPSeconds':'Int16'
+}
+
+PBP_DTYPES = {
+    'Season':'Int16',
+    'game_id':'category',
+    'MarkerId':'Int64',
+    'MarkerUTC':'datetime64[s, UTC]',
+    'MarkerLTC':'datetime64[s]',
+    'MajorType':'category',
+    'MinorType':'category',
+    'IsOfficial':'boolean',
+    'Quarter':'Int16',
+    'ClockMinutes':'Int16',
+    'ClockSeconds':'Int16',
+    'SourceType':'category',
+    'EventId':'category',
+    'SituationCode':'category',
+    'SourceId':'Int64',
+    'OfficialCode':'category',
+    'TimeRemSecTotal':'Int32',
+    'VisTimeouts':'Int16',
+    'HomeTimeouts':'Int16',
+    'BallOn_Side':'category',
+    'BallOn_YardNum':'Int16',
+    'DriveNum':'Int16',
+    'PossTeam':'category',
+    ## Timeout info
+    'FootballTimeoutTeamId':'category',
+    ## Down, Distance and Score
+    'FootballStatus':'category',
+    'Down':'Int16',
+    'Distance':'Int16',
+    'VisScore':'Int16',
+    'HomeScore':'Int16',
+    ## Play Result, Zone, and Yards gained/lost
+    'FootballPlayResult':'category',
+    'FootballZone':'Int16',
+    'FootballYards':'Int16',
+    ## Drive Summary
+    'Drive_Start_VisOrHome':'category',
+    'Drive_Start_YardNum':'Int16',
+    'Drive_Plays':'Int16',
+    'Drive_Yards':'Int16',
+    'Result':'category',
+    ## Scoring (on this play specifically)
+    'FootballMainScoringPlay':'boolean',
+    'FootballConvAttPts':'Int16',
+    'FootballMiscScore_MiscScoreType':'category',
+    'FootballMiscScore_TeamId':'category',
+    'FootballMiscScore_PlayerId':'Int64',
+    ## Special Teams Yards
+    'FootballKickYards':'Int16',
+    'FootballPuntYards':'Int16',
+    'FootballKickRetYards':'Int16',
+    'FootballPuntRetYards':'Int16',
+    ## Penalty Info
+    'FootballPenalty_TeamId':'category',
+    'FootballPenalty_PlayerId':'Int64',
+    'FootballPenalty_Yards':'Int16',
+    'FootballPenalty_PenaltyResult':'category',
+    ## Fumble Info
+    'FootballFumble_TeamFumbled':'category',
+    'FootballFumble_PlayerFumbled':'Int64',
+    'FootballFumble_TeamRecovered':'category',
+    'FootballFumble_PlayerRecovered':'Int64',
+    'FootballFumble_PlayerForcedFumble':'Int64',
+    ## Extra yards
+    'FootballExtraYards_IndivOrTeam':'category',
+    'FootballExtraYards_TeamId':'category',
+    'FootballExtraYards_PlayerId':'Int64',
+    'FootballExtraYards_Yards':'Int16',
+    ## "Ball Set On" info
+    'FootballSetBallOn_VisOrHome':'category',
+    'FootballSetBallOn_YardNum':'Int16'
+}
+
+SCHEDULE_DTYPES = {
+    'Season':'Int16',
+    'NowUTC':'datetime64[s, UTC]',
+    'NowLTC':'datetime64[s]',
+    'VisitorScore':'Int16',
+    'HomeScore':'Int16',
+    'Period':'Int16',
+    'ClockMinutes':'Int16',
+    'ClockSeconds':'Int16',
+    'ClockTenths':'Int16',
+    'ClockState':'category',
+    'EventStatus':'category'
+}
+
+STANDINGS_DTYPES = {
+    'Season':'Int16',
+    'OfficialID':'category',
+    'Rank':'Int16',
+    'RankInConference':'Int16',
+    'RankInDivision':'Int16',
+    'RankInWildcard':'Int16',
+    'GamesPlayed':'Int16',
+    'ScoreDiff':'Int16',
+    'ScoreFor':'Int16',
+    'ScoreAgainst':'Int16',
+    'ConferenceScoreFor':'Int16',
+    'ConferenceScoreAgainst':'Int16',
+    'DivisionScoreFor':'Int16',
+    'DivisionScoreAgainst':'Int16',
+    'Streak':'category',
+    'Last10':'category',
+    'ClinchIndicator':'category',
+    'City':'category',
+    'Mascot':'category',
+    ## Every record, overall, on the road, and at home (ex. `Wins`, `RoadWins`, and `HomeWins`).
+    **{f'{where}{record}':'Int16' for where in ('','Road','Home') for record in (
+        'EarnedPoints','Wins','Losses','Ties','OTWins','OTLosses','OTTies','ShootoutWins','ShootoutLosses',
+        'ConferenceWins','ConferenceLosses','ConferenceTies','DivisionWins','DivisionLosses','DivisionTies'
+    )},
+    'HockeyOTAndSOLosses':'Int16',
+    'HockeyRegulationAndOTWins':'Int16',
+    'HockeyRoadOTAndSOLosses':'Int16',
+    'HockeyHomeOTAndSOLosses':'Int16'
+}
+
+## Transactions are scraped from the XFL's website, so every value other than the season starts out as a string.
+## `date` is kept as it is shown on the website (ex. `"2/18/2023"`).
+TRANSACTIONS_DTYPES = {
+    'season':'Int16',
+    'team_id':'category',
+    'team_logo_url':'category',
+    'player_position':'category',
+    'transaction_type':'category'
+}
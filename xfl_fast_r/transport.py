@@ -0,0 +1,201 @@
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from xfl_fast_r.utils import atomic_write
+
+###################################################################################################################################################################################################################
+##
+##      Fixture Files
+##
+###################################################################################################################################################################################################################
+
+## Query string parameters that are removed from every recorded URL, so that API tokens are never saved to a fixture.
+## A replayed request matches a fixture regardless of the value of these parameters.
+REDACTED_PARAMS = ('access_token',)
+
+## Response headers that are not saved to a fixture.
+## Bodies are saved after they have been decompressed, so the original `Content-Encoding` and `Content-Length` no longer apply to them.
+_DROPPED_HEADERS = ('content-encoding','content-length','transfer-encoding','connection','keep-alive','set-cookie')
+
+def _redact_url(url:str):
+    """
+    Returns ```url``` without any of the query string parameters in `REDACTED_PARAMS`, and with the rest of its query string sorted.
+    """
+    parts = urlsplit(url)
+    params = sorted((k,v) for k,v in parse_qsl(parts.query,keep_blank_values=True) if k not in REDACTED_PARAMS)
+    return urlunsplit((parts.scheme,parts.netloc,parts.path,urlencode(params),''))
+
+def get_fixture_path(fixture_dir:str,method:str,url:str):
+    """
+    Returns the path (without an extension) that the response to a request is recorded to,
+    (ex. `fixtures/api.xfl.com/scoring/v3.30/markeractivity/game=FOOTBALL_XFL_2023_2_18_VGS@ARL.1a2b3c4d`).
+
+    Parameters
+    ----------
+
+    fixture_dir (str, manditory):
+        The directory every fixture is saved in.
+
+    method (str, manditory):
+        The HTTP method of the request (ex. ```"GET"```).
+
+    url (str, manditory):
+        The full URL of the request. Any query string parameters in `REDACTED_PARAMS` are ignored.
+    """
+    url = _redact_url(url)
+    parts = urlsplit(url)
+
+    ## The hash keeps two URLs from sharing a fixture when their readable names are the same after they are cleaned up.
+    digest = hashlib.sha1(f'{method.upper()} {url}'.encode('utf-8')).hexdigest()[:8]
+    name = re.sub(r'[^A-Za-z0-9@._=-]+','_',parts.query)[:80] or 'index'
+
+    path_parts = [x for x in parts.path.split('/') if x not in ('','.','..')]
+    return os.path.join(os.path.expanduser(fixture_dir),parts.netloc.replace(':','_'),*path_parts,f'{name}.{digest}')
+
+###################################################################################################################################################################################################################
+##
+##      Record and Replay Adapters
+##
+###################################################################################################################################################################################################################
+
+class XFLRecordingAdapter(HTTPAdapter):
+    """
+    A `requests` transport adapter that sends every request to the network as usual,
+    and saves every response to a fixture directory, so that it can be replayed later with `XFLReplayAdapter`.
+
+    Every fixture is two files: a `.json` file with the status code, headers, and URL of the response,
+    and a `.body` file with the decompressed body of the response.
+    API tokens (any query string parameter in `REDACTED_PARAMS`) are removed from the URL before it is saved.
+    Recording the same request again replaces its fixture, except for HTTP 304 (Not Modified) responses,
+    which are never saved, so that a conditional request does not replace a recorded body with an empty one.
+
+    Use it by passing it to `XFLClient` (ex. ```XFLClient(transport=XFLRecordingAdapter("fixtures"))```).
+
+    Parameters
+    ----------
+
+    fixture_dir (str, manditory):
+        The directory every fixture is saved in. It will be created if it does not exist.
+
+    **kwargs:
+        Any additional arguments for `requests.adapters.HTTPAdapter` (ex. ```pool_maxsize=16```).
+    """
+
+    def __init__(self,fixture_dir:str,**kwargs):
+        self.fixture_dir = os.path.expanduser(fixture_dir)
+        super().__init__(**kwargs)
+
+    def send(self,request,**kwargs):
+        start = time.perf_counter()
+        response = super().send(request,**kwargs)
+        if response.status_code == 304:
+            return response
+
+        ## This reads the whole body, even if `stream=True`. The response can still be streamed afterwards.
+        body = response.content
+        elapsed = time.perf_counter() - start
+        meta = {
+            'method':request.method,
+            'url':_redact_url(request.url),
+            'status_code':response.status_code,
+            'reason':response.reason,
+            'headers':{k:v for k,v in response.headers.items() if k.lower() not in _DROPPED_HEADERS},
+            'elapsed':round(elapsed,4)
+        }
+
+        path = get_fixture_path(self.fixture_dir,request.method,request.url)
+        atomic_write(f'{path}.body',body)
+        atomic_write(f'{path}.json',json.dumps(meta,indent=4).encode('utf-8'))
+
+        return response
+
+class XFLReplayAdapter(HTTPAdapter):
+    """
+    A `requests` transport adapter that answers every request with a response recorded by `XFLRecordingAdapter`,
+    without using the network. A request that was never recorded raises a `FileNotFoundError`.
+
+    Replayed responses are deterministic: the same request always gets the same status code, headers, and body,
+    so the `get_xfl_*()` functions can be tested and benchmarked offline, without a valid XFL API token.
+
+    Use it by passing it to `XFLClient` (ex. ```XFLClient(transport=XFLReplayAdapter("fixtures"))```).
+
+    Parameters
+    ----------
+
+    fixture_dir (str, manditory):
+        The directory the fixtures were recorded to.
+
+    latency (float or str, optional) = None:
+        How long (in seconds) every replayed request waits before it is answered, to simulate the network.
+        If ```latency = "recorded"```, every request waits as long as it took when it was recorded.
+        If ```latency = None``` or ```latency = 0```, requests are answered immediately.
+
+    **kwargs:
+        Any additional arguments for `requests.adapters.HTTPAdapter`.
+    """
+
+    def __init__(self,fixture_dir:str,latency=None,**kwargs):
+        if latency not in (None,'recorded') and (not isinstance(latency,(int,float)) or latency < 0):
+            raise ValueError('`latency` must be a number of seconds that is at least 0, "recorded", or `None`.')
+
+        self.fixture_dir = os.path.expanduser(fixture_dir)
+        self.latency = latency
+        self._fixtures = {}
+        self._lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def _load_fixture(self,path:str):
+        """
+        Returns the metadata and body of a fixture. Fixtures are only read from disk once.
+        """
+        with self._lock:
+            fixture = self._fixtures.get(path)
+
+        if fixture == None:
+            try:
+                with open(f'{path}.json','rb') as f:
+                    meta = json.loads(f.read())
+                with open(f'{path}.body','rb') as f:
+                    body = f.read()
+            except FileNotFoundError:
+                return None
+
+            fixture = (meta,body)
+            with self._lock:
+                self._fixtures[path] = fixture
+
+        return fixture
+
+    def send(self,request,stream=False,timeout=None,verify=True,cert=None,proxies=None):
+        fixture = self._load_fixture(get_fixture_path(self.fixture_dir,request.method,request.url))
+        if fixture == None:
+            raise FileNotFoundError(f'There is no recorded response for the following request in "{self.fixture_dir}":\n\t{request.method} {_redact_url(request.url)}')
+
+        meta, body = fixture
+
+        if self.latency == 'recorded':
+            time.sleep(meta.get('elapsed',0))
+        elif self.latency:
+            time.sleep(self.latency)
+
+        headers = dict(meta['headers'])
+        headers['Content-Length'] = str(len(body))
+
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=meta['status_code'],
+            reason=meta.get('reason'),
+            preload_content=False,
+            decode_content=False
+        )
+        return self.build_response(request,raw)
@@ -1,3 +1,14 @@
+import codecs
+import json
+import os
+import tempfile
+import warnings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def raise_html_status_code(status_code:int):
     match status_code:
         case 200:
@@ -12,6 +23,8 @@ def raise_html_status_code(status_code:int):
             raise ConnectionError('HTTP 404 Not Found:\t\nFor some reason, the webpage could not be found.')
         case 418:
             raise AssertionError('HTTP 418 \"I\'m a Teapot\" Error:\t\nThe webpage for this is not a web page, but a teapot-like aparatus.')
+        case 429:
+            raise ConnectionRefusedError('HTTP 429 Too Many Requests:\t\nThe website has recived too many requests from you and/or this device\'s IP address in a short amount of time.')
         case 500:
             raise ConnectionError('HTTP 500 Internal Server Error:\t\nAn unspecified issue within the website has prevented this function from connecting to the website.')
         case 501:
@@ -25,4 +38,207 @@ def raise_html_status_code(status_code:int):
         case 511:
             raise ConnectionRefusedError('HTTP 511 Network Authentication Required:\n\tTo use this functtion, and by extension the internet, you need to authenticate your access to this internet connection.')
         case default:
-            raise Exception(f'Unhandled HTTP Status code. Code: {status_code}')
\ No newline at end of file
+            raise Exception(f'Unhandled HTTP Status code. Code: {status_code}')
+
+def atomic_write(path:str,data):
+    """
+    Writes a file to a temporary file in the same directory as ```path```, and then moves it over ```path```,
+    so that a reader never sees a partially written file, and an interrupted write leaves the old file in place.
+    The temporary file starts with a `.`, so that `pyarrow.dataset` ignores it if it is read while it is being written.
+
+    Parameters
+    ----------
+
+    path (str, manditory):
+        The file you want to write. Its directory will be created if it does not exist.
+
+    data (bytes or function, manditory):
+        The contents of the file, or a function that is called with the path of the temporary file, and writes it (ex. ```lambda tmp_path: pq.write_table(table,tmp_path)```).
+    """
+    dir_path = os.path.dirname(os.path.abspath(path))
+    os.makedirs(dir_path,exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dir_path,prefix='.',suffix='.tmp')
+    try:
+        if callable(data):
+            os.close(fd)
+            data(tmp_path)
+        else:
+            with os.fdopen(fd,'wb') as f:
+                f.write(data)
+        os.replace(tmp_path,path)
+    except:
+        os.remove(tmp_path)
+        raise
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = ' \t\n\r'
+
+def iter_json_array(chunks,encoding='utf-8'):
+    """
+    Decodes a JSON array one element at a time, from an iterable of byte (or string) chunks,
+    so that neither the whole payload, nor every decoded element, has to be held in memory at once.
+
+    Parameters
+    ----------
+
+    chunks (iterable, manditory):
+        The JSON document, split into chunks of any size (ex. ```response.iter_content(65536)```).
+        The document must be a JSON array at the top level.
+
+    encoding (str, optional) = "utf-8":
+        The encoding of byte chunks.
+
+    Returns
+    ----------
+
+    A generator of every element of the array, in order.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer = ''
+    position = 0
+    exhausted = False
+    started = False
+    ## What the array can have next: the first element or `]` (right after `[`), an element (after a `,`), or a `,` or `]` (after an element).
+    expecting = 'first'
+
+    def read_more():
+        nonlocal buffer, position, exhausted
+        ## The part of the buffer that has already been decoded is dropped, so the buffer only ever holds about one element.
+        buffer = buffer[position:]
+        position = 0
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            buffer += decoder.decode(b'',final=True)
+            exhausted = True
+            return
+        buffer += chunk if isinstance(chunk,str) else decoder.decode(chunk)
+
+    while True:
+        while position < len(buffer) and buffer[position] in _JSON_WHITESPACE:
+            position += 1
+
+        if position >= len(buffer):
+            if exhausted:
+                if expecting == 'end':
+                    return
+                raise ValueError('The JSON array ended before it was closed.' if started else 'The JSON document is empty.')
+            read_more()
+            continue
+
+        char = buffer[position]
+
+        if expecting == 'end':
+            raise ValueError(f'Unexpected data after the end of the JSON array, at character {position} of the buffer.')
+
+        if not started:
+            if char != '[':
+                raise ValueError('The JSON document is not an array.')
+            started = True
+            position += 1
+            continue
+
+        if char == ']':
+            if expecting == 'element':
+                raise ValueError('The JSON array has a `,` before its closing `]`.')
+            ## Anything other than whitespace after the array is an error, like it is for `json.loads()`.
+            expecting = 'end'
+            position += 1
+            continue
+        elif char == ',':
+            if expecting != 'delimiter':
+                raise ValueError(f'The JSON array has a `,` where an element was expected, at character {position} of the buffer.')
+            expecting = 'element'
+            position += 1
+            continue
+        elif expecting == 'delimiter':
+            raise ValueError(f'The JSON array is missing a `,` between two elements, at character {position} of the buffer.')
+
+        try:
+            element, end = _JSON_DECODER.raw_decode(buffer,position)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise
+            read_more()
+            continue
+
+        ## A number (ex. `15` of `1500.5`) may continue in the next chunk, so an element is only used once it is followed by a delimiter.
+        if end >= len(buffer) or buffer[end] not in _JSON_WHITESPACE + ',]':
+            if exhausted:
+                raise ValueError(f'Unexpected data after an element of the JSON array, at character {end} of the buffer.' if end < len(buffer) else 'The JSON array ended before it was closed.')
+            read_more()
+            continue
+
+        position = end
+        expecting = 'delimiter'
+        yield element
+
+## The JSON decoders `json_loads()` can use.
+## `"auto"` uses `orjson` if it is installed, and the `json` module from the standard library otherwise.
+JSON_BACKENDS = ('auto','orjson','json')
+
+## The environment variable that sets the JSON backend when `xfl_fast_r` is imported (ex. ```XFL_FAST_R_JSON_BACKEND=json```).
+JSON_BACKEND_ENV_VAR = 'XFL_FAST_R_JSON_BACKEND'
+
+_json_backend = None
+_json_loads = json.loads
+
+def set_json_backend(backend='auto'):
+    """
+    Sets the JSON decoder used for every payload from the XFL API.
+
+    Parameters
+    ----------
+
+    backend (str, optional) = "auto":
+        One of `JSON_BACKENDS`.
+        If ```backend = "orjson"```, `orjson` must be installed (ex. ```pip install orjson```).
+        If ```backend = "auto"```, `orjson` is used if it is installed, and the `json` module from the standard library is used otherwise.
+
+    Returns
+    ----------
+
+    The name of the JSON backend that is now in use (ex. ```"orjson"```).
+    """
+    global _json_backend, _json_loads
+
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f'`backend` must be one of {JSON_BACKENDS}, not "{backend}".')
+
+    if backend == 'auto':
+        backend = 'json' if orjson == None else 'orjson'
+    elif backend == 'orjson' and orjson == None:
+        raise ImportError('`orjson` is not installed. Install it with `pip install orjson`, or use `backend = "json"`.')
+
+    _json_loads = json.loads if backend == 'json' else orjson.loads
+    _json_backend = backend
+    return backend
+
+def get_json_backend():
+    """
+    Returns the name of the JSON backend that `json_loads()` is using (```"orjson"``` or ```"json"```).
+    """
+    return _json_backend
+
+def json_loads(data):
+    """
+    Decodes a JSON document (as `bytes` or a `str`) with the JSON backend set by `set_json_backend()`.
+    Both backends raise a `json.JSONDecodeError` if ```data``` is not valid JSON.
+    """
+    return _json_loads(data)
+
+def _set_json_backend_from_env():
+    """
+    Sets the JSON backend from the `XFL_FAST_R_JSON_BACKEND` environment variable.
+    An invalid or unavailable backend falls back to ```"auto"``` with a warning, instead of raising an exception when `xfl_fast_r` is imported.
+    """
+    backend = os.environ.get(JSON_BACKEND_ENV_VAR,'auto').strip().lower()
+
+    try:
+        return set_json_backend(backend)
+    except (ValueError,ImportError) as e:
+        warnings.warn(f'Ignoring `{JSON_BACKEND_ENV_VAR}={backend}`: {e} Using "auto" instead.')
+        return set_json_backend('auto')
+
+_set_json_backend_from_env()